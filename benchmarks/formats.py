@@ -0,0 +1,55 @@
+"""
+Сравнение форматов хранилища вакансий: размер файла, время загрузки и время запросов.
+
+Запуск из корня проекта:
+    python -m benchmarks.formats [кол-во вакансий] [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks.generator import write_store
+from benchmarks.suite import measure
+from config.classes import Saver, convert_store, get_saver
+from config.formats import msgpack
+
+
+def run(count: int = 20000, repeat: int = 3) -> None:
+    extensions = ['.json', '.jsonl', '.sqlite', '.json.gz', '.vcol']
+    if msgpack is not None:
+        extensions.append('.msgpack')
+
+    # ID вакансий синтетического хранилища идут подряд от 10000000
+    lookup_id = 10000000 + count // 2
+    # поисковый индекс не относится к формату файла и только замедлил бы запись во все форматы
+    Saver.search_index = False
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_file = os.path.join(tmp_dir, 'source.json')
+        write_store(source_file, count)
+
+        print(f'Вакансий: {count}')
+        print(f'{"формат":<10}{"размер, КБ":>12}{"загрузка, мс":>15}{"топ 10, мс":>13}{"по ID, мс":>12}')
+        for extension in extensions:
+            store_file = os.path.join(tmp_dir, 'vacancies' + extension)
+            convert_store(source_file, store_file)
+            saver = get_saver(store_file)
+
+            size = os.path.getsize(store_file) / 1024
+            load_time = measure(lambda _: saver.load_vacancies(store_file), range(repeat))
+            top_time = measure(lambda top_n: saver.top_vacancies(store_file, top_n, 'normalized'), [10] * repeat)
+            find_time = measure(lambda vacancy_id: saver.find_vacancy(store_file, vacancy_id), [lookup_id] * repeat)
+            print(f'{extension:<10}{size:>12.0f}{load_time * 1000:>15.1f}{top_time * 1000:>13.1f}'
+                  f'{find_time * 1000:>12.1f}')
+
+
+def main(args: list | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.formats', description=__doc__.split('\n\n')[0])
+    parser.add_argument('count', type=int, nargs='?', default=20000, help='кол-во вакансий в хранилище')
+    parser.add_argument('--repeat', type=int, default=3, help='кол-во повторов каждого измерения')
+    args = parser.parse_args(args)
+    run(args.count, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
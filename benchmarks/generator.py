@@ -0,0 +1,128 @@
+"""
+Генератор синтетических вакансий: ответы API hh.ru и superjob.ru и готовые хранилища.
+
+Создание хранилища из командной строки (формат - по расширению файла):
+    python -m benchmarks.generator config/bench.jsonl 100000
+"""
+import random
+import sys
+from typing import Iterator
+
+from config.classes import get_saver
+
+PROFESSIONS = ('Python разработчик', 'Java developer', 'Frontend разработчик', 'Аналитик данных',
+               'DevOps инженер', 'QA инженер', 'Системный администратор', 'Backend developer',
+               'Data Scientist', 'Go разработчик', 'Менеджер проектов', 'Инженер-программист 1С')
+LEVELS = ('', 'Junior ', 'Middle ', 'Senior ', 'Ведущий ', 'Lead ')
+SKILLS = ('Python', 'Django', 'FastAPI', 'SQL', 'PostgreSQL', 'Docker', 'Kubernetes', 'Linux', 'Git', 'Java',
+          'Spring', 'JavaScript', 'React', 'pandas', 'Kafka', 'Redis', 'CI/CD', 'REST API', 'C++', 'Go')
+PHRASES = ('Опыт работы от {years} лет', 'Знание {skill}', 'Уверенное владение {skill} и {skill2}',
+           'Опыт коммерческой разработки на {skill}', 'Понимание принципов ООП', 'Готовность к работе в команде',
+           'Английский язык на уровне чтения документации', 'Опыт работы с {skill} будет плюсом')
+# валюты с весами: большая часть вакансий - в рублях
+HH_CURRENCIES = ('RUR',) * 8 + ('USD', 'EUR', 'KZT', 'BYR')
+SJ_CURRENCIES = ('rub',) * 8 + ('usd', 'eur', 'uah')
+
+
+def make_requirement(rnd: random.Random) -> str:
+    """Текст требований из 2-5 фраз."""
+    phrases = []
+    for phrase in rnd.sample(PHRASES, rnd.randint(2, 5)):
+        skill, skill2 = rnd.sample(SKILLS, 2)
+        phrases.append(phrase.format(years=rnd.randint(1, 6), skill=skill, skill2=skill2))
+    return '. '.join(phrases) + '.'
+
+
+def make_salary_range(rnd: random.Random) -> tuple[int | None, int | None] | None:
+    """Вилка зарплаты: примерно треть вакансий без зарплаты, у части нет границы ОТ или ДО."""
+    if rnd.random() < 0.3:
+        return None
+    salary_from = rnd.randrange(30, 400) * 1000
+    salary_to = salary_from + rnd.randrange(10, 150) * 1000
+    kind = rnd.random()
+    if kind < 0.25:
+        return salary_from, None
+    if kind < 0.4:
+        return None, salary_to
+    return salary_from, salary_to
+
+
+def make_hh_item(vacancy_id: int, rnd: random.Random | None = None) -> dict:
+    """Возвращает вакансию в формате ответа API hh.ru."""
+    rnd = rnd or random.Random(vacancy_id)
+    salary_range = make_salary_range(rnd)
+    salary = None
+    if salary_range:
+        salary = {"from": salary_range[0], "to": salary_range[1], "currency": rnd.choice(HH_CURRENCIES),
+                  "gross": rnd.random() < 0.5}
+    return {
+        "id": str(vacancy_id),
+        "premium": False,
+        "name": rnd.choice(LEVELS) + rnd.choice(PROFESSIONS),
+        "area": {"id": "1", "name": "Москва", "url": "https://api.hh.ru/areas/1"},
+        "salary": salary,
+        "type": {"id": "open", "name": "Открытая"},
+        "published_at": f"2023-{rnd.randint(1, 12):02}-{rnd.randint(1, 28):02}T10:00:00+0300",
+        "url": f"https://api.hh.ru/vacancies/{vacancy_id}",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "employer": {"id": str(rnd.randint(1000, 999999)), "name": f"Компания {rnd.randint(1, 5000)}"},
+        "snippet": {"requirement": make_requirement(rnd) if rnd.random() < 0.9 else None,
+                    "responsibility": make_requirement(rnd)},
+        "schedule": {"id": "fullDay", "name": "Полный день"},
+    }
+
+
+def make_sj_item(vacancy_id: int, rnd: random.Random | None = None) -> dict:
+    """Возвращает вакансию в формате ответа API superjob.ru (0 - зарплата не указана)."""
+    rnd = rnd or random.Random(vacancy_id)
+    salary_range = make_salary_range(rnd) or (None, None)
+    return {
+        "id": vacancy_id,
+        "profession": rnd.choice(LEVELS) + rnd.choice(PROFESSIONS),
+        "payment_from": salary_range[0] or 0,
+        "payment_to": salary_range[1] or 0,
+        "currency": rnd.choice(SJ_CURRENCIES),
+        "link": f"https://www.superjob.ru/vakansii/vacancy-{vacancy_id}.html",
+        "candidat": make_requirement(rnd),
+        "town": {"id": 4, "title": "Москва"},
+        "firm_name": f"Компания {rnd.randint(1, 5000)}",
+        "date_published": 1690000000 + rnd.randrange(0, 10_000_000),
+    }
+
+
+def iter_store_vacancies(count: int, seed: int = 0, first_id: int = 10000000) -> Iterator[dict]:
+    """Вакансии в формате хранилища: HH и SuperJob примерно поровну, приведенные теми же методами, что при сборе."""
+    # импорт здесь: классы API не нужны для генерации ответов stub-серверов
+    from config.classes import HeadHunterAPI, SuperJobAPI
+
+    rnd = random.Random(seed)
+    for vacancy_id in range(first_id, first_id + count):
+        if rnd.random() < 0.5:
+            yield HeadHunterAPI.format_vacancies([make_hh_item(vacancy_id, rnd)])[0]
+        else:
+            yield SuperJobAPI.format_vacancies([make_sj_item(vacancy_id, rnd)])[0]
+
+
+def write_store(json_file, count: int, seed: int = 0, chunk_size: int = 10000) -> None:
+    """
+    Создает хранилище из count вакансий (10 тыс. - 1 млн). Хранилища, которые дописываются без перечитывания
+    (JSONL, SQLite), заполняются частями, остальные записываются целиком.
+    """
+    saver = get_saver(json_file)
+    vacancies = iter_store_vacancies(count, seed)
+    if not saver.incremental_writes:
+        saver.save_vacancies(json_file, list(vacancies))
+        return
+
+    saver.save_vacancies(json_file, [])
+    chunk = []
+    for vacancy in vacancies:
+        chunk.append(vacancy)
+        if len(chunk) == chunk_size:
+            saver.add_vacancies(json_file, chunk)
+            chunk = []
+    saver.add_vacancies(json_file, chunk)
+
+
+if __name__ == '__main__':
+    write_store(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
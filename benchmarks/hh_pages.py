@@ -0,0 +1,39 @@
+"""
+Сравнение последовательной и параллельной загрузки страниц HeadHunterAPI.
+
+Запуск из корня проекта:
+    python -m benchmarks.hh_pages
+"""
+import os
+import tempfile
+import time
+
+from benchmarks.stub_server import start_hh_stub
+from config.classes import HeadHunterAPI
+
+
+def run(found: int = 2000, latency: float = 0.05, max_workers: int = 5) -> None:
+    server = start_hh_stub(found, latency)
+    host, port = server.server_address
+    HeadHunterAPI.api_url = f'http://{host}:{port}/vacancies'
+    HeadHunterAPI.cache = None  # измеряем загрузку страниц, а не чтение из кэша
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for concurrent in (False, True):
+            working_file = os.path.join(tmp_dir, f'vacancies_{concurrent}.json')
+            with open(working_file, 'w', encoding='utf-8') as f:
+                f.write('[]')
+            HeadHunterAPI.working_file = working_file
+
+            start = time.perf_counter()
+            HeadHunterAPI().get_vacancies('python', concurrent=concurrent, max_workers=max_workers)
+            elapsed = time.perf_counter() - start
+
+            mode = f'параллельно (до {max_workers} запросов одновременно)' if concurrent else 'последовательно'
+            print(f'{mode}: {elapsed:.2f} с')
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,105 @@
+"""Локальные stub-серверы, имитирующие пагинацию API hh.ru и superjob.ru с задержкой ответа."""
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.generator import make_hh_item, make_sj_item
+
+
+class StubHandler(BaseHTTPRequestHandler, ABC):
+    """Общая часть stub-серверов: found вакансий с ID от first_id, ответ через latency секунд."""
+    found = 2000
+    latency = 0.05
+    first_id = 10000000
+
+    def do_GET(self):
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        body = json.dumps(self.make_page(params), ensure_ascii=False).encode()
+
+        time.sleep(self.latency)  # имитация сетевой задержки
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @abstractmethod
+    def make_page(self, params: dict) -> dict:
+        """Тело ответа (страница результата) для параметров запроса params."""
+        pass
+
+    def log_message(self, *args):
+        pass
+
+
+class HHStubHandler(StubHandler):
+    """
+    Обработчик запросов /vacancies?page=N&per_page=M[&date_from=...&date_to=...].
+    Как и API hh.ru, отдает не больше 2000 вакансий запроса. Вакансии опубликованы равномерно
+    за period секунд до запуска сервера; date_from и date_to отбирают опубликованные в этом окне.
+    """
+    limit = 2000
+    period = 30 * 24 * 3600
+    published_end = 0.0
+
+    def make_page(self, params: dict) -> dict:
+        page = int(params.get('page', 0))
+        per_page = int(params.get('per_page', 100))
+
+        # вакансия i опубликована в момент published_start + (i + 0.5) * step
+        step = self.period / self.found
+        published_start = self.published_end - self.period
+        first, last = 0, self.found - 1
+        if 'date_from' in params:
+            date_from = datetime.fromisoformat(params['date_from']).timestamp()
+            first = max(first, math.ceil((date_from - published_start) / step - 0.5))
+        if 'date_to' in params:
+            date_to = datetime.fromisoformat(params['date_to']).timestamp()
+            last = min(last, math.floor((date_to - published_start) / step - 0.5))
+        found = max(0, last - first + 1)
+        available = min(found, self.limit)
+        pages = -(-available // per_page)
+
+        items = []
+        for i in range(first + page * per_page, first + min((page + 1) * per_page, available)):
+            item = make_hh_item(self.first_id + i)
+            published_at = datetime.fromtimestamp(published_start + (i + 0.5) * step, timezone.utc)
+            item["published_at"] = published_at.strftime('%Y-%m-%dT%H:%M:%S%z')
+            items.append(item)
+        return {"items": items, "found": found, "pages": pages, "page": page, "per_page": per_page}
+
+
+class SJStubHandler(StubHandler):
+    """Обработчик запросов /vacancies/?page=N&count=M. Как и API superjob.ru, отдает не больше 500 вакансий."""
+    limit = 500
+
+    def make_page(self, params: dict) -> dict:
+        page = int(params.get('page', 0))
+        count = int(params.get('count', 20))
+        available = min(self.found, self.limit)
+
+        start = page * count
+        end = min(start + count, available)
+        objects = [make_sj_item(self.first_id + i) for i in range(start, end)]
+        return {"objects": objects, "total": self.found, "more": end < available}
+
+
+def start_stub(handler: type[StubHandler], found: int, latency: float) -> ThreadingHTTPServer:
+    """Запускает stub-сервер в фоновом потоке и возвращает его (адрес в server_address)."""
+    handler = type(handler.__name__, (handler,), {'found': found, 'latency': latency, 'published_end': time.time()})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_hh_stub(found: int = 2000, latency: float = 0.05) -> ThreadingHTTPServer:
+    return start_stub(HHStubHandler, found, latency)
+
+
+def start_sj_stub(found: int = 500, latency: float = 0.05) -> ThreadingHTTPServer:
+    return start_stub(SJStubHandler, found, latency)
@@ -0,0 +1,140 @@
+"""
+Набор бенчмарков: сбор вакансий с локальных stub-серверов hh.ru и superjob.ru и операции хранилищ
+(добавление, поиск по ID, топ N, удаление) на синтетических хранилищах разного размера.
+
+Результаты записываются в файл; если файл уже есть, результаты сравниваются с ним и замедления
+больше порога выводятся как регрессии (код завершения 1).
+
+Запуск из корня проекта:
+    python -m benchmarks.suite --sizes 10000 100000 --formats .json .jsonl .sqlite
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generator import iter_store_vacancies, write_store
+from benchmarks.stub_server import start_hh_stub, start_sj_stub
+from config.classes import HeadHunterAPI, Saver, SuperJobAPI, get_saver
+from config.storage import atomic_write
+
+
+def measure(function, arguments: list) -> float:
+    """Лучшее время выполнения функции для каждого значения из arguments, в секундах."""
+    best = float('inf')
+    for argument in arguments:
+        start = time.perf_counter()
+        function(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_collection(tmp_dir, api_class, server, extension: str) -> float:
+    """Время сбора вакансий get_vacancies от первого запроса до записи в хранилище."""
+    host, port = server.server_address
+    api_class.api_url = f'http://{host}:{port}/vacancies/'
+    api_class.cache = None  # измеряем загрузку страниц, а не чтение из кэша
+    api_class.working_file = os.path.join(tmp_dir, f'collect_{api_class.platform}{extension}')
+
+    start = time.perf_counter()
+    api_class().get_vacancies('python')
+    return time.perf_counter() - start
+
+
+def bench_store(tmp_dir, extension: str, size: int, repeat: int) -> dict:
+    """Время операций хранилища формата extension из size вакансий."""
+    store_file = os.path.join(tmp_dir, f'store_{size}{extension}')
+    write_store(store_file, size)
+    saver = get_saver(store_file)
+
+    # ID вакансий хранилища идут подряд от 10000000, новые вакансии получают ID после них
+    first_id = 10000000
+    new_vacancies = iter_store_vacancies(100 * repeat, seed=1, first_id=first_id + size)
+    batches = [[next(new_vacancies) for _ in range(100)] for _ in range(repeat)]
+    lookup_ids = [first_id + size * (i + 1) // (repeat + 1) for i in range(repeat)]
+    # удаляются разные вакансии: повторное удаление уже удаленной ничего не стоит
+    delete_ids = [first_id + size * (i + 1) // (repeat + 2) + 1 for i in range(repeat)]
+
+    return {
+        'add_vacancies': measure(lambda batch: saver.add_vacancies(store_file, batch), batches),
+        'find_vacancy': measure(lambda vacancy_id: saver.find_vacancy(store_file, vacancy_id), lookup_ids),
+        'top_vacancies': measure(lambda top_n: saver.top_vacancies(store_file, top_n), [10] * repeat),
+        'remove_vacancy': measure(lambda vacancy_id: saver.remove_vacancy(store_file, vacancy_id), delete_ids),
+    }
+
+
+def run(sizes: list, extensions: list, latency: float = 0.05, repeat: int = 5) -> dict:
+    """Выполняет бенчмарки и возвращает время каждого из них в секундах."""
+    # поисковый индекс обновляется при любой записи и заслонил бы разницу между форматами
+    Saver.search_index = False
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for api_class, start_stub in ((HeadHunterAPI, start_hh_stub), (SuperJobAPI, start_sj_stub)):
+            server = start_stub(latency=latency)
+            try:
+                results[f'collect.{api_class.platform}'] = bench_collection(tmp_dir, api_class, server, '.jsonl')
+            finally:
+                server.shutdown()
+            print(f'collect.{api_class.platform}: {results[f"collect.{api_class.platform}"]:.3f} с')
+
+        for size in sizes:
+            for extension in extensions:
+                for operation, seconds in bench_store(tmp_dir, extension, size, repeat).items():
+                    name = f'store{extension}.{size}.{operation}'
+                    results[name] = seconds
+                    print(f'{name}: {seconds * 1000:.2f} мс')
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_seconds: float = 0.001) -> list:
+    """
+    Сравнивает результаты с предыдущим запуском.
+
+    :param threshold: допустимое относительное замедление (0.2 - на 20%)
+    :param min_seconds: разница меньше этой считается шумом измерения
+    :return: регрессии [(бенчмарк, было, стало)]
+    """
+    regressions = []
+    print(f'{"бенчмарк":<40}{"было, мс":>12}{"стало, мс":>12}{"изменение":>12}')
+    for name, seconds in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = (seconds - previous) / previous if previous else 0.0
+        regression = change > threshold and seconds - previous > min_seconds
+        if regression:
+            regressions.append((name, previous, seconds))
+        print(f'{name:<40}{previous * 1000:>12.2f}{seconds * 1000:>12.2f}{change:>+12.0%}'
+              f'{"  РЕГРЕССИЯ" if regression else ""}')
+    return regressions
+
+
+def main(args: list | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000],
+                        help='размеры хранилищ (10 тыс. - 1 млн вакансий)')
+    parser.add_argument('--formats', nargs='+', default=['.json', '.jsonl', '.sqlite'], dest='extensions',
+                        help='форматы хранилищ (расширения файлов)')
+    parser.add_argument('--latency', type=float, default=0.05, help='задержка ответа stub-серверов, с')
+    parser.add_argument('--repeat', type=int, default=5, help='кол-во повторов каждой операции хранилища')
+    parser.add_argument('--results', default=os.path.join('benchmarks', 'results.json'),
+                        help='файл результатов: с ним сравнивается запуск, затем он перезаписывается')
+    parser.add_argument('--threshold', type=float, default=0.2, help='порог регрессии (0.2 - замедление на 20%%)')
+    args = parser.parse_args(args)
+
+    results = run(args.sizes, args.extensions, args.latency, args.repeat)
+
+    regressions = []
+    if os.path.exists(args.results):
+        with open(args.results, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        print(f'Регрессий: {len(regressions)}')
+    with atomic_write(args.results) as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import numpy as np
+
+from config.columns import VacancyColumns
+from config.ranking import SALARY_KEYS
+
+PERCENTILES = (25, 50, 75, 90)
+
+
+def salary_stats(values: np.ndarray) -> dict:
+    """
+    Считает статистику по массиву зарплат (NaN - зарплата не указана).
+
+    :return: {"count", "mean", "min", "max", "p25", "p50", "p75", "p90"}; для пустой выборки - только count
+    """
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return {"count": 0}
+
+    stats = {"count": int(len(values)),
+             "mean": float(values.mean()),
+             "min": float(values.min()),
+             "max": float(values.max()), }
+    for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        stats[f"p{percentile}"] = float(value)
+    return stats
+
+
+def stats_by_currency(columns: VacancyColumns, key: str = 'middle') -> dict[str, dict]:
+    """Статистика зарплат в исходной валюте отдельно по каждой валюте."""
+    values = columns.salary_values(key)
+    return {currency: salary_stats(values[columns.currency_codes == code])
+            for code, currency in enumerate(columns.currencies)}
+
+
+def stats_by_keyword(columns: VacancyColumns, keywords: list[str], key: str = 'normalized') -> dict[str, dict]:
+    """Статистика зарплат по вакансиям, в наименовании которых есть ключевое слово (без учета регистра)."""
+    values = columns.salary_values(key)
+    professions = np.char.lower(np.array(columns.professions, dtype=str))
+    return {keyword: salary_stats(values[np.char.find(professions, keyword.lower()) >= 0])
+            for keyword in keywords}
+
+
+def salary_histogram(columns: VacancyColumns, key: str = 'normalized',
+                     bins: int = 10) -> list[tuple[float, float, int]]:
+    """Гистограмма зарплат: список интервалов (от, до, кол-во вакансий)."""
+    values = columns.salary_values(key)
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return []
+    counts, edges = np.histogram(values, bins=bins)
+    return [(float(edges[i]), float(edges[i + 1]), int(counts[i])) for i in range(len(counts))]
+
+
+def format_stats(title: str, stats: dict) -> str:
+    """Форматирует статистику для печати в одну строку."""
+    if not stats["count"]:
+        return f'{title}: нет вакансий с зарплатой'
+    percentiles = ', '.join(f'p{percentile}: {stats[f"p{percentile}"]:,.0f}' for percentile in PERCENTILES)
+    return (f'{title}: вакансий {stats["count"]}, средняя {stats["mean"]:,.0f}, '
+            f'мин {stats["min"]:,.0f}, макс {stats["max"]:,.0f}, {percentiles}')
+
+
+def salary_report(json_file, key: str = 'normalized', keywords: list[str] | None = None, bins: int = 10) -> str:
+    """
+    Отчет по зарплатам собранных вакансий: общая статистика, гистограмма,
+    статистика по валютам и по ключевым словам в наименовании вакансии.
+
+    :param json_file: файл хранилища вакансий
+    :param key: ключ зарплаты для общей статистики, гистограммы и ключевых слов (см. ranking.SALARY_KEYS)
+    """
+    columns = VacancyColumns.from_store(json_file)
+    # без пересчета по курсу зарплаты в разных валютах попадают в одну выборку
+    title = SALARY_KEYS[key] if key == 'normalized' else f'{SALARY_KEYS[key]} (в валюте вакансии)'
+    lines = ['---------- Статистика зарплат ----------',
+             f'Всего вакансий: {len(columns)}, с зарплатой: {int(columns.has_salary().sum())}',
+             format_stats(title, salary_stats(columns.salary_values(key)))]
+
+    histogram = salary_histogram(columns, key, bins)
+    if histogram:
+        lines.append('Гистограмма:')
+        largest = max(count for low, high, count in histogram) or 1
+        for low, high, count in histogram:
+            lines.append(f'\t{low:>12,.0f} - {high:>12,.0f}: {count:>7} {"#" * round(40 * count / largest)}')
+
+    lines.append('По валютам (середина вилки в валюте вакансии):')
+    for currency_name, stats in stats_by_currency(columns).items():
+        lines.append('\t' + format_stats(currency_name, stats))
+
+    if keywords:
+        lines.append(f'По ключевым словам ({SALARY_KEYS[key]}):')
+        for keyword, stats in stats_by_keyword(columns, keywords, key).items():
+            lines.append('\t' + format_stats(keyword, stats))
+    return '\n'.join(lines)
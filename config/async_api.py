@@ -0,0 +1,186 @@
+import asyncio
+import atexit
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import AsyncIterator, Iterator
+
+import aiohttp
+
+from config.metrics import call_measured, metrics
+
+
+class AsyncClient:
+    """
+    Асинхронный HTTP-клиент для API сайтов с вакансиями.
+
+    Все запросы идут через один пул соединений (aiohttp.ClientSession), кол-во одновременных
+    запросов ограничено max_concurrency. Ответы 429 и 5xx повторяются до max_retries раз
+    с экспоненциальной задержкой (или задержкой из заголовка Retry-After).
+    """
+    retry_statuses = {429, 500, 502, 503, 504}
+
+    def __init__(self, max_connections: int = 10, max_concurrency: int = 5, max_retries: int = 3,
+                 backoff: float = 0.5):
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        self.__session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def get_text(self, url: str, params: dict, headers: dict | None = None) -> str:
+        """Выполняет GET запрос и возвращает тело ответа, повторяя запрос при 429/5xx и сетевых ошибках."""
+        if self.__session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.__session = aiohttp.ClientSession(connector=connector)
+
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff * 2 ** attempt
+            try:
+                async with self.__semaphore, self.__session.get(url, params=params, headers=headers) as response:
+                    if response.status not in self.retry_statuses or attempt == self.max_retries:
+                        response.raise_for_status()
+                        return await response.text()
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = int(retry_after)
+            except aiohttp.ClientConnectionError:
+                if attempt == self.max_retries:
+                    raise
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+
+class AsyncRateLimiter:
+    """Ограничивает частоту запросов к платформе: не более rate запросов в секунду."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.__next_time = 0.0
+        self.__lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Дожидается момента, когда можно выполнить следующий запрос."""
+        async with self.__lock:
+            now = asyncio.get_running_loop().time()
+            delay = self.__next_time - now
+            self.__next_time = max(now, self.__next_time) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncAPIVacancy(ABC):
+    """
+    Абстрактный класс для асинхронной работы с API сайтов с вакансиями.
+
+    Если задан parse_executor (например, пул процессов), fetch_vacancies разбирает ответы в нем,
+    а цикл событий в это время продолжает загрузку следующих страниц.
+    """
+    __slots__ = ('client', 'rate_limiter', 'parse_executor')
+
+    platform = ''
+    title = ''
+
+    def __init__(self, client: AsyncClient, rate_limiter: AsyncRateLimiter | None = None,
+                 parse_executor: Executor | None = None):
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.parse_executor = parse_executor
+
+    async def get_text(self, url: str, params: dict, headers: dict | None = None) -> str:
+        """Выполняет запрос через общий клиент, соблюдая ограничение частоты запросов платформы."""
+        if self.rate_limiter:
+            with metrics.timer('http.rate_limit_wait'):
+                await self.rate_limiter.wait()
+        with metrics.timer(f'http.{self.platform}'):
+            text = await self.client.get_text(url, params, headers)
+        metrics.count('http.requests')
+        metrics.count('http.bytes', len(text))
+        return text
+
+    @abstractmethod
+    def iter_pages(self, query: str) -> AsyncIterator[list]:
+        """Загружает страницы результата запроса и возвращает вакансии каждой страницы в формате хранилища."""
+        pass
+
+    @abstractmethod
+    def iter_raw_pages(self, query: str) -> AsyncIterator[str]:
+        """Загружает страницы результата запроса и возвращает тексты ответов без разбора."""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def parse_page(text: str) -> list:
+        """Разбирает текст ответа и возвращает вакансии страницы в формате хранилища."""
+        pass
+
+    async def fetch_vacancies(self, query: str) -> list:
+        """Возвращает все найденные по запросу вакансии, не сохраняя их."""
+        if self.parse_executor is None:
+            return [vacancy async for page in self.iter_pages(query) for vacancy in page]
+
+        loop = asyncio.get_running_loop()
+        parsed = [loop.run_in_executor(self.parse_executor, call_measured, os.getpid(), metrics.enabled,
+                                       self.parse_page, text)
+                  async for text in self.iter_raw_pages(query)]
+        pages = []
+        for page, measured in await asyncio.gather(*parsed):
+            # таймеры разбора, измеренные в процессе пула
+            metrics.merge(measured)
+            pages.append(page)
+        return [vacancy for page in pages for vacancy in page]
+
+
+# фоновый цикл событий и общий клиент, через которые работают синхронные классы API
+_loop = None
+_client = None
+_loop_lock = threading.Lock()
+
+
+def get_client() -> AsyncClient:
+    """Возвращает общий для синхронных классов API клиент, работающий в фоновом цикле событий."""
+    global _loop, _client
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='async-api', daemon=True).start()
+            _client = AsyncClient()
+            atexit.register(_close_client)
+    return _client
+
+
+def _close_client() -> None:
+    """Закрывает пул соединений общего клиента и останавливает фоновый цикл событий при выходе."""
+    asyncio.run_coroutine_threadsafe(_client.close(), _loop).result(timeout=5)
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+def run_sync(coroutine):
+    """Выполняет корутину в фоновом цикле событий и возвращает ее результат (для синхронного кода)."""
+    get_client()
+    return asyncio.run_coroutine_threadsafe(coroutine, _loop).result()
+
+
+def iter_sync(async_iterator: AsyncIterator) -> Iterator:
+    """Позволяет обходить асинхронный итератор из синхронного кода, получая элементы по одному."""
+    try:
+        while True:
+            try:
+                yield run_sync(async_iterator.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        # при досрочной остановке обхода закрываем асинхронный генератор (и отменяем его запросы)
+        if hasattr(async_iterator, 'aclose'):
+            run_sync(async_iterator.aclose())
@@ -0,0 +1,133 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config.async_api import AsyncAPIVacancy, AsyncClient, AsyncRateLimiter
+from config.classes import JSONSaver, get_saver
+from config.compaction import BackgroundCompactor
+from config.retention import RetentionPolicy
+
+# ограничения частоты запросов к платформам по умолчанию (запросов в секунду)
+DEFAULT_RATE_LIMITS = {'hh': 5.0, 'sj': 2.0}
+
+
+def read_queries(queries_file) -> list[str]:
+    """Читает поисковые запросы из файла: один запрос на строку, пустые строки и строки с # пропускаются."""
+    with open(queries_file, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def get_async_platforms() -> dict[str, type[AsyncAPIVacancy]]:
+    """Возвращает асинхронные реализации API по краткому имени платформы."""
+    return {platform.platform: platform for platform in AsyncAPIVacancy.__subclasses__()}
+
+
+async def run_batch_async(queries: list[str], working_file, platforms: list[str] | None = None, workers: int = 4,
+                          rate_limits: dict[str, float] | None = None, batch_size: int = 1000,
+                          parse_workers: int = 0) -> list[dict]:
+    """
+    Выполняет поисковые запросы пулом из workers обработчиков и сохраняет найденные вакансии пакетами.
+
+    Все запросы используют один HTTP клиент (общий пул соединений), частота запросов к каждой
+    платформе ограничена rate_limits. Вакансии накапливаются и записываются в хранилище
+    одним вызовом add_vacancies, как только их набирается batch_size. С parse_workers > 0 ответы
+    разбираются в пуле процессов, пока цикл событий загружает следующие страницы.
+
+    :return: итоги по каждому запросу в порядке запросов:
+        {"query", "found" (кол-во по платформам), "errors", "time"}
+    """
+    async_platforms = get_async_platforms()
+    platforms = platforms or list(async_platforms)
+    rate_limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+    saver = get_saver(working_file)
+    saver.check_file(working_file)
+
+    queue = asyncio.Queue()
+    for number, query in enumerate(queries):
+        queue.put_nowait((number, query))
+
+    results = [None] * len(queries)
+    pending = []
+    write_lock = asyncio.Lock()
+
+    async def flush() -> None:
+        # забираем накопленные вакансии до записи: другие обработчики продолжают их пополнять
+        batch = pending[:]
+        pending.clear()
+        if batch:
+            async with write_lock:
+                await asyncio.to_thread(saver.add_vacancies, working_file, batch)
+
+    connections = workers * len(platforms)
+    parse_executor = ProcessPoolExecutor(parse_workers) if parse_workers else None
+    async with AsyncClient(max_connections=connections, max_concurrency=connections) as client:
+        apis = [async_platforms[platform](client, AsyncRateLimiter(rate_limits[platform]), parse_executor)
+                for platform in platforms]
+
+        async def worker() -> None:
+            while not queue.empty():
+                number, query = queue.get_nowait()
+                start = time.perf_counter()
+                result = {"query": query, "found": {}, "errors": {}, "time": 0.0}
+
+                outcomes = await asyncio.gather(*(api.fetch_vacancies(query) for api in apis), return_exceptions=True)
+                for api, outcome in zip(apis, outcomes):
+                    if isinstance(outcome, Exception):
+                        result["errors"][api.platform] = repr(outcome)
+                    else:
+                        result["found"][api.platform] = len(outcome)
+                        pending.extend(outcome)
+
+                result["time"] = time.perf_counter() - start
+                results[number] = result
+                if len(pending) >= batch_size:
+                    await flush()
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            await flush()
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown(cancel_futures=True)
+
+    return results
+
+
+def run_batch(queries_file, working_file=None, platforms: list[str] | None = None, workers: int = 4,
+              rate_limits: dict[str, float] | None = None, batch_size: int = 1000,
+              parse_workers: int = 0, compact_interval: float = 0,
+              retention: RetentionPolicy | None = None) -> list[dict]:
+    """
+    Выполняет запросы из файла без интерактивного меню и печатает итоги по каждому запросу.
+    С compact_interval > 0 хранилище сжимается в фоне каждые compact_interval секунд (BackgroundCompactor).
+    """
+    working_file = working_file or JSONSaver.working_file
+    queries = read_queries(queries_file)
+
+    start = time.perf_counter()
+    compactor = BackgroundCompactor(working_file, retention, compact_interval) if compact_interval else None
+    if compactor:
+        compactor.start()
+    try:
+        results = asyncio.run(run_batch_async(queries, working_file, platforms, workers, rate_limits, batch_size,
+                                              parse_workers))
+    finally:
+        if compactor:
+            compactor.stop()
+    print(format_batch_summary(results, time.perf_counter() - start))
+    return results
+
+
+def format_batch_summary(results: list[dict], total_time: float) -> str:
+    """Возвращает итоги пакетного сбора: время и кол-во вакансий по каждому запросу."""
+    lines = ['---------- Итоги пакетного сбора ----------']
+    for result in results:
+        found = ', '.join(f'{platform}: {count}' for platform, count in result["found"].items())
+        line = f'{result["query"]}: {sum(result["found"].values())} ({found}) за {result["time"]:.2f} с'
+        for platform, error in result["errors"].items():
+            line += f'\n\tошибка {platform}: {error}'
+        lines.append(line)
+
+    total = sum(sum(result["found"].values()) for result in results)
+    lines.append(f'Всего запросов: {len(results)}, вакансий: {total}, время: {total_time:.2f} с')
+    return '\n'.join(lines)
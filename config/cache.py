@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class ResponseCache:
+    """
+    Дисковый кэш ответов API сайтов с вакансиями.
+
+    Ключ - (платформа, запрос, страница, кол-во на странице), каждый ответ хранится в отдельном файле.
+    Записи старше ttl секунд считаются устаревшими. При превышении max_size байт удаляются записи,
+    к которым дольше всего не обращались (LRU): время последнего обращения хранится в atime файла.
+    """
+    __slots__ = ('cache_dir', 'ttl', 'max_size')
+
+    def __init__(self, cache_dir: str, ttl: int = 3600, max_size: int = 100 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = max_size
+
+    def get(self, platform: str, query: str, page: int, per_page: int) -> str | None:
+        """Возвращает сохраненный ответ или None, если его нет или он устарел."""
+        path = self.__get_path(platform, query, page, per_page)
+        try:
+            modified = os.stat(path).st_mtime
+            now = time.time()
+            if now - modified > self.ttl:
+                os.remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                data = f.read()
+            # отмечаем обращение для LRU, время записи (mtime) оставляем для TTL
+            os.utime(path, (now, modified))
+            return data
+        except FileNotFoundError:
+            return None
+
+    def set(self, platform: str, query: str, page: int, per_page: int, data: str) -> None:
+        """Сохраняет ответ и удаляет старые записи, если кэш превысил max_size."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.__get_path(platform, query, page, per_page)
+        # пишем во временный файл и переименовываем, чтобы параллельные чтения не видели неполный ответ
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.__evict()
+
+    def clear(self) -> None:
+        for entry in self.__entries():
+            self.__remove(entry.path)
+
+    def __get_path(self, platform: str, query: str, page: int, per_page: int) -> str:
+        key = json.dumps([platform, query, page, per_page], ensure_ascii=False)
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+    def __entries(self) -> list:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith('.json')]
+
+    def __evict(self) -> None:
+        """Удаляет устаревшие записи, затем самые давно использованные, пока размер кэша больше max_size."""
+        now = time.time()
+        entries = []
+        total_size = 0
+        for entry in self.__entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.ttl:
+                self.__remove(entry.path)
+                continue
+            entries.append((stat.st_atime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for accessed, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            self.__remove(path)
+            total_size -= size
+
+    @staticmethod
+    def __remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # запись уже удалена параллельным процессом
+            pass
+
+
+# кэш по умолчанию для HeadHunterAPI и SuperJobAPI; настройки - через переменные окружения
+response_cache = ResponseCache(os.getenv('cache_dir', 'config/cache'),
+                               ttl=int(os.getenv('cache_ttl', 3600)),
+                               max_size=int(os.getenv('cache_max_size', 100 * 1024 * 1024)))
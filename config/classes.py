@@ -1,27 +1,296 @@
+import asyncio
 import json
 import os
+import sqlite3
+import textwrap
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Iterator
 
-import requests
+from config.async_api import AsyncAPIVacancy, get_client, iter_sync
+from config.cache import ResponseCache, response_cache
+from config.columns import VacancyColumns
+from config.currency import parse_salary, to_base
+from config.formats import get_format
+from config.index import VacancyIndex
+from config.mapped import MappedStore
+from config.metrics import metrics
+from config.pipeline import PagePipeline
+from config.ranking import columns_mask, sort_vacancies, top_vacancies
+from config.retention import RetentionPolicy, Tombstones
+from config.search import SearchIndex
+from config.storage import GroupCommitWriter, atomic_write, file_lock
 
 
 class APIVacancy(ABC):
     """Абстрактный класс для работы с API сайтов с вакансиями."""
     __slots__ = ()
 
+    # кэш ответов API; None отключает кэширование
+    cache: ResponseCache | None = response_cache
+    # зарегистрированные реализации (платформы), опрашиваемые при сборе со всех платформ
+    platforms: list[type['APIVacancy']] = []
+    # краткое имя платформы и название для вывода
+    platform = ''
+    title = ''
+
+    def __init_subclass__(cls, register: bool = True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if register:
+            APIVacancy.platforms.append(cls)
+
     @abstractmethod
     def get_vacancies(self, *args) -> None:
         pass
 
+    @abstractmethod
+    def iter_pages(self, query: str) -> Iterator[list]:
+        """Загружает страницы результата запроса и возвращает вакансии каждой страницы в формате хранилища."""
+        pass
+
+    def fetch_vacancies(self, query: str) -> list:
+        """Возвращает все найденные по запросу вакансии, не сохраняя их."""
+        return [vacancy for page in self.iter_pages(query) for vacancy in page]
+
 
 class Saver(ABC):
     """Абстрактный класс для сохранения вакансий в файл."""
+    # поддерживать поисковый индекс (SearchIndex) при записи вакансий
+    search_index = os.getenv('search_index', '1') != '0'
+    # хранилище записывает добавление и удаление по отдельности, не переписывая файл целиком,
+    # и хранит одну запись на ID (повторно добавленная вакансия заменяет прежнюю и становится последней)
+    incremental_writes = False
+    # хранилище удаляет вакансии отметками (Tombstones), убирая записи при следующей перезаписи файла
+    tombstones = False
+    # фильтрация, сортировка и топ N выполняются самим хранилищем без чтения всех вакансий,
+    # поэтому VacancyRepository передает эти запросы ему, а не загружает файл в память
+    query_pushdown = False
 
     @staticmethod
     @abstractmethod
     def add_vacancies(*args):
         pass
 
+    @staticmethod
+    @abstractmethod
+    def iter_vacancies(json_file) -> Iterator[dict]:
+        """Читает вакансии из файла по одной, не загружая весь файл в память."""
+        pass
+
+    @classmethod
+    def load_vacancies(cls, json_file) -> list:
+        """Возвращает все вакансии из файла."""
+        return list(cls.iter_vacancies(json_file))
+
+    @staticmethod
+    @abstractmethod
+    def save_vacancies(json_file, vacancies: list) -> None:
+        """Полностью перезаписывает файл переданным списком вакансий."""
+        pass
+
+    @classmethod
+    def find_vacancy(cls, json_file, vacancy_id: int) -> dict | None:
+        """
+        Возвращает вакансию по ее ID или None, если такой вакансии нет.
+        При повторах ID возвращается последняя копия (как после compact), поэтому файл читается до конца.
+        """
+        found = None
+        for vacancy in cls.iter_vacancies(json_file):
+            if vacancy["id"] == vacancy_id:
+                found = vacancy
+        return found
+
+    @staticmethod
+    def replace_vacancies(vacancies: list, new_vacancies: list) -> list:
+        """
+        Добавляет вакансии в конец списка, убирая прежние копии их ID (побеждает последняя запись).
+        При повторах ID среди самих новых вакансий остается последняя.
+        """
+        unique = {}
+        for vacancy in new_vacancies:
+            unique.pop(vacancy["id"], None)
+            unique[vacancy["id"]] = vacancy
+        return [vacancy for vacancy in vacancies if vacancy["id"] not in unique] + list(unique.values())
+
+    @classmethod
+    def find_vacancies(cls, json_file, vacancy_ids: list[int]) -> list:
+        """
+        Возвращает вакансии с переданными ID в порядке ID (за один проход по файлу).
+        При повторах ID возвращается последняя копия.
+        """
+        wanted = set(vacancy_ids)
+        found = {vacancy["id"]: vacancy for vacancy in cls.iter_vacancies(json_file) if vacancy["id"] in wanted}
+        return [found[vacancy_id] for vacancy_id in vacancy_ids if vacancy_id in found]
+
+    @classmethod
+    def remove_vacancy(cls, json_file, vacancy_id: int) -> bool:
+        """
+        Удаляет вакансию по ее ID, отмечая ее удаленной (файл хранилища не читается и не переписывается).
+        Наличие вакансии не проверяется - для этого пришлось бы прочитать все хранилище, поэтому
+        всегда возвращает True: после вызова вакансии с этим ID в хранилище нет.
+        """
+        cls.tombstone_vacancies(json_file, [vacancy_id])
+        return True
+
+    @classmethod
+    def tombstone_vacancies(cls, json_file, vacancy_ids: list[int]) -> None:
+        """Отмечает вакансии удаленными без проверки их наличия: запись отметок не зависит от размера хранилища."""
+        with file_lock(json_file):
+            Tombstones.add(json_file, vacancy_ids)
+        cls.unindex_vacancies(json_file, vacancy_ids)
+
+    @classmethod
+    def retained_vacancies(cls, json_file, retention: RetentionPolicy | None = None) -> Iterator[dict]:
+        """
+        Вакансии, которые остаются после сжатия хранилища: без удаленных, без повторов ID
+        (остается последняя добавленная копия на ее месте, как и в JSONLSaver.compact)
+        и без устаревших по retention.
+
+        Хранилище читается дважды: первый проход запоминает положение последней копии каждого ID,
+        поэтому в памяти держатся только ID, а не сами вакансии.
+        """
+        now = datetime.now(timezone.utc)
+        last = {}
+        for position, vacancy in enumerate(cls.iter_vacancies(json_file)):
+            last[vacancy["id"]] = position
+        for position, vacancy in enumerate(cls.iter_vacancies(json_file)):
+            if last[vacancy["id"]] != position:
+                metrics.count('compact.duplicates')
+                continue
+            if retention and retention.is_expired(vacancy, now):
+                metrics.count('compact.expired')
+                continue
+            yield vacancy
+
+    @classmethod
+    @metrics.timed('store.compact')
+    def compact(cls, json_file, retention: RetentionPolicy | None = None) -> int:
+        """
+        Переписывает хранилище без удаленных, повторяющихся и устаревших вакансий (см. retained_vacancies).
+
+        :param json_file: файл хранилища
+        :param retention: сроки хранения вакансий по платформам (без них вакансии не устаревают)
+        :return: кол-во вакансий после сжатия
+        """
+        with file_lock(json_file):
+            vacancies = list(cls.retained_vacancies(json_file, retention))
+            cls.save_vacancies(json_file, vacancies)
+        return len(vacancies)
+
+    @classmethod
+    def search_vacancies(cls, json_file, query: str, limit: int = 20) -> list:
+        """
+        Ищет вакансии по ключевым словам в наименовании и описании через поисковый индекс.
+        Слова объединяются по AND, OR между словами ищет любое из них (см. SearchIndex.search).
+        """
+        if not SearchIndex.exists(json_file):
+            cls.reindex(json_file)
+        with SearchIndex(json_file) as index:
+            vacancy_ids = [vacancy_id for vacancy_id, score in index.search(query, limit)]
+            found = index.vacancies(vacancy_ids)
+        # вакансии берутся из индекса; в хранилище ищутся только записанные в индекс до появления в нем вакансий
+        missing = [vacancy_id for vacancy_id in vacancy_ids if vacancy_id not in found]
+        if missing:
+            found.update((vacancy["id"], vacancy) for vacancy in cls.find_vacancies(json_file, missing))
+        return [found[vacancy_id] for vacancy_id in vacancy_ids if vacancy_id in found]
+
+    @classmethod
+    def index_vacancies(cls, json_file, vacancies: list) -> None:
+        """Добавляет записанные вакансии в поисковый индекс хранилища (создает индекс, если его нет)."""
+        if not cls.search_index:
+            return
+        if not SearchIndex.exists(json_file):
+            cls.reindex(json_file)
+            return
+        with SearchIndex(json_file) as index:
+            index.add(vacancies)
+
+    @classmethod
+    def unindex_vacancies(cls, json_file, vacancy_ids: list[int]) -> None:
+        """Удаляет вакансии из поискового индекса хранилища."""
+        if cls.search_index and SearchIndex.exists(json_file):
+            with SearchIndex(json_file) as index:
+                index.remove(vacancy_ids)
+
+    @classmethod
+    def sync_index(cls, json_file, vacancies: list) -> None:
+        """
+        Обновляет поисковый индекс после перезаписи хранилища списком vacancies: заново индексируются
+        только новые и изменившиеся вакансии, удаленные убираются (см. SearchIndex.sync).
+        """
+        if cls.search_index:
+            with SearchIndex(json_file) as index:
+                index.sync(vacancies)
+
+    @classmethod
+    def reindex(cls, json_file, chunk_size: int = 1000) -> None:
+        """Строит поисковый индекс заново по всем вакансиям хранилища."""
+        with SearchIndex(json_file) as index:
+            index.clear()
+            chunk = []
+            for vacancy in cls.iter_vacancies(json_file):
+                chunk.append(vacancy)
+                if len(chunk) == chunk_size:
+                    index.add(chunk)
+                    chunk = []
+            index.add(chunk)
+
+    @classmethod
+    def top_vacancies(cls, json_file, top_n: int, key: str = 'from') -> list:
+        """Возвращает top_n вакансий с наибольшей зарплатой по ключу key (см. ranking.SALARY_KEYS)."""
+        return top_vacancies(cls.iter_vacancies(json_file), top_n, key)
+
+    @classmethod
+    def salary_vacancies(cls, json_file, key: str = 'from') -> list:
+        """
+        Возвращает вакансии с указанной зарплатой, отсортированные по убыванию по ключу key.
+        Вакансии читаются в колонки VacancyColumns, словари собираются заново только для отобранных.
+        """
+        columns = VacancyColumns.from_vacancies(cls.iter_vacancies(json_file))
+        return list(columns.iter_dicts(columns.sort(key)))
+
+    @classmethod
+    def filter_vacancies(cls, json_file, currency: str | None = None, salary_from: int | None = None,
+                         profession: str | None = None) -> list:
+        """Возвращает вакансии, подходящие под все переданные условия (см. ranking.filter_vacancies)."""
+        columns = VacancyColumns.from_vacancies(cls.iter_vacancies(json_file))
+        return list(columns.iter_dicts(columns.filter(columns_mask(columns, currency, salary_from, profession))))
+
+    @classmethod
+    def merge_vacancies(cls, json_file, new_vacancies: list) -> tuple[int, int, int]:
+        """
+        Добавляет новые вакансии и обновляет изменившиеся, пропуская уже сохраненные без изменений.
+
+        :return: кол-во новых, обновленных и пропущенных вакансий
+        """
+        with file_lock(json_file):
+            stored = cls.load_vacancies(json_file)
+            positions = {vacancy["id"]: index for index, vacancy in enumerate(stored)}
+            new = updated = skipped = 0
+            for vacancy in new_vacancies:
+                index = positions.get(vacancy["id"])
+                if index is None:
+                    positions[vacancy["id"]] = len(stored)
+                    stored.append(vacancy)
+                    new += 1
+                elif stored[index] != vacancy:
+                    stored[index] = vacancy
+                    updated += 1
+                else:
+                    skipped += 1
+
+            if new or updated:
+                cls.save_vacancies(json_file, stored)
+        return new, updated, skipped
+
+    @staticmethod
+    def print_merge_result(new: int, updated: int, skipped: int) -> str:
+        """Возвращает результат инкрементального сбора вакансий."""
+        return (f'Новых вакансий: {new}\n'
+                f'Обновлено вакансий: {updated}\n'
+                f'Пропущено (уже сохранены): {skipped}\n')
+
     @staticmethod
     def print_result(json_data):
         """Возвращает результат сбора вакансий."""
@@ -40,76 +309,786 @@ class Saver(ABC):
 class JSONSaver(Saver):
     """Класс для сохранения вакансий в JSON формате."""
     __slots__ = ()
-    working_file = 'config/vacancies.json'
+    # путь к рабочему файлу можно переопределить переменной окружения,
+    # например 'config/vacancies.jsonl' для append-only хранилища
+    working_file = os.getenv('vacancies_file', 'config/vacancies.json')
+    tombstones = True
 
     def __init__(self):
-        # проверяем наличие необходимо JSON файла-шаблона
-        if self.check_file(JSONSaver.working_file):
-            self.__working_file = self.working_file
+        # проверяем наличие необходимо файла-шаблона
+        get_saver(self.working_file).check_file(self.working_file)
 
     @property
     def get_working_file(self):
         return self.working_file
 
     @staticmethod
+    @metrics.timed('store.json.add_vacancies')
     def add_vacancies(json_file, new_vacancies: list) -> None:
         """Метод добавления вакансий в JSON файл"""
-        with open(json_file, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
-            json_data.extend(new_vacancies)
+        with file_lock(json_file):
+            # файл все равно переписывается - заодно убираем удаленные вакансии и прежние копии добавляемых
+            json_data = JSONSaver.replace_vacancies(JSONSaver.load_vacancies(json_file), new_vacancies)
 
-            # открываем файл для записи добавленных вакансий с каждой
-            # страницы в список "items"
-            with open(json_file, 'w', encoding='utf-8') as outfile:
+            # записываем вакансии во временный файл и подменяем им хранилище,
+            # чтобы сбой посреди записи не испортил уже собранные вакансии
+            with atomic_write(json_file) as outfile:
                 json.dump(json_data, outfile, ensure_ascii=False, indent=2)
+            Tombstones.clear(json_file)
+            JSONSaver.index_vacancies(json_file, new_vacancies)
+
+    @staticmethod
+    def load_vacancies(json_file) -> list:
+        """Возвращает все вакансии из JSON файла (кроме отмеченных удаленными)."""
+        with open(json_file, 'r', encoding='utf-8') as f:
+            vacancies = json.load(f)
+        deleted = Tombstones.load(json_file)
+        return [vacancy for vacancy in vacancies if vacancy["id"] not in deleted] if deleted else vacancies
+
+    @staticmethod
+    def iter_vacancies(json_file, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+        """
+        Читает JSON-массив вакансий частями по chunk_size символов и возвращает вакансии по одной.
+        В памяти одновременно находится только текущая часть файла. Вакансии, отмеченные удаленными, пропускаются.
+        Как и json.load, выбрасывает json.JSONDecodeError, если файл пуст, не является массивом или обрезан.
+        """
+        deleted = Tombstones.load(json_file)
+        decoder = json.JSONDecoder()
+        with open(json_file, 'r', encoding='utf-8') as f:
+            buffer = ''
+            position = 0
+            end_of_file = False
+            started = False
+            while True:
+                # пропускаем пробелы, а после открывающей скобки массива - и запятые между вакансиями
+                while position < len(buffer) and (buffer[position] in ' \t\r\n'
+                                                  or started and buffer[position] == ','):
+                    position += 1
+
+                if position < len(buffer) and not started:
+                    if buffer[position] != '[':
+                        raise json.JSONDecodeError("Хранилище не является JSON-массивом вакансий", buffer, position)
+                    started = True
+                    position += 1
+                    continue
+                if position < len(buffer) and buffer[position] == ']':
+                    return
+                if position < len(buffer):
+                    try:
+                        vacancy, end = decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        # объект не поместился в прочитанную часть файла - дочитываем
+                        if end_of_file:
+                            raise
+                    else:
+                        position = end
+                        if vacancy["id"] not in deleted:
+                            yield vacancy
+                        continue
+                elif end_of_file:
+                    # файл закончился раньше закрывающей скобки массива (или пуст)
+                    message = "Не найдена закрывающая скобка массива" if started else "Хранилище пусто"
+                    raise json.JSONDecodeError(message, buffer, position)
+
+                chunk = f.read(chunk_size)
+                end_of_file = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+
+    @staticmethod
+    def save_vacancies(json_file, vacancies: list) -> None:
+        """Перезаписывает JSON файл переданным списком вакансий."""
+        with file_lock(json_file):
+            with atomic_write(json_file) as outfile:
+                json.dump(vacancies, outfile, ensure_ascii=False, indent=2)
+            Tombstones.clear(json_file)
+            JSONSaver.sync_index(json_file, vacancies)
+
+    @staticmethod
+    @metrics.timed('store.compact')
+    def compact(json_file, retention: RetentionPolicy | None = None) -> int:
+        """
+        Сжатие за один проход: вакансии читаются и записываются по одной (в том же виде, что и json.dump
+        с отступами), поэтому весь файл в памяти не находится. См. Saver.compact.
+        """
+        count = 0
+        with file_lock(json_file):
+            with atomic_write(json_file) as outfile:
+                outfile.write('[')
+                for vacancy in JSONSaver.retained_vacancies(json_file, retention):
+                    outfile.write(',\n' if count else '\n')
+                    outfile.write(textwrap.indent(json.dumps(vacancy, ensure_ascii=False, indent=2), '  '))
+                    count += 1
+                outfile.write('\n]' if count else ']')
+            Tombstones.clear(json_file)
+            if JSONSaver.search_index:
+                JSONSaver.reindex(json_file)
+        return count
+
+
+class JSONLSaver(Saver):
+    """
+    Append-only хранилище вакансий в формате JSON Lines (одна вакансия на строку).
+
+    Запись страницы стоит O(размер страницы): файл не перечитывается, новые строки дописываются в конец.
+    Положение каждой записи хранится в индексе VacancyIndex, поэтому поиск и удаление по ID
+    не разбирают весь файл. Удаленная или перезаписанная вакансия затирается пробелами на месте,
+    такие пустые строки убирает метод compact. Выгрузка в формат JSON-массива - export_json.
+    """
+    __slots__ = ()
+    working_file = 'config/vacancies.jsonl'
+    incremental_writes = True
+
+    @staticmethod
+    def check_file(json_file) -> None:
+        """Создает пустое хранилище, если его еще нет."""
+        if not os.path.exists(json_file):
+            open(json_file, 'a', encoding='utf-8').close()
+
+    @staticmethod
+    @metrics.timed('store.jsonl.add_vacancies')
+    def add_vacancies(json_file, new_vacancies: list) -> None:
+        """Дописывает вакансии в конец файла, не читая его, и обновляет индекс."""
+        JSONLSaver.check_file(json_file)
+        JSONLSaver.__check_index(json_file)
+
+        # вакансии с одинаковым ID внутри страницы: остается последняя
+        vacancies = {}
+        for vacancy in new_vacancies:
+            vacancies.pop(vacancy["id"], None)
+            vacancies[vacancy["id"]] = vacancy
+
+        with file_lock(json_file), VacancyIndex(json_file) as index, open(json_file, 'r+b') as f:
+            # уже сохраненные версии этих вакансий затираем, чтобы в файле не было дубликатов
+            for vacancy_id in vacancies:
+                position = index.get(vacancy_id)
+                if position:
+                    JSONLSaver.__erase_record(f, *position)
+
+            offset = f.seek(0, os.SEEK_END)
+            lines = []
+            positions = []
+            for vacancy_id, vacancy in vacancies.items():
+                line = json.dumps(vacancy, ensure_ascii=False).encode() + b'\n'
+                positions.append((vacancy_id, offset, len(line) - 1))
+                lines.append(line)
+                offset += len(line)
+            f.write(b''.join(lines))
+            index.set_many(positions)
+            JSONLSaver.index_vacancies(json_file, list(vacancies.values()))
+
+    @staticmethod
+    def load_vacancies(json_file) -> list:
+        """Возвращает все вакансии из файла, пропуская пустые строки."""
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @staticmethod
+    def iter_vacancies(json_file) -> Iterator[dict]:
+        """Читает вакансии по одной строке, пропуская пустые (удаленные) записи."""
+        with open(json_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def save_vacancies(json_file, vacancies: list) -> None:
+        """Перезаписывает файл переданным списком вакансий и перестраивает индекс."""
+        with file_lock(json_file):
+            with atomic_write(json_file) as f:
+                f.writelines(json.dumps(vacancy, ensure_ascii=False) + '\n' for vacancy in vacancies)
+            JSONLSaver.rebuild_index(json_file)
+            JSONLSaver.sync_index(json_file, vacancies)
+
+    @staticmethod
+    def find_vacancy(json_file, vacancy_id: int) -> dict | None:
+        """Разбирает только запись нужной вакансии по смещению из индекса (файл отображается в память)."""
+        JSONLSaver.__check_index(json_file)
+        with MappedStore(json_file) as store:
+            return store.get(vacancy_id)
+
+    @staticmethod
+    def remove_vacancy(json_file, vacancy_id: int) -> bool:
+        """Затирает запись вакансии на месте и удаляет ее из индекса, не переписывая файл."""
+        JSONLSaver.__check_index(json_file)
+        with file_lock(json_file), VacancyIndex(json_file) as index:
+            position = index.get(vacancy_id)
+            if position is None:
+                return False
+            with open(json_file, 'r+b') as f:
+                JSONLSaver.__erase_record(f, *position)
+            index.delete(vacancy_id)
+            JSONLSaver.unindex_vacancies(json_file, [vacancy_id])
+        return True
+
+    @staticmethod
+    def find_vacancies(json_file, vacancy_ids: list[int]) -> list:
+        """Разбирает только записи нужных вакансий по смещениям из индекса."""
+        JSONLSaver.__check_index(json_file)
+        with MappedStore(json_file) as store:
+            return store.get_many(vacancy_ids)
+
+    @staticmethod
+    def top_vacancies(json_file, top_n: int, key: str = 'from') -> list:
+        """Ранжирует вакансии по зарплате, разбирая целиком только записи вошедших в топ вакансий."""
+        JSONLSaver.check_file(json_file)
+        JSONLSaver.__check_index(json_file)
+        with MappedStore(json_file) as store:
+            return store.top_vacancies(top_n, key)
+
+    @staticmethod
+    def salary_vacancies(json_file, key: str = 'from') -> list:
+        JSONLSaver.check_file(json_file)
+        JSONLSaver.__check_index(json_file)
+        with MappedStore(json_file) as store:
+            return store.salary_vacancies(key)
+
+    @staticmethod
+    def merge_vacancies(json_file, new_vacancies: list) -> tuple[int, int, int]:
+        """Сверяет вакансии с сохраненными по индексу, читая с диска только записи известных ID."""
+        JSONLSaver.check_file(json_file)
+        JSONLSaver.__check_index(json_file)
+        changed = []
+        new = updated = skipped = 0
+        with file_lock(json_file):
+            with VacancyIndex(json_file) as index, open(json_file, 'rb') as f:
+                for vacancy in new_vacancies:
+                    position = index.get(vacancy["id"])
+                    if position is None:
+                        new += 1
+                        changed.append(vacancy)
+                        continue
+
+                    offset, length = position
+                    f.seek(offset)
+                    if json.loads(f.read(length)) != vacancy:
+                        updated += 1
+                        changed.append(vacancy)
+                    else:
+                        skipped += 1
+
+            if changed:
+                # add_vacancies затирает прежние версии обновленных вакансий
+                JSONLSaver.add_vacancies(json_file, changed)
+        return new, updated, skipped
+
+    @staticmethod
+    def rebuild_index(json_file) -> None:
+        """Строит индекс заново по содержимому файла (для хранилищ, созданных без индекса)."""
+        positions = {}
+        with file_lock(json_file), open(json_file, 'r+b') as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    vacancy_id = json.loads(line)["id"]
+                    if vacancy_id in positions:
+                        # затираем более раннюю копию вакансии, остается последняя
+                        position = f.tell()
+                        JSONLSaver.__erase_record(f, *positions[vacancy_id])
+                        f.seek(position)
+                    positions[vacancy_id] = (offset, len(line.rstrip(b'\n')))
+                offset += len(line)
+
+        with VacancyIndex(json_file) as index:
+            index.clear()
+            index.set_many([(vacancy_id, *position) for vacancy_id, position in positions.items()])
+
+    @staticmethod
+    @metrics.timed('store.compact')
+    def compact(json_file, retention: RetentionPolicy | None = None) -> int:
+        """
+        Переписывает хранилище за один проход без пустых (удаленных) записей и устаревших по retention
+        вакансий, оставляя по одной (последней записанной) вакансии на каждый ID. Строки копируются
+        как есть, разбираются только для проверки срока хранения.
+
+        :param json_file: JSONL файл с вакансиями
+        :param retention: сроки хранения вакансий по платформам (без них вакансии не устаревают)
+        :return: кол-во вакансий после сжатия
+        """
+        JSONLSaver.check_file(json_file)
+        now = datetime.now(timezone.utc)
+        count = 0
+        with file_lock(json_file):
+            # затирает более ранние копии вакансий с одинаковыми ID
+            JSONLSaver.rebuild_index(json_file)
+            with open(json_file, 'rb') as source, atomic_write(json_file, 'wb') as target:
+                for line in source:
+                    if not line.strip():
+                        continue
+                    if retention and retention.is_expired(json.loads(line), now):
+                        metrics.count('compact.expired')
+                        continue
+                    target.write(line if line.endswith(b'\n') else line + b'\n')
+                    count += 1
+            JSONLSaver.rebuild_index(json_file)
+            if JSONLSaver.search_index:
+                JSONLSaver.reindex(json_file)
+        return count
+
+    @staticmethod
+    def export_json(jsonl_file, json_file) -> None:
+        """Выгружает JSONL хранилище в JSON файл с массивом вакансий (прежний формат)."""
+        JSONSaver.save_vacancies(json_file, JSONLSaver.load_vacancies(jsonl_file))
+
+    @staticmethod
+    def __check_index(json_file) -> None:
+        """Строит индекс, если хранилище существует, а индекса для него еще нет."""
+        if not VacancyIndex.exists(json_file) and os.path.exists(json_file):
+            JSONLSaver.rebuild_index(json_file)
+
+    @staticmethod
+    def __erase_record(f, offset: int, length: int) -> None:
+        """Затирает запись пробелами, сохраняя перевод строки и смещения остальных записей."""
+        f.seek(offset)
+        f.write(b' ' * length)
+
+
+class SQLiteSaver(Saver):
+    """
+    Хранилище вакансий в локальной базе SQLite.
+
+    Зарплата хранится в отдельных колонках с индексами (salary_from, salary_to, currency),
+    поэтому фильтрация и сортировка выполняются запросами SQL без чтения всех вакансий.
+    Каждая страница вакансий записывается одной транзакцией.
+    """
+    __slots__ = ()
+    working_file = 'config/vacancies.sqlite'
+    incremental_writes = True
+    query_pushdown = True
+
+    columns = 'id, profession, salary_from, salary_to, currency, vacancy_url, description, published_at'
+
+    @staticmethod
+    def check_file(json_file) -> None:
+        """Создает базу и таблицу вакансий с индексами, если их еще нет."""
+        with SQLiteSaver.__connect(json_file) as connection:
+            connection.executescript('''
+                CREATE TABLE IF NOT EXISTS vacancies (
+                    id INTEGER PRIMARY KEY,
+                    profession TEXT NOT NULL,
+                    salary_from INTEGER,
+                    salary_to INTEGER,
+                    currency TEXT,
+                    vacancy_url TEXT,
+                    description TEXT,
+                    published_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies (salary_from);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies (salary_to);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_currency ON vacancies (currency);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_profession ON vacancies (profession COLLATE NOCASE);
+            ''')
+            # базы, созданные до появления даты публикации
+            if 'published_at' not in {row[1] for row in connection.execute('PRAGMA table_info(vacancies)')}:
+                connection.execute('ALTER TABLE vacancies ADD COLUMN published_at TEXT')
+
+    @staticmethod
+    @metrics.timed('store.sqlite.add_vacancies')
+    def add_vacancies(json_file, new_vacancies: list) -> None:
+        """Записывает страницу вакансий одной транзакцией (существующие ID перезаписываются)."""
+        SQLiteSaver.check_file(json_file)
+        with SQLiteSaver.__connect(json_file) as connection:
+            SQLiteSaver.__insert(connection, new_vacancies)
+        SQLiteSaver.index_vacancies(json_file, new_vacancies)
+
+    @staticmethod
+    def iter_vacancies(json_file) -> Iterator[dict]:
+        """Читает вакансии из курсора по одной, не выбирая всю таблицу в память."""
+        with SQLiteSaver.__connect(json_file) as connection:
+            for row in connection.execute(f'SELECT {SQLiteSaver.columns} FROM vacancies ORDER BY rowid'):
+                yield SQLiteSaver.__from_row(row)
+
+    @staticmethod
+    def save_vacancies(json_file, vacancies: list) -> None:
+        SQLiteSaver.check_file(json_file)
+        with SQLiteSaver.__connect(json_file) as connection:
+            connection.execute('DELETE FROM vacancies')
+            SQLiteSaver.__insert(connection, vacancies)
+        SQLiteSaver.sync_index(json_file, vacancies)
+
+    @staticmethod
+    def find_vacancy(json_file, vacancy_id: int) -> dict | None:
+        vacancies = SQLiteSaver.__select(json_file, 'WHERE id = ?', (vacancy_id,))
+        return vacancies[0] if vacancies else None
+
+    @staticmethod
+    def find_vacancies(json_file, vacancy_ids: list[int]) -> list:
+        placeholders = ', '.join('?' * len(vacancy_ids))
+        found = {vacancy["id"]: vacancy
+                 for vacancy in SQLiteSaver.__select(json_file, f'WHERE id IN ({placeholders})', vacancy_ids)}
+        return [found[vacancy_id] for vacancy_id in vacancy_ids if vacancy_id in found]
+
+    @staticmethod
+    def remove_vacancy(json_file, vacancy_id: int) -> bool:
+        with SQLiteSaver.__connect(json_file) as connection:
+            removed = connection.execute('DELETE FROM vacancies WHERE id = ?', (vacancy_id,)).rowcount > 0
+        if removed:
+            SQLiteSaver.unindex_vacancies(json_file, [vacancy_id])
+        return removed
+
+    @staticmethod
+    @metrics.timed('store.compact')
+    def compact(json_file, retention: RetentionPolicy | None = None) -> int:
+        """
+        Удаляет устаревшие по retention вакансии и возвращает освободившееся место (VACUUM).
+        Удаленных записей и повторов ID в таблице не бывает.
+        """
+        SQLiteSaver.check_file(json_file)
+        expired = []
+        if retention:
+            now = datetime.now(timezone.utc)
+            expired = [vacancy["id"] for vacancy in SQLiteSaver.iter_vacancies(json_file)
+                       if retention.is_expired(vacancy, now)]
+            metrics.count('compact.expired', len(expired))
+        with SQLiteSaver.__connect(json_file) as connection:
+            connection.executemany('DELETE FROM vacancies WHERE id = ?', [(vacancy_id,) for vacancy_id in expired])
+            count = connection.execute('SELECT COUNT(*) FROM vacancies').fetchone()[0]
+        # VACUUM нельзя выполнить внутри транзакции
+        connection = sqlite3.connect(json_file)
+        try:
+            connection.execute('VACUUM')
+        finally:
+            connection.close()
+        SQLiteSaver.unindex_vacancies(json_file, expired)
+        return count
+
+    # выражения SQL для ключей сортировки по зарплате (0 означает "не указано", как и в ranking)
+    salary_expressions = {
+        'from': 'NULLIF(salary_from, 0)',
+        'to': 'NULLIF(salary_to, 0)',
+        'middle': 'COALESCE((NULLIF(salary_from, 0) + NULLIF(salary_to, 0)) / 2.0, '
+                  'NULLIF(salary_from, 0), NULLIF(salary_to, 0))',
+    }
+
+    @staticmethod
+    def merge_vacancies(json_file, new_vacancies: list) -> tuple[int, int, int]:
+        """Сверяет вакансии с сохраненными одним запросом по первичному ключу."""
+        SQLiteSaver.check_file(json_file)
+        ids = [vacancy["id"] for vacancy in new_vacancies]
+        placeholders = ', '.join('?' * len(ids))
+        stored = {vacancy["id"]: vacancy
+                  for vacancy in SQLiteSaver.__select(json_file, f'WHERE id IN ({placeholders})', ids)}
+
+        changed = []
+        new = updated = skipped = 0
+        for vacancy in new_vacancies:
+            if vacancy["id"] not in stored:
+                new += 1
+                changed.append(vacancy)
+            elif stored[vacancy["id"]] != SQLiteSaver.__from_row(SQLiteSaver.__to_row(vacancy)):
+                # сравниваем в том виде, в котором вакансия хранится в таблице
+                updated += 1
+                changed.append(vacancy)
+            else:
+                skipped += 1
+
+        if changed:
+            SQLiteSaver.add_vacancies(json_file, changed)
+        return new, updated, skipped
+
+    @staticmethod
+    def top_vacancies(json_file, top_n: int, key: str = 'from') -> list:
+        expression = SQLiteSaver.salary_expressions.get(key)
+        if expression is None:
+            # пересчет по курсу валют выполняется в Python, в SQL отбираем только вакансии с зарплатой
+            return top_vacancies(SQLiteSaver.__select_with_salary(json_file), top_n, key)
+        return SQLiteSaver.__select(json_file, f'WHERE {expression} IS NOT NULL '
+                                               f'ORDER BY {expression} DESC, rowid LIMIT ?', (top_n,))
+
+    # вакансия без зарплаты ("Не указана") хранится с пустыми колонками зарплаты и валюты
+    with_salary = 'NOT (salary_from IS NULL AND salary_to IS NULL AND currency IS NULL)'
+
+    @staticmethod
+    def salary_vacancies(json_file, key: str = 'from') -> list:
+        expression = SQLiteSaver.salary_expressions.get(key)
+        if expression is None:
+            return sort_vacancies(SQLiteSaver.__select_with_salary(json_file), key)
+        return SQLiteSaver.__select(json_file, f'WHERE {SQLiteSaver.with_salary} '
+                                               f'ORDER BY {expression} IS NULL, {expression} DESC, rowid')
+
+    @staticmethod
+    def __select_with_salary(json_file) -> list:
+        return SQLiteSaver.__select(json_file, f'WHERE {SQLiteSaver.with_salary} ORDER BY rowid')
+
+    @staticmethod
+    def filter_vacancies(json_file, currency: str | None = None, salary_from: int | None = None,
+                         profession: str | None = None) -> list:
+        conditions = []
+        params = []
+        if currency:
+            conditions.append('currency = ?')
+            params.append(currency.upper())
+        if salary_from is not None:
+            conditions.append('salary_from >= ?')
+            params.append(salary_from)
+        if profession:
+            # встроенный LIKE SQLite не учитывает регистр кириллицы - сравниваем в нижнем регистре Python
+            conditions.append("py_lower(profession) LIKE ? ESCAPE '\\'")
+            params.append('%' + profession.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+
+        where = f'WHERE {" AND ".join(conditions)} ' if conditions else ''
+        return SQLiteSaver.__select(json_file, where + 'ORDER BY rowid', params)
+
+    @staticmethod
+    @contextmanager
+    def __connect(json_file):
+        """Открывает соединение с базой: транзакция фиксируется при выходе, соединение закрывается."""
+        connection = sqlite3.connect(json_file)
+        connection.create_function('py_lower', 1, str.lower, deterministic=True)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def __insert(connection: sqlite3.Connection, vacancies: list) -> None:
+        connection.executemany(f'INSERT OR REPLACE INTO vacancies ({SQLiteSaver.columns}) '
+                               'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                               [SQLiteSaver.__to_row(vacancy) for vacancy in vacancies])
+
+    @staticmethod
+    def __select(json_file, condition: str, params=()) -> list:
+        """Выполняет SELECT с условием и возвращает вакансии в формате словарей."""
+        with SQLiteSaver.__connect(json_file) as connection:
+            rows = connection.execute(f'SELECT {SQLiteSaver.columns} FROM vacancies {condition}', params)
+            return [SQLiteSaver.__from_row(row) for row in rows]
+
+    @staticmethod
+    def __to_row(vacancy: dict) -> tuple:
+        """Раскладывает вакансию по колонкам таблицы."""
+        salary = vacancy["salary"]
+        if salary == "Не указана":
+            salary_from = salary_to = currency = None
+        else:
+            # пользовательские вакансии хранят зарплату строками - приводим к числу для индексов
+            salary_from = int(salary["from"]) if salary["from"] is not None else None
+            salary_to = int(salary["to"]) if salary["to"] is not None else None
+            currency = salary["currency"]
+        return (vacancy["id"], vacancy["profession"], salary_from, salary_to, currency,
+                vacancy["vacancy_url"], vacancy["description"], vacancy.get("published_at"))
+
+    @staticmethod
+    def __from_row(row: tuple) -> dict:
+        """Собирает вакансию из строки таблицы в прежнем формате словаря."""
+        vacancy_id, profession, salary_from, salary_to, currency, vacancy_url, description, published_at = row
+        if salary_from is None and salary_to is None and currency is None:
+            salary = "Не указана"
+        else:
+            salary = {"from": salary_from, "to": salary_to, "currency": currency}
+        vacancy = {"id": vacancy_id,
+                   "profession": profession,
+                   "salary": salary,
+                   "vacancy_url": vacancy_url,
+                   "description": description,
+                   }
+        # у пользовательских вакансий даты публикации нет
+        if published_at is not None:
+            vacancy["published_at"] = published_at
+        return vacancy
+
+
+class FormatSaver(Saver):
+    """
+    Хранилище вакансий в одном из компактных форматов config/formats.py, формат выбирается
+    по расширению файла: '.json.gz' (сжатый компактный JSON), '.msgpack', '.vcol' (колоночный).
+
+    Файл, как и JSON-массив, перезаписывается целиком (атомарно, под блокировкой). Запросы топ N,
+    сортировки и поиска по ID читают колонки ID и зарплаты и разбирают полностью только нужные вакансии -
+    в колоночном формате это не требует разбора наименований и описаний остальных вакансий.
+    Удаление отмечает вакансию (Tombstones), запись убирается при следующей перезаписи файла.
+    """
+    __slots__ = ()
+    tombstones = True
+
+    @staticmethod
+    def check_file(json_file) -> None:
+        """Создает пустое хранилище, если его еще нет."""
+        if not os.path.exists(json_file):
+            FormatSaver.save_vacancies(json_file, [])
+
+    @staticmethod
+    @metrics.timed('store.format.add_vacancies')
+    def add_vacancies(json_file, new_vacancies: list) -> None:
+        with file_lock(json_file):
+            FormatSaver.check_file(json_file)
+            vacancies = FormatSaver.replace_vacancies(FormatSaver.load_vacancies(json_file), new_vacancies)
+            with atomic_write(json_file, 'wb') as f:
+                get_format(json_file).dump(vacancies, f)
+            Tombstones.clear(json_file)
+            FormatSaver.index_vacancies(json_file, new_vacancies)
+
+    @staticmethod
+    def load_vacancies(json_file) -> list:
+        return list(Tombstones.filter(json_file, get_format(json_file).load(json_file)))
+
+    @staticmethod
+    def iter_vacancies(json_file) -> Iterator[dict]:
+        yield from FormatSaver.load_vacancies(json_file)
+
+    @staticmethod
+    def save_vacancies(json_file, vacancies: list) -> None:
+        with file_lock(json_file):
+            with atomic_write(json_file, 'wb') as f:
+                get_format(json_file).dump(vacancies, f)
+            Tombstones.clear(json_file)
+            FormatSaver.sync_index(json_file, vacancies)
+
+    @staticmethod
+    def find_vacancy(json_file, vacancy_id: int) -> dict | None:
+        vacancies = FormatSaver.find_vacancies(json_file, [vacancy_id])
+        return vacancies[0] if vacancies else None
+
+    @staticmethod
+    def find_vacancies(json_file, vacancy_ids: list[int]) -> list:
+        store_format = get_format(json_file)
+        if not store_format.columnar:
+            found = {vacancy["id"]: vacancy for vacancy in FormatSaver.load_vacancies(json_file)}
+            return [found[vacancy_id] for vacancy_id in vacancy_ids if vacancy_id in found]
+        deleted = Tombstones.load(json_file)
+        rows = {vacancy_id: row for row, vacancy_id in enumerate(store_format.load_fields(json_file, ['id'])['id'])
+                if vacancy_id not in deleted}
+        return store_format.load_rows(json_file, [rows[vacancy_id] for vacancy_id in vacancy_ids
+                                                  if vacancy_id in rows])
+
+    @staticmethod
+    def top_vacancies(json_file, top_n: int, key: str = 'from') -> list:
+        store_format = get_format(json_file)
+        if not store_format.columnar:
+            return top_vacancies(FormatSaver.load_vacancies(json_file), top_n, key)
+        ranked = top_vacancies(FormatSaver.__salary_rows(json_file), top_n, key)
+        return store_format.load_rows(json_file, [vacancy["row"] for vacancy in ranked])
+
+    @staticmethod
+    def salary_vacancies(json_file, key: str = 'from') -> list:
+        store_format = get_format(json_file)
+        if not store_format.columnar:
+            return sort_vacancies(FormatSaver.load_vacancies(json_file), key)
+        ranked = sort_vacancies(FormatSaver.__salary_rows(json_file), key)
+        return store_format.load_rows(json_file, [vacancy["row"] for vacancy in ranked])
+
+    @staticmethod
+    def __salary_rows(json_file) -> Iterator[dict]:
+        """
+        Зарплаты вакансий с их порядковыми номерами в файле - для ранжирования без остальных полей.
+        Возвращается поток, а не список: в строках нет остальных полей, нужных колонкам VacancyColumns.
+        """
+        store_format = get_format(json_file)
+        salaries = store_format.load_fields(json_file, ['salary'])['salary']
+        deleted = Tombstones.load(json_file)
+        if not deleted:
+            return ({"row": row, "salary": salary} for row, salary in enumerate(salaries))
+        ids = store_format.load_fields(json_file, ['id'])['id']
+        return ({"row": row, "salary": salary} for row, (vacancy_id, salary) in enumerate(zip(ids, salaries))
+                if vacancy_id not in deleted)
+
+
+def get_saver(json_file) -> type[Saver]:
+    """Возвращает класс хранилища по расширению рабочего файла."""
+    if json_file.endswith('.jsonl'):
+        return JSONLSaver
+    if json_file.endswith(('.sqlite', '.db')):
+        return SQLiteSaver
+    if get_format(json_file) is not None:
+        return FormatSaver
+    return JSONSaver
+
+
+def convert_store(source_file, target_file) -> int:
+    """
+    Переносит вакансии из одного хранилища в другое, форматы определяются по расширениям файлов.
+
+    :return: кол-во перенесенных вакансий
+    """
+    vacancies = get_saver(source_file).load_vacancies(source_file)
+    get_saver(target_file).save_vacancies(target_file, vacancies)
+    return len(vacancies)
 
 
 class Vacancy(JSONSaver):
     """Класс для работы с вакансиями."""
-    __slots__ = ('vacancy_id', 'profession', 'salary', 'vacancy_url', 'description')
+    __slots__ = ('vacancy_id', 'profession', 'salary', 'vacancy_url', 'description', 'salary_key')
     all_added_vacancies = []
 
     def __init__(self, vacancy_id: int, profession: str, salary: dict | str, vacancy_url: str,
                  description: str):
         super().__init__()
-        if self.__check_values(vacancy_id, profession, salary, vacancy_url, description):
+        if self.check_values(vacancy_id, profession, salary, vacancy_url, description):
             self.vacancy_id = vacancy_id
             self.profession = profession
             self.salary = self.__get_user_salary(salary)
+            # зарплата ОТ в базовой валюте вычисляется один раз для всех сравнений
+            self.salary_key = self.__get_salary_key(self.salary)
             self.vacancy_url = vacancy_url
             self.description = description
         self.all_added_vacancies.append(self)
 
-    @classmethod
-    def __check_values(cls, vacancy_id: int, profession: str, salary: dict | str, vacancy_url: str,
-                       description: str) -> True:
-        """Метод класса для возбуждения исключений при неверных входных данных."""
+    @staticmethod
+    def check_values(vacancy_id: int, profession: str, salary: dict | str, vacancy_url: str,
+                     description: str) -> True:
+        """
+        Проверяет данные пользовательской вакансии (при создании экземпляра и массовом импорте).
+
+        :raises TypeError, ValueError, KeyError: неверные входные данные (в тексте ошибки - что исправить)
+        """
         if not isinstance(vacancy_id, int):
             raise TypeError("ID Вакансии должен состоять из цифр")
         elif not len(str(vacancy_id)) == 8:
             raise ValueError("Длина ID вакансии должно быть равным 8 (восьми)")
-        elif not len(profession) >= 10:
+        elif not isinstance(profession, str) or not len(profession) >= 10:
             raise TypeError("Наименование вакансии должно состоять из минимум 10 символов.")
-        elif isinstance(salary, dict):
-            if not salary["from"] or not salary["to"] or not salary["currency"]:
+
+        if isinstance(salary, dict):
+            if not salary.get("from") or not salary.get("to") or not salary.get("currency"):
                 raise KeyError("Не указано значение зарплаты ОТ, ДО или ВАЛЮТА")
+            salary_from, salary_to, currency = salary["from"], salary["to"], salary["currency"]
         elif isinstance(salary, str):
             salary_split = salary.split()
             if len(salary_split) != 3:
-                raise "Зарплата и валюта должны быть разделены пробелами (всего два пробела)"
-            elif not int(salary_split[1]) >= int(salary_split[0]):
-                raise "Зарплата ДО должна быть больше или равна зарплате ОТ"
-            elif len(salary_split[2]) != 3:
-                raise "Наименование валюты должно состоять из 3 букв"
-        elif not vacancy_url.startswith("https://"):
-            raise "Ссылка должна начинаться с https://"
+                raise ValueError("Зарплата и валюта должны быть разделены пробелами (всего два пробела)")
+            salary_from, salary_to, currency = salary_split
+        else:
+            raise TypeError("Зарплата должна быть строкой \"от до валюта\" или словарем")
+
+        # одни и те же правила для строки и словаря: иначе запись ломает хранилище SQLite и сортировки
+        if not Vacancy.__is_amount(salary_from) or not Vacancy.__is_amount(salary_to):
+            raise ValueError("Зарплата ОТ и ДО может состоять из цифр")
+        elif not int(salary_to) >= int(salary_from):
+            raise ValueError("Зарплата ДО должна быть больше или равна зарплате ОТ")
+        elif not isinstance(currency, str) or len(currency) != 3 or not currency.isalpha():
+            raise ValueError("Наименование валюты должно состоять из 3 букв")
+
+        if not isinstance(vacancy_url, str) or not vacancy_url.startswith("https://"):
+            raise ValueError("Ссылка должна начинаться с https://")
         elif not vacancy_url.endswith(".ru"):
-            raise "Ссылка должна заканчиваться на .ru"
-        elif not len(description) >= 20:
+            raise ValueError("Ссылка должна заканчиваться на .ru")
+        elif not isinstance(description, str) or not len(description) >= 20:
             raise TypeError("Описание должно состоять минимум из 20 символов")
 
         return True
 
+    @classmethod
+    def make_vacancy(cls, vacancy_id: int, profession: str, salary: dict | str, vacancy_url: str,
+                     description: str) -> dict:
+        """
+        Проверяет данные вакансии и возвращает ее в формате хранилища, не создавая экземпляр
+        (для массового импорта: экземпляры не копятся в all_added_vacancies).
+        """
+        cls.check_values(vacancy_id, profession, salary, vacancy_url, description)
+        return {"id": vacancy_id,
+                "profession": profession,
+                "salary": cls.__get_user_salary(salary),
+                "vacancy_url": vacancy_url,
+                "description": description,
+                }
+
+    @staticmethod
+    def __is_amount(value) -> bool:
+        """Сумма зарплаты - целое неотрицательное число или строка из цифр."""
+        if isinstance(value, str):
+            return value.isdecimal()
+        return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
     @staticmethod
     def __get_user_salary(salary: str | dict) -> dict:
         """Получает зарплату в виде "от до валюта" и возвращает в виде словаря."""
@@ -121,27 +1100,38 @@ class Vacancy(JSONSaver):
                 "currency": salary_list[2].upper(),
             }
             return salary_dict
-        return salary
+        return {**salary, "currency": salary["currency"].upper()}
+
+    @staticmethod
+    def __get_salary_key(salary: dict) -> float:
+        """Возвращает зарплату ОТ в базовой валюте для сравнения вакансий (неизвестная - меньше любой)."""
+        salary_from, salary_to, currency = parse_salary(salary)
+        value = to_base(salary_from, currency)
+        return value if value is not None else float('-inf')
+
+    def to_dict(self) -> dict:
+        """Возвращает вакансию в формате хранилища."""
+        return {"id": self.vacancy_id,
+                "profession": self.profession,
+                "salary": self.salary,
+                "vacancy_url": self.vacancy_url,
+                "description": self.description,
+                }
 
     def add_user_vacancy_to_json(self, json_file):
         """Метод для добавления пользовательской вакансии в JSON файл."""
-        vacancy = [{"id": self.vacancy_id,
-                    "profession": self.profession,
-                    "salary": self.salary,
-                    "vacancy_url": self.vacancy_url,
-                    "description": self.description,
-                    }]
-        # используем метод класса JSONSaver для сохранения вакансии в рабочий JSON файл
-        self.add_vacancies(json_file, vacancy)
+        # используем хранилище, соответствующее рабочему файлу
+        get_saver(json_file).add_vacancies(json_file, [self.to_dict()])
 
     def delete_vacancy(self, json_file) -> None:
         """Метод для удаления вакансии из JSON файла и списка экземпляров."""
-        with open(json_file, 'r', encoding='utf-8') as f:
-            vacancies_list = json.load(f)
-            vacancies_list.pop()
-            with open(json_file, 'w', encoding='utf-8') as outfile:
-                json.dump(vacancies_list, outfile, ensure_ascii=False, indent=2)
-        self.all_added_vacancies.pop()  # удаляем из списка экземпляров
+        # удаляется именно эта вакансия (по ID), хранилище не переписывается целиком
+        get_saver(json_file).remove_vacancy(json_file, self.vacancy_id)
+        # экземпляры сравниваются по зарплате, поэтому ищем по идентичности, а не через list.remove
+        for index, vacancy in enumerate(self.all_added_vacancies):
+            if vacancy is self:
+                del self.all_added_vacancies[index]
+                break
         print("---------- Вакансия и экземпляр из списка удалены ----------\n")
 
     @classmethod
@@ -160,16 +1150,16 @@ class Vacancy(JSONSaver):
             print(vacancy_info)
 
     def __gt__(self, other):
-        """Сравнивает экземпляры класса по атрибуту salary"""
-        return self.salary["from"] > other.salary["from"]
+        """Сравнивает экземпляры класса по зарплате ОТ в базовой валюте"""
+        return self.salary_key > other.salary_key
 
     def __ge__(self, other):
-        """Сравнивает экземпляры класса по атрибуту subscriber_count."""
-        return self.salary["from"] >= other.salary["from"]
+        """Сравнивает экземпляры класса по зарплате ОТ в базовой валюте."""
+        return self.salary_key >= other.salary_key
 
     def __eq__(self, other):
-        """Сравнивает экземпляры класса по атрибуту subscriber_count."""
-        return self.salary["from"] == other.salary["from"]
+        """Сравнивает экземпляры класса по зарплате ОТ в базовой валюте."""
+        return self.salary_key == other.salary_key
 
     def __str__(self):
         vacancy_info = ('------------------\n'
@@ -192,52 +1182,124 @@ class HeadHunterAPI(APIVacancy, JSONSaver):
     """Класс для работы с вакансиями сайта HH.ru посредством API."""
     __slots__ = ()
 
-    def get_vacancies(self, query: str) -> None:
-        """По запросу пользователя добавляем найденные вакансии в JSON файл по шаблону."""
+    platform = 'hh'
+    title = 'HeadHunter'
+    api_url = 'https://api.hh.ru/vacancies'
+    # HH отдает не более 2000 записей: 20 страниц по 100 вакансий
+    max_pages = 20
+    max_found = max_pages * 100
+    # ограничение на кол-во одновременных запросов в параллельном режиме
+    max_workers = 5
+    # сбор по частям (sharded): период публикации, который делится на окна, и минимальная длина окна
+    shard_period = timedelta(days=30)
+    shard_min_window = timedelta(minutes=1)
+
+    def get_vacancies(self, query: str, concurrent: bool = False, max_workers: int | None = None,
+                      incremental: bool = False, parse_workers: int = 0, sharded: bool = False) -> None:
+        """
+        По запросу пользователя добавляем найденные вакансии в JSON файл по шаблону.
+
+        :param query: поисковый запрос
+        :param concurrent: загружать страницы параллельно (после первой страницы)
+        :param max_workers: максимальное кол-во одновременных запросов
+        :param incremental: записывать только новые и изменившиеся вакансии и прекращать загрузку
+            на первой странице без новых вакансий
+        :param parse_workers: разбирать ответы в пуле из parse_workers процессов (PagePipeline)
+        :param sharded: собирать больше 2000 вакансий, разбивая запрос на окна по дате публикации
+            (в инкрементальном режиме загрузка не прекращается досрочно: окна приходят в произвольном порядке)
+        """
         # ссылка на файл для работы
         working_file = self.get_working_file
+        saver = get_saver(working_file)
+        new = updated = skipped = 0
 
-        # проходим в цикле по страницам результата запроса (100 записей на 1 страницу)
-        for page in range(0, 20):
-            new_data = json.loads(self.__get_page(query, page))
+        # страницы записываются в хранилище пачками (группами), а не по одной
+        with GroupCommitWriter(saver, working_file) as writer:
+            for formatted_vacancies in self.iter_pages(query, concurrent, max_workers, parse_workers, sharded):
+                if not incremental:
+                    # записываем вакансии в хранилище, соответствующее рабочему файлу
+                    writer.add(formatted_vacancies)
+                    continue
 
-            # проверка на 2000 записей при 100 записях на 1 странице
-            # если кол-во страниц результата запроса равно значению "page"
-            # выходим из цикла
-            if new_data['pages'] == page:
-                break
+                page_new, page_updated, page_skipped = saver.merge_vacancies(working_file, formatted_vacancies)
+                new, updated, skipped = new + page_new, updated + page_updated, skipped + page_skipped
+                # на странице только известные вакансии - остальные страницы уже собраны ранее
+                if not page_new and not sharded:
+                    break
+        print(Saver.print_result(working_file))
+        if incremental:
+            print(Saver.print_merge_result(new, updated, skipped))
 
-            # список для форматированных вакансий
-            formatted_vacancies = []
-            for vacancy in new_data['items']:
-                vacancy_info = {
-                    "id": int(vacancy["id"]),
-                    "profession": vacancy["name"],
-                    # получаем зп, если есть, если нет - "Не указана"
-                    "salary": self.__get_hh_salary(vacancy),
-                    "vacancy_url": vacancy["alternate_url"],
-                    # получаем требования, если есть, если нет - "Не указаны"
-                    "description": self.__get_hh_description(vacancy),
+    def iter_pages(self, query: str, concurrent: bool = False, max_workers: int | None = None,
+                   parse_workers: int = 0, sharded: bool = False) -> Iterator[list]:
+        """
+        Загружает страницы результата запроса и возвращает вакансии каждой страницы в формате хранилища.
 
-                }
-                formatted_vacancies.append(vacancy_info)
+        :param query: поисковый запрос
+        :param concurrent: загружать страницы параллельно (после первой страницы)
+        :param max_workers: максимальное кол-во одновременных запросов
+        :param parse_workers: разбирать ответы в пуле из parse_workers процессов, пока загружаются следующие
+        :param sharded: разбивать запрос на окна по дате публикации (окна загружаются параллельно)
+        """
+        # синхронный API - обертка над асинхронным клиентом с общим пулом соединений
+        async_api = AsyncHeadHunterAPI(get_client())
+        if sharded:
+            yield from HeadHunterAPI.__iter_sharded_pages(async_api, query, max_workers, parse_workers)
+            return
+        if not parse_workers:
+            yield from iter_sync(async_api.iter_pages(query, concurrent, max_workers))
+            return
+        with PagePipeline(parse_workers) as pipeline:
+            yield from pipeline.run(iter_sync(async_api.iter_raw_pages(query, concurrent, max_workers)),
+                                    HeadHunterAPI.parse_page)
 
-            # вызываем статический метод класса для записи вакансий в файл
-            self.add_vacancies(working_file, formatted_vacancies)
-        print(Saver.print_result(working_file))
+    @staticmethod
+    def __iter_sharded_pages(async_api: 'AsyncHeadHunterAPI', query: str, max_workers: int | None,
+                             parse_workers: int) -> Iterator[list]:
+        """Страницы всех окон запроса без повторов: соседние окна пересекаются на границе."""
+        texts = iter_sync(async_api.iter_sharded_raw_pages(query, max_workers))
+        seen = set()
+        try:
+            with PagePipeline(parse_workers) as pipeline:
+                pages = (pipeline.run(texts, HeadHunterAPI.parse_page) if parse_workers
+                         else (HeadHunterAPI.parse_page(text) for text in texts))
+                for page in pages:
+                    unique = [vacancy for vacancy in page if vacancy["id"] not in seen]
+                    seen.update(vacancy["id"] for vacancy in unique)
+                    metrics.count('shard.duplicates', len(page) - len(unique))
+                    if unique:
+                        yield unique
+        finally:
+            texts.close()
 
     @staticmethod
-    def __get_page(query: str, page: int) -> str:
-        """Функция получает данные по вакансиям с необходимой страницы для дальнейшей работы."""
-        params = {
-            'text': f'NAME:{query}',
-            'page': page,
-            'per_page': 100,
-        }
+    def parse_page(text: str) -> list:
+        """Разбирает текст ответа API и возвращает вакансии страницы в формате хранилища."""
+        with metrics.timer('parse.json_loads'):
+            data = json.loads(text)
+        return HeadHunterAPI.format_vacancies(data['items'])
 
-        req = requests.get('https://api.hh.ru/vacancies', params)
-        data = req.content.decode()  # декодируем
-        return data
+    @staticmethod
+    @metrics.timed('normalize.hh')
+    def format_vacancies(items: list) -> list:
+        """Приводит вакансии страницы ответа API к формату хранилища."""
+        metrics.count('vacancies.normalized', len(items))
+        # список для форматированных вакансий
+        formatted_vacancies = []
+        for vacancy in items:
+            vacancy_info = {
+                "id": int(vacancy["id"]),
+                "profession": vacancy["name"],
+                # получаем зп, если есть, если нет - "Не указана"
+                "salary": HeadHunterAPI.__get_hh_salary(vacancy),
+                "vacancy_url": vacancy["alternate_url"],
+                # получаем требования, если есть, если нет - "Не указаны"
+                "description": HeadHunterAPI.__get_hh_description(vacancy),
+                # дата публикации - для срока хранения вакансий (RetentionPolicy)
+                "published_at": vacancy.get("published_at"),
+            }
+            formatted_vacancies.append(vacancy_info)
+        return formatted_vacancies
 
     @staticmethod
     def __get_hh_salary(vacancy: dict) -> str | dict:
@@ -271,49 +1333,87 @@ class SuperJobAPI(APIVacancy, JSONSaver):
     """Класс для работы с вакансиями сайта superjob.ru посредством API."""
     __slots__ = ()
 
+    platform = 'sj'
+    title = 'SuperJob'
+    api_url = 'https://api.superjob.ru/2.0/vacancies/'
+    # SuperJob отдает 5 страниц по 100 вакансий
+    max_pages = 5
     secret_key = os.getenv('sj_key')
 
-    def get_vacancies(self, query: str) -> None:
-        """По запросу пользователя добавляем найденные вакансии в JSON файл по шаблону."""
+    def get_vacancies(self, query: str, incremental: bool = False, parse_workers: int = 0) -> None:
+        """
+        По запросу пользователя добавляем найденные вакансии в JSON файл по шаблону.
+
+        :param query: поисковый запрос
+        :param incremental: записывать только новые и изменившиеся вакансии и прекращать загрузку
+            на первой странице без новых вакансий
+        :param parse_workers: разбирать ответы в пуле из parse_workers процессов (PagePipeline)
+        """
         # ссылка на файл для работы
         working_file = self.get_working_file
+        saver = get_saver(working_file)
+        new = updated = skipped = 0
 
-        # проходим в цикле по страницам результата запроса (100 записей на 1
-        # страницу)
-        for page in range(0, 5):
-            new_data = json.loads(self.__get_page(query, page))
-
-            # список для форматированных вакансий
-            formatted_vacancies = []
-            for vacancy in new_data['objects']:
-                vacancy_info = {
-                    "id": vacancy["id"],
-                    "profession": vacancy["profession"],
-
-                    "salary": self.__get_sj_salary(vacancy),
-                    "vacancy_url": vacancy["link"],
-                    "description": vacancy["candidat"],
-                }
-                formatted_vacancies.append(vacancy_info)
+        # страницы записываются в хранилище пачками (группами), а не по одной
+        with GroupCommitWriter(saver, working_file) as writer:
+            for formatted_vacancies in self.iter_pages(query, parse_workers):
+                if not incremental:
+                    # добавляем вакансии с каждой страницы запроса в хранилище
+                    writer.add(formatted_vacancies)
+                    continue
 
-            # открываем файл для добавления вакансий с каждой страницы запроса
-            # объекту "json_data"
-            self.add_vacancies(working_file, formatted_vacancies)
+                page_new, page_updated, page_skipped = saver.merge_vacancies(working_file, formatted_vacancies)
+                new, updated, skipped = new + page_new, updated + page_updated, skipped + page_skipped
+                # на странице только известные вакансии - остальные страницы уже собраны ранее
+                if not page_new:
+                    break
         print(Saver.print_result(working_file))
+        if incremental:
+            print(Saver.print_merge_result(new, updated, skipped))
+
+    def iter_pages(self, query: str, parse_workers: int = 0) -> Iterator[list]:
+        """Загружает страницы результата запроса и возвращает вакансии каждой страницы в формате хранилища."""
+        # синхронный API - обертка над асинхронным клиентом с общим пулом соединений
+        async_api = AsyncSuperJobAPI(get_client())
+        if not parse_workers:
+            yield from iter_sync(async_api.iter_pages(query))
+            return
+        with PagePipeline(parse_workers) as pipeline:
+            yield from pipeline.run(iter_sync(async_api.iter_raw_pages(query)), SuperJobAPI.parse_page)
 
     @staticmethod
-    def __get_page(query: str, page: int) -> str:
-        """Функция получает JSON данные по вакансиям с необходимой страницы для дальнейшей работы."""
-        headers = {'Host': 'api.superjob.ru',
-                   'X-Api-App-Id': SuperJobAPI.secret_key, }
-        params = {'keyword': query,
-                  'page': page,
-                  'count': 100}
+    def parse_page(text: str) -> list:
+        """Разбирает текст ответа API и возвращает вакансии страницы в формате хранилища."""
+        with metrics.timer('parse.json_loads'):
+            data = json.loads(text)
+        return SuperJobAPI.format_vacancies(data['objects'])
 
-        req = requests.get('https://api.superjob.ru/2.0/vacancies/',
-                           headers=headers, params=params)
-        data = req.content.decode()  # декодируем
-        return data
+    @staticmethod
+    @metrics.timed('normalize.sj')
+    def format_vacancies(objects: list) -> list:
+        """Приводит вакансии страницы ответа API к формату хранилища."""
+        metrics.count('vacancies.normalized', len(objects))
+        # список для форматированных вакансий
+        formatted_vacancies = []
+        for vacancy in objects:
+            vacancy_info = {
+                "id": vacancy["id"],
+                "profession": vacancy["profession"],
+
+                "salary": SuperJobAPI.__get_sj_salary(vacancy),
+                "vacancy_url": vacancy["link"],
+                "description": vacancy["candidat"],
+                "published_at": SuperJobAPI.__get_sj_published_at(vacancy),
+            }
+            formatted_vacancies.append(vacancy_info)
+        return formatted_vacancies
+
+    @staticmethod
+    def __get_sj_published_at(vacancy: dict) -> str | None:
+        """SuperJob отдает дату публикации как Unix-время - приводим к ISO 8601, как у HH."""
+        if not vacancy.get("date_published"):
+            return None
+        return datetime.fromtimestamp(vacancy["date_published"], timezone.utc).isoformat()
 
     @staticmethod
     def __get_sj_salary(vacancy: dict) -> str | dict:
@@ -330,3 +1430,212 @@ class SuperJobAPI(APIVacancy, JSONSaver):
                   "currency": currency, }
 
         return salary
+
+
+class AsyncHeadHunterAPI(AsyncAPIVacancy):
+    """Асинхронный клиент API HH.ru. Настройки и формат вакансий - как у HeadHunterAPI."""
+    __slots__ = ()
+
+    platform = HeadHunterAPI.platform
+    title = HeadHunterAPI.title
+
+    async def iter_pages(self, query: str, concurrent: bool = True,
+                         max_workers: int | None = None) -> AsyncIterator[list]:
+        """
+        Загружает первую страницу, чтобы узнать кол-во страниц, затем остальные.
+        Страницы возвращаются в порядке их номеров.
+
+        :param query: поисковый запрос
+        :param concurrent: загружать страницы после первой параллельно
+        :param max_workers: максимальное кол-во одновременных запросов этого поиска
+        """
+        first_page = await self.get_page(query, 0)
+        if not first_page['pages']:
+            return
+        yield HeadHunterAPI.format_vacancies(first_page['items'])
+
+        async for text in self.__iter_texts(query, first_page['pages'], concurrent, max_workers):
+            yield HeadHunterAPI.parse_page(text)
+
+    async def iter_raw_pages(self, query: str, concurrent: bool = True,
+                             max_workers: int | None = None) -> AsyncIterator[str]:
+        """Как iter_pages, но возвращает тексты ответов без разбора (для разбора в пуле процессов)."""
+        text = await self.get_page_text(query, 0)
+        # кол-во страниц есть только в ответе - первую страницу приходится разобрать здесь
+        with metrics.timer('parse.json_loads'):
+            pages = json.loads(text)['pages']
+        if not pages:
+            return
+        yield text
+
+        async for text in self.__iter_texts(query, pages, concurrent, max_workers):
+            yield text
+
+    async def iter_sharded_raw_pages(self, query: str, max_workers: int | None = None) -> AsyncIterator[str]:
+        """
+        Загружает больше вакансий, чем HH отдает по одному запросу (max_found): запрос выполняется
+        по окнам даты публикации за shard_period. Окно, в котором найдено больше max_found вакансий,
+        делится пополам, пока не уложится в ограничение или не станет короче shard_min_window.
+        Окна загружаются одновременно (не более max_workers запросов), тексты ответов возвращаются
+        по мере загрузки. Вакансии на границе соседних окон могут повторяться.
+        """
+        semaphore = asyncio.Semaphore(max_workers or HeadHunterAPI.max_workers)
+        texts = asyncio.Queue()
+
+        async def get_limited_page(page: int, window: tuple) -> str:
+            async with semaphore:
+                return await self.get_page_text(query, page, window)
+
+        async def collect(window: tuple) -> None:
+            text = await get_limited_page(0, window)
+            with metrics.timer('parse.json_loads'):
+                first_page = json.loads(text)
+
+            date_from, date_to = window
+            if first_page['found'] > HeadHunterAPI.max_found:
+                if date_to - date_from > HeadHunterAPI.shard_min_window:
+                    middle = (date_from + (date_to - date_from) / 2).replace(microsecond=0)
+                    metrics.count('shard.splits')
+                    halves = [asyncio.ensure_future(collect(half)) for half in ((date_from, middle), (middle, date_to))]
+                    try:
+                        await asyncio.gather(*halves)
+                    finally:
+                        # при ошибке в одной половине или отмене сбора вторую не продолжаем
+                        for task in halves:
+                            task.cancel()
+                    return
+                # окно нельзя делить дальше - вакансии сверх max_found будут потеряны
+                metrics.count('shard.truncated', first_page['found'] - HeadHunterAPI.max_found)
+            if not first_page['pages']:
+                return
+            metrics.count('shard.windows')
+            await texts.put(text)
+
+            pages = min(first_page['pages'], HeadHunterAPI.max_pages)
+            tasks = [asyncio.ensure_future(get_limited_page(page, window)) for page in range(1, pages)]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    await texts.put(await task)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        date_to = datetime.now(timezone.utc).replace(microsecond=0)
+        collector = asyncio.ensure_future(collect((date_to - HeadHunterAPI.shard_period, date_to)))
+        collector.add_done_callback(lambda _: texts.put_nowait(None))
+        try:
+            while (text := await texts.get()) is not None:
+                yield text
+            # ошибки загрузки окон
+            await collector
+        finally:
+            collector.cancel()
+
+    parse_page = staticmethod(HeadHunterAPI.parse_page)
+
+    async def __iter_texts(self, query: str, pages: int, concurrent: bool,
+                           max_workers: int | None) -> AsyncIterator[str]:
+        """Загружает страницы после первой и возвращает тексты ответов в порядке номеров."""
+        # HH отдает не более max_pages страниц по 100 вакансий
+        pages = min(pages, HeadHunterAPI.max_pages)
+        if not concurrent:
+            for page in range(1, pages):
+                yield await self.get_page_text(query, page)
+            return
+
+        semaphore = asyncio.Semaphore(max_workers or HeadHunterAPI.max_workers)
+
+        async def get_limited_page(page: int) -> str:
+            async with semaphore:
+                return await self.get_page_text(query, page)
+
+        tasks = [asyncio.ensure_future(get_limited_page(page)) for page in range(1, pages)]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            # при досрочной остановке (инкрементальный режим) оставшиеся страницы не загружаем
+            for task in tasks:
+                task.cancel()
+
+    async def get_page(self, query: str, page: int) -> dict:
+        """Получает данные по вакансиям с необходимой страницы."""
+        text = await self.get_page_text(query, page)
+        with metrics.timer('parse.json_loads'):
+            return json.loads(text)
+
+    async def get_page_text(self, query: str, page: int, window: tuple | None = None) -> str:
+        """
+        Получает текст ответа с необходимой страницы (из кэша, если ответ уже загружался).
+
+        :param window: (date_from, date_to) - только вакансии, опубликованные в этом окне
+        """
+        params = {
+            'text': f'NAME:{query}',
+            'page': page,
+            'per_page': 100,
+        }
+        cache_query = query
+        if window:
+            params['date_from'], params['date_to'] = (date.isoformat() for date in window)
+            cache_query = f'{query} [{params["date_from"]} - {params["date_to"]}]'
+
+        cache = HeadHunterAPI.cache
+        if cache and (data := cache.get(self.platform, cache_query, page, 100)) is not None:
+            metrics.count('cache.hits')
+            return data
+
+        data = await self.get_text(HeadHunterAPI.api_url, params)
+        if cache:
+            metrics.count('cache.misses')
+            cache.set(self.platform, cache_query, page, 100, data)
+        return data
+
+
+class AsyncSuperJobAPI(AsyncAPIVacancy):
+    """Асинхронный клиент API superjob.ru. Настройки и формат вакансий - как у SuperJobAPI."""
+    __slots__ = ()
+
+    platform = SuperJobAPI.platform
+    title = SuperJobAPI.title
+
+    async def iter_pages(self, query: str) -> AsyncIterator[list]:
+        """Загружает страницы результата запроса параллельно и возвращает их в порядке номеров."""
+        async for text in self.iter_raw_pages(query):
+            yield SuperJobAPI.parse_page(text)
+
+    async def iter_raw_pages(self, query: str) -> AsyncIterator[str]:
+        """Как iter_pages, но возвращает тексты ответов без разбора (для разбора в пуле процессов)."""
+        tasks = [asyncio.ensure_future(self.get_page_text(query, page)) for page in range(0, SuperJobAPI.max_pages)]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    parse_page = staticmethod(SuperJobAPI.parse_page)
+
+    async def get_page(self, query: str, page: int) -> dict:
+        """Получает JSON данные по вакансиям с необходимой страницы."""
+        text = await self.get_page_text(query, page)
+        with metrics.timer('parse.json_loads'):
+            return json.loads(text)
+
+    async def get_page_text(self, query: str, page: int) -> str:
+        """Получает текст ответа с необходимой страницы (из кэша, если ответ уже загружался)."""
+        cache = SuperJobAPI.cache
+        if cache and (data := cache.get(self.platform, query, page, 100)) is not None:
+            metrics.count('cache.hits')
+            return data
+
+        headers = {'Host': 'api.superjob.ru',
+                   'X-Api-App-Id': SuperJobAPI.secret_key or '', }
+        params = {'keyword': query,
+                  'page': page,
+                  'count': 100}
+        data = await self.get_text(SuperJobAPI.api_url, params, headers)
+        if cache:
+            metrics.count('cache.misses')
+            cache.set(self.platform, query, page, 100, data)
+        return data
@@ -0,0 +1,118 @@
+import argparse
+
+from config.analytics import salary_report
+from config.batch import DEFAULT_RATE_LIMITS, run_batch
+from config.classes import JSONSaver, convert_store, get_saver
+from config.importer import format_import_report, import_vacancies
+from config.metrics import metrics
+from config.ranking import SALARY_KEYS
+from config.retention import RetentionPolicy
+from config.server import serve
+
+
+def rate_limit(value: str) -> tuple[str, float]:
+    """Разбирает ограничение частоты запросов вида "hh=5" в пару (платформа, запросов в секунду)."""
+    platform, separator, rate = value.partition('=')
+    platform = platform.strip()
+    if not separator or platform not in DEFAULT_RATE_LIMITS:
+        raise argparse.ArgumentTypeError(f'Ограничение частоты должно быть в формате ПЛАТФОРМА=N, платформа - '
+                                         f'одна из {", ".join(DEFAULT_RATE_LIMITS)}: {value!r}')
+    try:
+        rate = float(rate)
+    except ValueError:
+        rate = None
+    if rate is None or not 0 < rate < float('inf'):
+        raise argparse.ArgumentTypeError(f'Частота запросов должна быть положительным числом: {value!r}')
+    return platform, rate
+
+
+def retention_value(value: str) -> str:
+    """Проверяет значение --ttl (ПЛАТФОРМА=ДНЕЙ) при разборе аргументов: ошибка печатается как ошибка argparse."""
+    try:
+        RetentionPolicy.parse([value])
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+    return value
+
+
+def get_retention(values: list[str]) -> RetentionPolicy:
+    """Сроки хранения из параметров --ttl, а без них - из переменной окружения retention_days."""
+    return RetentionPolicy.parse(values) if values else RetentionPolicy.from_env()
+
+
+def run_cli(args: list[str]) -> None:
+    """Неинтерактивные команды: python main.py <команда> [параметры]."""
+    parser = argparse.ArgumentParser(prog='main.py', description='Парсер вакансий HH и SuperJob')
+    parser.add_argument('--metrics', nargs='?', const='', metavar='ФАЙЛ',
+                        help='собирать метрики этапов; в конце печатаются итоги, в ФАЙЛ (.json или '
+                             'текстовый формат Prometheus) записываются все значения')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    batch = subparsers.add_parser('batch', help='собрать вакансии по списку запросов из файла')
+    batch.add_argument('queries_file', help='файл с запросами, по одному на строку')
+    batch.add_argument('--file', help='файл хранилища вакансий (по умолчанию - рабочий файл)')
+    batch.add_argument('--platforms', nargs='+', choices=('hh', 'sj'), help='платформы (по умолчанию - все)')
+    batch.add_argument('--workers', type=int, default=4, help='кол-во одновременно выполняемых запросов')
+    batch.add_argument('--rate', action='append', default=[], type=rate_limit, metavar='ПЛАТФОРМА=N',
+                       help='не более N запросов в секунду к платформе, например hh=5')
+    batch.add_argument('--batch-size', type=int, default=1000, help='кол-во вакансий в одной записи в хранилище')
+    batch.add_argument('--parse-workers', type=int, default=0,
+                       help='кол-во процессов для разбора ответов (0 - разбор в потоке загрузки)')
+    batch.add_argument('--compact-interval', type=float, default=0, metavar='СЕКУНД',
+                       help='сжимать хранилище в фоне каждые СЕКУНД секунд (0 - не сжимать)')
+    batch.add_argument('--ttl', action='append', default=[], type=retention_value, metavar='ПЛАТФОРМА=ДНЕЙ',
+                       help='срок хранения вакансий платформы при сжатии, например hh=30 '
+                            '(по умолчанию - из переменной окружения retention_days)')
+
+    stats = subparsers.add_parser('stats', help='статистика зарплат по собранным вакансиям')
+    stats.add_argument('--file', help='файл хранилища вакансий (по умолчанию - рабочий файл)')
+    stats.add_argument('--key', choices=list(SALARY_KEYS), default='normalized', help='ключ зарплаты')
+    stats.add_argument('--keywords', nargs='+', default=[], help='ключевые слова в наименовании вакансии')
+    stats.add_argument('--bins', type=int, default=10, help='кол-во интервалов гистограммы')
+
+    convert = subparsers.add_parser('convert', help='перенести вакансии в хранилище другого формата')
+    convert.add_argument('source_file', help='исходное хранилище')
+    convert.add_argument('target_file', help='новое хранилище, формат - по расширению '
+                                             '(.json, .jsonl, .sqlite, .json.gz, .msgpack, .vcol)')
+
+    compact = subparsers.add_parser('compact', help='убрать из хранилища удаленные, повторяющиеся и устаревшие '
+                                                    'вакансии')
+    compact.add_argument('--file', help='файл хранилища вакансий (по умолчанию - рабочий файл)')
+    compact.add_argument('--ttl', action='append', default=[], type=retention_value, metavar='ПЛАТФОРМА=ДНЕЙ',
+                         help='срок хранения вакансий платформы с даты публикации, например hh=30 или *=60 '
+                              '(по умолчанию - из переменной окружения retention_days)')
+
+    importer = subparsers.add_parser('import', help='добавить вакансии из CSV или JSON Lines файла')
+    importer.add_argument('source_file', help='файл вакансий: .csv со столбцами id, profession, salary, '
+                                              'vacancy_url, description или JSON Lines с теми же полями')
+    importer.add_argument('--file', help='файл хранилища вакансий (по умолчанию - рабочий файл)')
+    importer.add_argument('--max-errors', type=int, default=100, help='сколько ошибок по строкам напечатать')
+
+    server = subparsers.add_parser('serve', help='локальный HTTP/JSON сервер запросов к хранилищу')
+    server.add_argument('--file', help='файл хранилища вакансий (по умолчанию - рабочий файл)')
+    server.add_argument('--host', default='127.0.0.1', help='адрес сервера')
+    server.add_argument('--port', type=int, default=8080, help='порт сервера')
+    server.add_argument('--batch-size', type=int, default=1,
+                        help='кол-во изменений, записываемых в файл одной пачкой (остаток - при остановке)')
+
+    options = parser.parse_args(args)
+    if options.metrics is not None:
+        metrics.enable(options.metrics or None)
+    if options.command == 'batch':
+        run_batch(options.queries_file, options.file, options.platforms, options.workers,
+                  dict(options.rate), options.batch_size, options.parse_workers,
+                  options.compact_interval, get_retention(options.ttl))
+    elif options.command == 'stats':
+        print(salary_report(options.file or JSONSaver.working_file, options.key, options.keywords, options.bins))
+    elif options.command == 'convert':
+        count = convert_store(options.source_file, options.target_file)
+        print(f'Перенесено вакансий: {count} ({options.source_file} -> {options.target_file})')
+    elif options.command == 'compact':
+        json_file = options.file or JSONSaver.working_file
+        count = get_saver(json_file).compact(json_file, get_retention(options.ttl))
+        print(f'Вакансий после сжатия: {count} ({json_file})')
+    elif options.command == 'import':
+        report = import_vacancies(options.source_file, options.file or JSONSaver.working_file, options.max_errors)
+        print(format_import_report(report))
+    elif options.command == 'serve':
+        serve(options.file or JSONSaver.working_file, options.host, options.port, options.batch_size)
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from config.classes import APIVacancy, JSONSaver, Saver, get_saver
+
+
+class MultiPlatformCollector(APIVacancy, JSONSaver, register=False):
+    """
+    Сбор вакансий по одному запросу со всех зарегистрированных платформ (реализаций APIVacancy).
+
+    Платформы опрашиваются параллельно, поэтому время сбора определяется самой медленной из них.
+    Вакансии всех платформ имеют одинаковый формат и записываются в хранилище одним пакетом.
+    """
+    __slots__ = ('sources',)
+
+    platform = 'all'
+    title = 'Все платформы'
+
+    def __init__(self, sources: list[APIVacancy] | None = None):
+        super().__init__()
+        self.sources = sources if sources is not None else [platform() for platform in APIVacancy.platforms]
+
+    def get_vacancies(self, query: str) -> None:
+        """По запросу пользователя собираем вакансии со всех платформ и добавляем их в файл одной записью."""
+        working_file = self.get_working_file
+        vacancies = []
+        for platform, found in self.collect(query):
+            print(f'{platform.title}: найдено вакансий - {len(found)}')
+            vacancies.extend(found)
+
+        if vacancies:
+            get_saver(working_file).add_vacancies(working_file, vacancies)
+        print(Saver.print_result(vacancies))
+
+    def iter_pages(self, query: str) -> Iterator[list]:
+        """Возвращает вакансии каждой платформы как отдельную страницу."""
+        for platform, found in self.collect(query):
+            yield found
+
+    def collect(self, query: str) -> list[tuple[APIVacancy, list]]:
+        """
+        Параллельно загружает вакансии со всех платформ.
+
+        :return: список пар (платформа, вакансии) в порядке регистрации платформ;
+            ошибка одной платформы не прерывает сбор с остальных
+        """
+        results = []
+        with ThreadPoolExecutor(max_workers=len(self.sources) or 1) as executor:
+            futures = [(platform, executor.submit(platform.fetch_vacancies, query)) for platform in self.sources]
+            for platform, future in futures:
+                try:
+                    results.append((platform, future.result()))
+                except Exception as error:
+                    print(f'{platform.title}: ошибка сбора вакансий - {error!r}')
+                    results.append((platform, []))
+        return results
@@ -0,0 +1,182 @@
+from array import array
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from config.currency import get_rate
+
+# значение зарплаты ОТ/ДО, которая не указана
+MISSING = -1
+# код валюты вакансии без зарплаты ("Не указана")
+NO_SALARY = -1
+
+
+class VacancyColumns:
+    """
+    Компактное колоночное представление большого набора вакансий.
+
+    ID и зарплаты хранятся в массивах NumPy (int64, отсутствующая зарплата - MISSING), валюта - кодом
+    (int16) в списке уникальных валют, поэтому на вакансию не создается отдельный словарь.
+    Фильтрация, сортировка и топ N выполняются над массивами целиком и возвращают массивы индексов;
+    в прежний формат словаря вакансии преобразуются только при выводе (iter_dicts).
+    """
+    __slots__ = ('ids', 'salary_from', 'salary_to', 'currency_codes', 'currencies', 'professions',
+                 'vacancy_urls', 'descriptions', 'published_at')
+
+    def __init__(self, ids: np.ndarray, salary_from: np.ndarray, salary_to: np.ndarray,
+                 currency_codes: np.ndarray, currencies: list[str], professions: list[str],
+                 vacancy_urls: list[str], descriptions: list[str], published_at: list[str | None]):
+        self.ids = ids
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.currency_codes = currency_codes
+        self.currencies = currencies
+        self.professions = professions
+        self.vacancy_urls = vacancy_urls
+        self.descriptions = descriptions
+        # дата публикации; None - у вакансии нет этого поля
+        self.published_at = published_at
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[dict]) -> 'VacancyColumns':
+        """Собирает колонки из вакансий в формате словарей за один проход (подходит для генераторов)."""
+        ids = array('q')
+        salary_from = array('q')
+        salary_to = array('q')
+        currency_codes = array('h')
+        currencies = {}
+        professions, vacancy_urls, descriptions, published_at = [], [], [], []
+
+        for vacancy in vacancies:
+            ids.append(int(vacancy["id"]))
+            salary = vacancy["salary"]
+            if salary == "Не указана":
+                salary_from.append(MISSING)
+                salary_to.append(MISSING)
+                currency_codes.append(NO_SALARY)
+            else:
+                # зарплата 0 у SuperJob означает, что значение не указано
+                salary_from.append(int(salary["from"]) if salary["from"] else MISSING)
+                salary_to.append(int(salary["to"]) if salary["to"] else MISSING)
+                currency = salary["currency"].upper()
+                currency_codes.append(currencies.setdefault(currency, len(currencies)))
+            professions.append(vacancy["profession"])
+            vacancy_urls.append(vacancy["vacancy_url"])
+            descriptions.append(vacancy["description"])
+            published_at.append(vacancy.get("published_at"))
+
+        return cls(np.frombuffer(ids, dtype=np.int64), np.frombuffer(salary_from, dtype=np.int64),
+                   np.frombuffer(salary_to, dtype=np.int64), np.frombuffer(currency_codes, dtype=np.int16),
+                   list(currencies), professions, vacancy_urls, descriptions, published_at)
+
+    @classmethod
+    def from_store(cls, json_file) -> 'VacancyColumns':
+        """Загружает вакансии из хранилища потоково, не создавая полный список словарей."""
+        # config.classes сам ранжирует вакансии через колонки, поэтому импортируется при вызове
+        from config.classes import get_saver
+        return cls.from_vacancies(get_saver(json_file).iter_vacancies(json_file))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def take(self, indices: np.ndarray) -> 'VacancyColumns':
+        """Возвращает новый набор из вакансий с переданными индексами (в их порядке)."""
+        return VacancyColumns(self.ids[indices], self.salary_from[indices], self.salary_to[indices],
+                              self.currency_codes[indices], self.currencies,
+                              [self.professions[i] for i in indices], [self.vacancy_urls[i] for i in indices],
+                              [self.descriptions[i] for i in indices], [self.published_at[i] for i in indices])
+
+    # маски для фильтрации
+    def has_salary(self) -> np.ndarray:
+        return self.currency_codes != NO_SALARY
+
+    def currency_mask(self, currency: str) -> np.ndarray:
+        currency = currency.upper()
+        if currency not in self.currencies:
+            return np.zeros(len(self), dtype=bool)
+        return self.currency_codes == self.currencies.index(currency)
+
+    def salary_from_mask(self, minimum: int) -> np.ndarray:
+        """Маска вакансий с указанной зарплатой ОТ не меньше minimum."""
+        return (self.salary_from != MISSING) & (self.salary_from >= minimum)
+
+    def profession_mask(self, text: str) -> np.ndarray:
+        """Маска вакансий, в наименовании которых есть text (без учета регистра)."""
+        professions = np.char.lower(np.array(self.professions, dtype=str))
+        return np.char.find(professions, text.lower()) >= 0
+
+    def filter(self, mask: np.ndarray) -> np.ndarray:
+        """Возвращает индексы вакансий, подходящих под маску, в исходном порядке."""
+        return np.flatnonzero(mask)
+
+    def salary_values(self, key: str = 'from') -> np.ndarray:
+        """
+        Возвращает зарплату по ключу ('from', 'to', 'middle', 'normalized', см. ranking.SALARY_KEYS)
+        массивом float64, отсутствующие значения - NaN.
+        """
+        salary_from = np.where(self.salary_from == MISSING, np.nan, self.salary_from.astype(np.float64))
+        salary_to = np.where(self.salary_to == MISSING, np.nan, self.salary_to.astype(np.float64))
+        if key == 'from':
+            return salary_from
+        if key == 'to':
+            return salary_to
+
+        # середина вилки, а если указана только одна граница - она сама
+        middle = np.where(np.isnan(salary_from), salary_to,
+                          np.where(np.isnan(salary_to), salary_from, (salary_from + salary_to) / 2))
+        if key == 'middle':
+            return middle
+        if key == 'normalized':
+            rates = np.array([rate if (rate := get_rate(currency)) is not None else np.nan
+                              for currency in self.currencies] + [np.nan])
+            # код NO_SALARY (-1) указывает на последний элемент - NaN
+            return middle * rates[self.currency_codes]
+        raise ValueError(f"Неизвестный ключ сортировки зарплаты: {key}")
+
+    def sort(self, key: str = 'from') -> np.ndarray:
+        """Возвращает индексы вакансий с зарплатой по убыванию зарплаты; без значения по ключу - в конце."""
+        indices = np.flatnonzero(self.has_salary())
+        values = self.salary_values(key)[indices]
+        # устойчивая сортировка по убыванию: NaN заменяем на -inf, чтобы они оказались в конце
+        order = np.argsort(-np.nan_to_num(values, nan=-np.inf), kind='stable')
+        return indices[order]
+
+    def top_n(self, top_n: int, key: str = 'from') -> np.ndarray:
+        """Возвращает индексы top_n вакансий с наибольшей зарплатой по ключу за O(n) + O(N log N)."""
+        if top_n <= 0:
+            return np.array([], dtype=np.intp)
+        values = self.salary_values(key)
+        indices = np.flatnonzero(~np.isnan(values))
+        if top_n < len(indices):
+            # argpartition находит top_n-е по величине значение без полной сортировки;
+            # берем все вакансии не хуже него, чтобы при равных зарплатах побеждали более ранние
+            threshold = -np.partition(-values[indices], top_n - 1)[top_n - 1]
+            indices = indices[values[indices] >= threshold]
+        order = np.argsort(-values[indices], kind='stable')
+        return indices[order][:top_n]
+
+    def to_dict(self, index: int) -> dict:
+        """Преобразует вакансию с индексом index в прежний формат словаря."""
+        code = self.currency_codes[index]
+        if code == NO_SALARY:
+            salary = "Не указана"
+        else:
+            salary_from = int(self.salary_from[index])
+            salary_to = int(self.salary_to[index])
+            salary = {"from": salary_from if salary_from != MISSING else None,
+                      "to": salary_to if salary_to != MISSING else None,
+                      "currency": self.currencies[code]}
+        vacancy = {"id": int(self.ids[index]),
+                   "profession": self.professions[index],
+                   "salary": salary,
+                   "vacancy_url": self.vacancy_urls[index],
+                   "description": self.descriptions[index],
+                   }
+        if self.published_at[index] is not None:
+            vacancy["published_at"] = self.published_at[index]
+        return vacancy
+
+    def iter_dicts(self, indices: Iterable[int] | None = None) -> Iterator[dict]:
+        """Лениво преобразует вакансии (все или с переданными индексами) в формат словарей для печати."""
+        for index in (range(len(self)) if indices is None else indices):
+            yield self.to_dict(index)
@@ -0,0 +1,55 @@
+import threading
+
+from config.classes import get_saver
+from config.metrics import metrics
+from config.retention import RetentionPolicy
+
+
+class BackgroundCompactor:
+    """
+    Периодическое сжатие хранилища в фоновом потоке для долгого сбора вакансий: удаленные, повторяющиеся
+    и устаревшие по retention вакансии убираются каждые interval секунд, и размер хранилища не растет
+    бесконечно. Сжатие выполняется под блокировкой хранилища, запись сборщика на это время ждет.
+    Ошибка сжатия не останавливает сбор: она печатается, попытка повторяется через interval.
+    """
+    __slots__ = ('json_file', 'retention', 'interval', 'runs', '__stop', '__thread')
+
+    def __init__(self, json_file, retention: RetentionPolicy | None = None, interval: float = 3600.0):
+        self.json_file = json_file
+        self.retention = retention
+        self.interval = interval
+        self.runs = 0
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        self.__thread = threading.Thread(target=self.__run, name='compactor', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Останавливает поток, дожидаясь окончания текущего сжатия."""
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def compact(self) -> int:
+        """Сжимает хранилище сразу. Возвращает кол-во вакансий после сжатия."""
+        count = get_saver(self.json_file).compact(self.json_file, self.retention)
+        self.runs += 1
+        metrics.count('compact.runs')
+        return count
+
+    def __run(self) -> None:
+        while not self.__stop.wait(self.interval):
+            try:
+                self.compact()
+            except Exception as error:
+                print(f'Ошибка сжатия хранилища {self.json_file}: {error!r}')
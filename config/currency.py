@@ -0,0 +1,65 @@
+import json
+import os
+from functools import lru_cache
+
+# таблица курсов валют к базовой валюте: {"base": "RUB", "rates": {"USD": 90.0, ...}}
+RATES_FILE = os.getenv('rates_file', 'config/rates.json')
+# варианты написания валют, которые встречаются в API и пользовательском вводе
+ALIASES = {
+    'RUR': 'RUB',
+    'РУБ': 'RUB',
+    'BYN': 'BYR',
+}
+
+
+@lru_cache(maxsize=None)
+def load_rates(rates_file=RATES_FILE) -> tuple[str, dict[str, float]]:
+    """
+    Загружает таблицу курсов из файла один раз, повторные вызовы возвращают сохраненный результат.
+    Чтобы перечитать измененный файл, нужно вызвать load_rates.cache_clear().
+
+    :return: базовая валюта и курсы валют к ней
+    """
+    with open(rates_file, 'r', encoding='utf-8') as f:
+        table = json.load(f)
+    return table["base"], {currency.upper(): float(rate) for currency, rate in table["rates"].items()}
+
+
+def get_base_currency() -> str:
+    return load_rates()[0]
+
+
+@lru_cache(maxsize=None)
+def get_rate(currency: str) -> float | None:
+    """Возвращает курс валюты к базовой валюте или None, если курс неизвестен."""
+    currency = currency.upper()
+    return load_rates()[1].get(ALIASES.get(currency, currency))
+
+
+def to_base(amount: int | float | str | None, currency: str | None) -> float | None:
+    """Переводит сумму в базовую валюту. Возвращает None, если сумма или курс неизвестны."""
+    if amount is None or currency is None:
+        return None
+    rate = get_rate(currency)
+    if rate is None:
+        return None
+    return float(amount) * rate
+
+
+def parse_salary(salary: dict | str) -> tuple[float | None, float | None, str | None]:
+    """
+    Разбирает зарплату вакансии в числа: (от, до, валюта).
+    Для "Не указана", пустых и нулевых значений (SuperJob) соответствующие элементы - None.
+    """
+    if salary == "Не указана":
+        return None, None, None
+    salary_from = float(salary["from"]) if salary["from"] else None
+    salary_to = float(salary["to"]) if salary["to"] else None
+    return salary_from, salary_to, salary["currency"]
+
+
+def salary_middle(salary_from: float | None, salary_to: float | None) -> float | None:
+    """Середина вилки, а если указана только одна граница - она сама."""
+    if salary_from is not None and salary_to is not None:
+        return (salary_from + salary_to) / 2
+    return salary_from if salary_from is not None else salary_to
@@ -0,0 +1,180 @@
+import gzip
+import json
+import zipfile
+from abc import ABC, abstractmethod
+
+try:
+    import msgpack
+except ImportError:
+    # формат msgpack необязателен: pip install msgpack
+    msgpack = None
+
+# расширение файла -> формат
+FORMATS = {}
+
+
+class StoreFormat(ABC):
+    """
+    Формат сериализации файла хранилища вакансий.
+
+    Формат отвечает только за представление списка вакансий в файле; запись под блокировкой
+    и поисковый индекс выполняет FormatSaver. Новый формат - подкласс с расширениями файла в extensions,
+    он регистрируется в FORMATS автоматически.
+    """
+    extensions = ()
+    # формат умеет читать отдельные поля и вакансии, не разбирая весь файл
+    columnar = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for extension in cls.extensions:
+            FORMATS[extension] = cls
+
+    @classmethod
+    @abstractmethod
+    def dump(cls, vacancies: list, f) -> None:
+        """Записывает вакансии в открытый на запись бинарный файл."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def load(cls, json_file) -> list:
+        """Возвращает все вакансии из файла."""
+        pass
+
+    @classmethod
+    def load_fields(cls, json_file, fields: list[str]) -> dict[str, list]:
+        """Возвращает значения указанных полей всех вакансий (колонками)."""
+        vacancies = cls.load(json_file)
+        return {field: [vacancy[field] for vacancy in vacancies] for field in fields}
+
+    @classmethod
+    def load_rows(cls, json_file, rows: list[int]) -> list:
+        """Возвращает вакансии с переданными порядковыми номерами (в порядке rows)."""
+        vacancies = cls.load(json_file)
+        return [vacancies[row] for row in rows]
+
+
+class GzipJSONFormat(StoreFormat):
+    """Компактный JSON (без отступов и пробелов между элементами), сжатый gzip."""
+    extensions = ('.json.gz',)
+    compresslevel = 6
+
+    @classmethod
+    def dump(cls, vacancies: list, f) -> None:
+        # mtime=0 - одинаковые вакансии дают одинаковый файл
+        with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=cls.compresslevel, mtime=0) as gz:
+            gz.write(json.dumps(vacancies, ensure_ascii=False, separators=(',', ':')).encode())
+
+    @classmethod
+    def load(cls, json_file) -> list:
+        with gzip.open(json_file, 'rb') as gz:
+            return json.loads(gz.read())
+
+
+class MsgpackFormat(StoreFormat):
+    """Двоичный формат MessagePack (нужен пакет msgpack)."""
+    extensions = ('.msgpack',)
+
+    @classmethod
+    def dump(cls, vacancies: list, f) -> None:
+        cls.__check_module()
+        f.write(msgpack.packb(vacancies, use_bin_type=True))
+
+    @classmethod
+    def load(cls, json_file) -> list:
+        cls.__check_module()
+        with open(json_file, 'rb') as f:
+            return msgpack.unpackb(f.read(), raw=False)
+
+    @staticmethod
+    def __check_module() -> None:
+        if msgpack is None:
+            raise ImportError("Для формата .msgpack установите пакет msgpack: pip install msgpack")
+
+
+class ColumnarFormat(StoreFormat):
+    """
+    Колоночный формат: zip-архив, в котором каждое поле вакансий хранится отдельным сжатым
+    элементом '<поле>.json' - JSON-массивом значений в порядке вакансий, по одному значению в строке.
+    Если поле есть не у всех вакансий, номера строк без него записываются в элемент '<поле>.absent'
+    (в колонке у них null), и при чтении такие вакансии возвращаются без этого поля.
+
+    Запрос, которому нужны только ID или зарплата, распаковывает и разбирает только эти колонки,
+    а из остальных колонок (наименования и описания - большая часть файла) разбираются
+    только строки выбранных вакансий.
+    """
+    extensions = ('.vcol',)
+    columnar = True
+    suffix = '.json'
+    absent_suffix = '.absent'
+
+    @classmethod
+    def dump(cls, vacancies: list, f) -> None:
+        fields = list(dict.fromkeys(field for vacancy in vacancies for field in vacancy))
+        with zipfile.ZipFile(f, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for field in fields:
+                values = ',\n'.join(json.dumps(vacancy.get(field), ensure_ascii=False) for vacancy in vacancies)
+                archive.writestr(field + cls.suffix, f'[\n{values}\n]')
+                absent = [row for row, vacancy in enumerate(vacancies) if field not in vacancy]
+                if absent:
+                    archive.writestr(field + cls.absent_suffix, json.dumps(absent))
+
+    @classmethod
+    def load(cls, json_file) -> list:
+        with zipfile.ZipFile(json_file) as archive:
+            fields = cls.__fields(archive)
+            columns = {field: json.loads(archive.read(field + cls.suffix)) for field in fields}
+            absent = cls.__absent(archive, fields)
+        vacancies = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        for field, rows in absent.items():
+            for row in rows:
+                del vacancies[row][field]
+        return vacancies
+
+    @classmethod
+    def load_fields(cls, json_file, fields: list[str]) -> dict[str, list]:
+        """См. StoreFormat.load_fields. В пустом хранилище колонок нет - их значения пустые списки."""
+        with zipfile.ZipFile(json_file) as archive:
+            names = set(archive.namelist())
+            return {field: json.loads(archive.read(field + cls.suffix)) if field + cls.suffix in names else []
+                    for field in fields}
+
+    @classmethod
+    def load_rows(cls, json_file, rows: list[int]) -> list:
+        wanted = set(rows)
+        with zipfile.ZipFile(json_file) as archive:
+            fields = cls.__fields(archive)
+            absent = cls.__absent(archive, fields)
+            columns = {}
+            for field in fields:
+                # колонка распаковывается целиком, но разбираются только нужные строки (первая строка - '[')
+                lines = archive.read(field + cls.suffix).split(b'\n')
+                columns[field] = {row: json.loads(lines[row + 1].rstrip(b',')) for row in wanted
+                                  if row not in absent.get(field, ())}
+        return [{field: values[row] for field, values in columns.items() if row in values} for row in rows]
+
+    @classmethod
+    def fields(cls, json_file) -> list[str]:
+        """Возвращает названия полей, сохраненных в файле, в порядке записи."""
+        with zipfile.ZipFile(json_file) as archive:
+            return cls.__fields(archive)
+
+    @classmethod
+    def __fields(cls, archive: zipfile.ZipFile) -> list[str]:
+        return [name[:-len(cls.suffix)] for name in archive.namelist() if name.endswith(cls.suffix)]
+
+    @classmethod
+    def __absent(cls, archive: zipfile.ZipFile, fields: list[str]) -> dict[str, set[int]]:
+        """Номера строк без поля для полей, которые есть не у всех вакансий."""
+        names = set(archive.namelist())
+        return {field: set(json.loads(archive.read(field + cls.absent_suffix))) for field in fields
+                if field + cls.absent_suffix in names}
+
+
+def get_format(json_file) -> type[StoreFormat] | None:
+    """Возвращает формат по расширению файла или None, если у файла собственный класс хранилища."""
+    for extension, store_format in FORMATS.items():
+        if json_file.endswith(extension):
+            return store_format
+    return None
@@ -1,121 +1,152 @@
+from itertools import chain, islice
+from typing import Iterable
+
+from config.analytics import salary_report
 from config.classes import *
+from config.collector import MultiPlatformCollector
+from config.metrics import metrics
+from config.ranking import SALARY_KEYS
+from config.repository import VacancyRepository
+
+# кол-во вакансий на одной странице при просмотре длинных списков в меню
+PAGE_SIZE = 20
 
 
 def user_interaction(json_file) -> None:
     """Пользовательский интерфейс."""
     added_vacancies = Vacancy.all_added_vacancies
-    print("------------------\n"
-          "Доступные действия:\n"
-          "1. Показать все собранные вакансии\n"
-          "2. Показать вакансию по ID\n"
-          "3. Показать топ N вакансий\n"
-          "4. Сортировать по наличию зарплаты в вакансии\n"
-          "5. Удалить вакансию из собранных по его ID\n"
-          "6. Добавить вакансию в список")  # Vacancy.
-    if added_vacancies:
-        print("7. - показать все добавленные вакансии\n"
-              "8. - удалить последнюю добавленную вакансию")
-    print("0. Выход\n")
-    user_move = check_choice()  # проверка выбранного действия
+    # вакансии читаются из файла один раз на всю сессию, изменения записываются пачками
+    repository = VacancyRepository(json_file)
     while True:
+        print("------------------\n"
+              "Доступные действия:\n"
+              "1. Показать все собранные вакансии\n"
+              "2. Показать вакансию по ID\n"
+              "3. Показать топ N вакансий по зарплате\n"
+              "4. Сортировать вакансии с указанной зарплатой\n"
+              "5. Удалить вакансию из собранных по его ID\n"
+              "6. Добавить вакансию в список")  # Vacancy.
+        if added_vacancies:
+            print("7. - показать все добавленные вакансии\n"
+                  "8. - удалить последнюю добавленную вакансию")
+        print("9. Статистика зарплат\n"
+              "10. Поиск вакансий по ключевым словам\n"
+              "11. Фильтр вакансий по валюте, зарплате и наименованию\n"
+              "0. Выход\n")
+        user_move = check_choice()  # проверка выбранного действия
         if user_move == 1:
-            show_vacancies(json_file)
-            user_interaction(json_file)
+            show_vacancies(repository)
         elif user_move == 2:
-            show_vacancy_by_id(json_file)
-            user_interaction(json_file)
+            show_vacancy_by_id(repository)
         elif user_move == 3:
             top_n = get_top_n()
-            show_vacancies(json_file, top_n)
-            user_interaction(json_file)
+            key = get_salary_key()
+            show_vacancies(repository, top_n, key)
         elif user_move == 4:
-            vacancies = sort_by_salary(json_file)
+            vacancies = sort_by_salary(repository, get_salary_key())
             if vacancies:
-                print_vacancies(vacancies)
+                print_pages(vacancies)
             else:
                 print("Нет вакансий с указанной зарплатой.")
-            user_interaction(json_file)
         elif user_move == 5:
-            delete_vacancy_by_id(json_file)
-            user_interaction(json_file)
+            delete_vacancy_by_id(repository)
         elif user_move == 6:
             vacancy = add_vacancy()
-            vacancy.add_user_vacancy_to_json(json_file)
-            user_interaction(json_file)
+            repository.add([vacancy.to_dict()])
         elif user_move == 7:
             if len(added_vacancies) >= 1:
                 Vacancy.show_vacancies()
-                user_interaction(json_file)
-            else:
-                user_interaction(json_file)
         elif user_move == 8:
             if len(added_vacancies) >= 1:
+                # удаление идет мимо репозитория: сначала записываем его изменения,
+                # измененный файл репозиторий перечитает сам
+                repository.flush()
                 last_vac = added_vacancies[-1]
                 last_vac.delete_vacancy(json_file)
-                user_interaction(json_file)
-            else:
-                user_interaction(json_file)
+        elif user_move == 9:
+            repository.flush()
+            show_salary_stats(json_file)
+        elif user_move == 10:
+            repository.flush()
+            search_vacancies(json_file)
+        elif user_move == 11:
+            show_filtered_vacancies(repository)
         elif user_move == 0:
-            quit()
+            repository.flush()
+            break
         else:
             print("Не то число")
-            user_interaction(json_file)
 
 
-def get_platform() -> HeadHunterAPI | SuperJobAPI:
+def get_platform() -> HeadHunterAPI | SuperJobAPI | MultiPlatformCollector:
     """Выбор платформы поиска вакансий."""
-    platforms = (HeadHunterAPI(), SuperJobAPI())
+    platforms = (HeadHunterAPI(), SuperJobAPI(), MultiPlatformCollector())
     print("Выберите платформу сбора вакансий: ")
-    print("1. HeadHunter\n2. SuperJob\n")
+    print("1. HeadHunter\n2. SuperJob\n3. Все платформы одновременно\n")
 
     validated_platform = None
     validate = False
     while not validate:
         input_platform = input("Введите номер платформы: ")
         if not input_platform.isdigit():
-            print("Введите число 1 для HH или 2 для SuperJob цифрами")
-        elif not int(input_platform) in (1, 2):
-            print("Введите число 1 для HH или 2 для SuperJob")
+            print("Введите число 1 для HH, 2 для SuperJob или 3 для всех платформ цифрами")
+        elif not int(input_platform) in (1, 2, 3):
+            print("Введите число 1 для HH, 2 для SuperJob или 3 для всех платформ")
         else:
             validated_platform = int(input_platform)
             validate = True
     # создаем объект для работы с API
-    if validated_platform == 1:
-        return platforms[0]
-    return platforms[1]
+    return platforms[validated_platform - 1]
 
 
-def show_vacancies(json_file, top_n=0) -> None:
+def show_vacancies(repository: VacancyRepository, top_n=0, key='from') -> None:
     """
-    Печатает вакансии из файла
-    :param json_file: JSON файл c вакансиями
-    :param top_n: необходимое кол-во вакансий для печати
+    Печатает вакансии из хранилища
+    :param repository: загруженное хранилище вакансий
+    :param top_n: необходимое кол-во вакансий с наибольшей зарплатой для печати
+    :param key: ключ сравнения зарплаты для топ N (см. ranking.SALARY_KEYS)
     :return: None
     """
-    with open(json_file, 'r', encoding='utf-8') as f:
-        vacancies = json.load(f)
-        if top_n > 0:
-            top_n_vacancies = []
-            count = 0
-            for vacancy in vacancies:
-                if count == top_n:
-                    break
-                top_n_vacancies.append(vacancy)
-                count += 1
-
-            print_vacancies(top_n_vacancies)
-
-        else:
-            print_vacancies(vacancies)
-
-
-def print_vacancies(vacancies: list) -> None:
+    if top_n > 0:
+        with metrics.timer('query.top_vacancies'):
+            vacancies = repository.top_vacancies(top_n, key)
+        print_vacancies(vacancies)
+    else:
+        with metrics.timer('query.list_vacancies'):
+            vacancies = iter(repository)
+        # ожидание ввода между страницами не входит во время запроса
+        print_pages(vacancies)
+
+
+def print_pages(vacancies: Iterable[dict], page_size: int = PAGE_SIZE) -> None:
     """
-    Печать вакансий из необходимого списка с вакансиями
-    :param vacancies: вакансии из списка
+    Печатает вакансии страницами по page_size, следующая страница - по запросу пользователя
+    :param vacancies: вакансии из списка или генератора, следующая страница читается только по запросу
+    :param page_size: кол-во вакансий на странице
     :return: печать
     """
-    for vacancy in vacancies:
+    vacancies = iter(vacancies)
+    end = object()
+    # первая вакансия страницы читается заранее, чтобы знать, есть ли следующая страница
+    held = next(vacancies, end)
+    while held is not end:
+        # цепочка создается заново для каждой страницы поверх одного итератора, а не вкладывается в прежнюю
+        print_vacancies(chain((held,), vacancies), page_size)
+        held = next(vacancies, end)
+        if held is end:
+            return
+        if input(f"Enter - следующие {page_size} вакансий, 0 - закончить просмотр: ").strip() == '0':
+            return
+
+
+def print_vacancies(vacancies: Iterable[dict], limit: int | None = None) -> None:
+    """
+    Печать вакансий из необходимого списка (или потока) с вакансиями
+    :param vacancies: вакансии из списка или генератора, читаются по мере печати
+    :param limit: максимальное кол-во вакансий для печати, после него чтение прекращается
+    :return: печать
+    """
+    for vacancy in islice(vacancies, limit):
         salary = get_salary(vacancy)
         vacancy_info = ('------------------\n'
                         f'ID вакансии: {vacancy["id"]}\n'
@@ -141,65 +172,97 @@ def get_salary(vacancy: dict) -> str:
     return f'\t{salary}'
 
 
-def show_vacancy_by_id(json_file) -> None:
+def show_vacancy_by_id(repository: VacancyRepository) -> None:
     """
     Функция для показа вакансии по его ID.
 
-    :param json_file: JSON файл с вакансиями
+    :param repository: загруженное хранилище вакансий
     :return: принт вакансии
     """
-    with open(json_file, 'r', encoding='utf-8') as f:
-        vacancies_list = json.load(f)
-        validate_id = False
-
-        while not validate_id:
-            id_vacancy = check_id()  # получаем ID вакансии
-            for index, vacancy in enumerate(vacancies_list):
-                if vacancy["id"] == id_vacancy:
-                    salary = get_salary(vacancy)
-                    print('------------------\n'
-                          f'ID вакансии: {vacancy["id"]}\n'
-                          f'Наименование вакансии: {vacancy["profession"]}\n'
-                          f'Зарплата: \n{salary}'
-                          f'\nСсылка: {vacancy["vacancy_url"]}\n'
-                          f'Описание: {vacancy["description"]}\n')
-                    validate_id = True
-                    break
-            else:
-                print("Такого ID нет в вакансиях")
+    validate_id = False
+
+    while not validate_id:
+        id_vacancy = check_id()  # получаем ID вакансии
+        with metrics.timer('query.find_vacancy'):
+            vacancy = repository.get(id_vacancy)
+        if vacancy:
+            salary = get_salary(vacancy)
+            print('------------------\n'
+                  f'ID вакансии: {vacancy["id"]}\n'
+                  f'Наименование вакансии: {vacancy["profession"]}\n'
+                  f'Зарплата: \n{salary}'
+                  f'\nСсылка: {vacancy["vacancy_url"]}\n'
+                  f'Описание: {vacancy["description"]}\n')
+            validate_id = True
+        else:
+            print("Такого ID нет в вакансиях")
 
 
-def delete_vacancy_by_id(json_file) -> None:
+def delete_vacancy_by_id(repository: VacancyRepository) -> None:
     """
     Функция для удаления вакансии по его ID.
 
-    :param json_file: JSON файл с вакансиями
-    :return: JSON файл с удаленной вакансией
+    :param repository: загруженное хранилище вакансий
+    :return: вакансия удаляется из хранилища (в файл записывается пачкой с другими изменениями)
     """
-    with open(json_file, 'r', encoding='utf-8') as f:
-        vacancies_list = json.load(f)
-        validate_id = False
-
-        while not validate_id:
-            id_vacancy = check_id()  # получаем ID вакансии
-            for index, vacancy in enumerate(vacancies_list):
-                if vacancy["id"] == id_vacancy:
-                    vacancies_list.pop(index)
-                    validate_id = True
-                    break
-            else:
-                print("Такого индекса нет в вакансиях")
+    validate_id = False
+
+    while not validate_id:
+        id_vacancy = check_id()  # получаем ID вакансии
+        with metrics.timer('query.remove_vacancy'):
+            removed = repository.remove(id_vacancy)
+        if removed:
+            validate_id = True
+        else:
+            print("Такого индекса нет в вакансиях")
 
-        with open(json_file, 'w', encoding='utf-8') as outfile:
-            json.dump(vacancies_list, outfile, ensure_ascii=False, indent=2)
 
+def sort_by_salary(repository: VacancyRepository, key='from') -> list:
+    """Возвращает список вакансий с указанной зарплатой, отсортированный по убыванию по ключу key"""
+    with metrics.timer('query.salary_vacancies'):
+        sorted_vacancies = repository.salary_vacancies(key)
+    return sorted_vacancies
 
-def sort_by_salary(json_file) -> list:
-    """Возвращает отсортированный список вакансий с указанной зарплатой"""
-    with open(json_file, 'r', encoding='utf-8') as f:
-        vacancies = json.load(f)
-        sorted_vacancies = [salary for salary in vacancies if salary["salary"] != "Не указана"]
-        return sorted_vacancies
+
+def show_filtered_vacancies(repository: VacancyRepository) -> None:
+    """
+    Печатает вакансии, подходящие под введенные условия (пустой ввод - условие не применяется).
+
+    :param repository: загруженное хранилище вакансий
+    :return: печать
+    """
+    currency = input("Валюта зарплаты, например RUB (Enter - любая): ").strip()
+    salary_from = get_salary_from()
+    profession = input("Слово из наименования вакансии (Enter - любое): ").strip()
+    with metrics.timer('query.filter_vacancies'):
+        vacancies = repository.filter_vacancies(currency or None, salary_from, profession or None)
+    if vacancies:
+        print_pages(vacancies)
+    else:
+        print("Нет вакансий, подходящих под условия.")
+
+
+def show_salary_stats(json_file) -> None:
+    """Печатает статистику зарплат по собранным вакансиям с разбивкой по ключевым словам."""
+    key = get_salary_key()
+    keywords = input("Ключевые слова для статистики через пробел (Enter - без них): ").split()
+    with metrics.timer('query.salary_stats'):
+        report = salary_report(json_file, key, keywords)
+    print(report)
+
+
+def search_vacancies(json_file) -> None:
+    """Ищет вакансии по ключевым словам в наименовании и описании."""
+    query = input("Введите ключевые слова (OR между словами - любое из них): ").strip()
+    if not query:
+        print("Пустой запрос.")
+        return
+    with metrics.timer('query.search'):
+        vacancies = get_saver(json_file).search_vacancies(json_file, query)
+    if vacancies:
+        print_pages(vacancies)
+    else:
+        print("Ничего не найдено.")
 
 
 def add_vacancy() -> Vacancy:
@@ -247,6 +310,38 @@ def get_top_n() -> int:
     return validated_top_n
 
 
+def get_salary_from() -> int | None:
+    """Функция для валидации минимальной зарплаты ОТ в фильтре вакансий."""
+    while True:
+        input_salary = input("Минимальная зарплата ОТ (только из цифр, Enter - любая): ").strip()
+        if not input_salary:
+            return None
+        if input_salary.isdigit():
+            return int(input_salary)
+        print("Зарплата ОТ может состоять из цифр")
+
+
+def get_salary_key() -> str:
+    """Функция для выбора ключа сравнения зарплаты при сортировке и поиске топ N вакансий."""
+    keys = list(SALARY_KEYS)
+    for number, key in enumerate(keys, start=1):
+        print(f"{number}. {SALARY_KEYS[key]}")
+
+    validated_key = ''
+    validate = False
+    while not validate:
+        input_key = input("Выберите, по какой зарплате сравнивать: ")
+        if not input_key.isdigit():
+            print("Введите номер ключа цифрами")
+        elif not 1 <= int(input_key) <= len(keys):
+            print(f"Введите число от 1 до {len(keys)}")
+        else:
+            validated_key = keys[int(input_key) - 1]
+            validate = True
+
+    return validated_key
+
+
 def check_id() -> int:
     """Функция для валидации ID вакансии."""
     validated_id = ''
@@ -0,0 +1,91 @@
+import csv
+import json
+from typing import Iterator
+
+from config.classes import Vacancy, get_saver
+from config.metrics import metrics
+
+# столбцы CSV файла импорта (первая строка файла - заголовок с этими именами)
+IMPORT_FIELDS = ('id', 'profession', 'salary', 'vacancy_url', 'description')
+
+
+def read_rows(source_file) -> Iterator[tuple[int, dict | ValueError]]:
+    """
+    Построчно читает файл импорта: CSV (.csv) или JSON Lines (одна вакансия на строку).
+
+    :return: пары (номер строки, поля вакансии); для строки JSON Lines, которую не удалось
+             разобрать, вместо полей возвращается ошибка разбора
+    """
+    if str(source_file).endswith('.csv'):
+        with open(source_file, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                # ID из CSV приходит строкой: цифры приводятся к числу, остальное отклонит проверка
+                vacancy_id = (row.get('id') or '').strip()
+                row['id'] = int(vacancy_id) if vacancy_id.isdigit() else vacancy_id
+                yield reader.line_num, row
+    else:
+        with open(source_file, 'r', encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except ValueError as error:
+                    yield number, ValueError(f'Строка не в формате JSON: {error}')
+
+
+def import_vacancies(source_file, json_file, max_errors: int = 100) -> dict:
+    """
+    Импортирует пользовательские вакансии из CSV или JSON Lines файла.
+
+    Каждая строка проверяется по тем же правилам, что и при создании Vacancy, но экземпляры не создаются:
+    в памяти остаются только словари прошедших проверку вакансий, которые записываются в хранилище
+    одной пачкой. Строки с ошибками пропускаются.
+
+    :param max_errors: сколько ошибок сохранить в отчете (остальные только подсчитываются)
+    :return: {"imported": кол-во записанных, "rejected": кол-во отклоненных, "errors": [(номер строки, ошибка)]}
+    """
+    vacancies = []
+    vacancy_ids = set()
+    errors = []
+    rejected = 0
+    with metrics.timer('import.validate'):
+        for number, row in read_rows(source_file):
+            try:
+                if isinstance(row, Exception):
+                    raise row
+                if not isinstance(row, dict):
+                    raise ValueError('Вакансия должна быть объектом JSON')
+                missing = [field for field in IMPORT_FIELDS if row.get(field) in (None, '')]
+                if missing:
+                    raise KeyError(f'Не заполнены поля: {", ".join(missing)}')
+                vacancy = Vacancy.make_vacancy(*(row[field] for field in IMPORT_FIELDS))
+                if vacancy["id"] in vacancy_ids:
+                    raise ValueError(f'ID {vacancy["id"]} уже встречался в файле')
+            except (TypeError, ValueError, KeyError) as error:
+                rejected += 1
+                if len(errors) < max_errors:
+                    errors.append((number, error.args[0] if error.args else str(error)))
+                continue
+            vacancy_ids.add(vacancy["id"])
+            vacancies.append(vacancy)
+    metrics.count('import.rejected', rejected)
+
+    if vacancies:
+        saver = get_saver(json_file)
+        with metrics.timer('import.write'):
+            saver.check_file(json_file)
+            saver.add_vacancies(json_file, vacancies)
+    metrics.count('import.vacancies', len(vacancies))
+    return {"imported": len(vacancies), "rejected": rejected, "errors": errors}
+
+
+def format_import_report(report: dict) -> str:
+    """Текст отчета об импорте: итоги и ошибки по строкам."""
+    lines = [f'Импортировано вакансий: {report["imported"]}, отклонено строк: {report["rejected"]}']
+    for number, error in report["errors"]:
+        lines.append(f'  строка {number}: {error}')
+    if report["rejected"] > len(report["errors"]):
+        lines.append(f'  ... и еще ошибок: {report["rejected"] - len(report["errors"])}')
+    return '\n'.join(lines)
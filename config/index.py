@@ -0,0 +1,61 @@
+import os
+import sqlite3
+from typing import Iterator
+
+
+class VacancyIndex:
+    """
+    Постоянный индекс ID вакансии -> положение записи (смещение и длина в байтах) в JSONL хранилище.
+
+    Индекс хранится рядом с хранилищем в файле "<хранилище>.idx" (SQLite), поэтому поиск
+    вакансии по ID не требует чтения и разбора всего файла с вакансиями.
+    """
+    __slots__ = ('index_file', 'connection')
+    mmap_size = 256 * 1024 * 1024
+
+    def __init__(self, json_file):
+        self.index_file = f'{json_file}.idx'
+        self.connection = sqlite3.connect(self.index_file)
+        # индекс читается через отображение файла в память, страницы общие для всех процессов
+        self.connection.execute(f'PRAGMA mmap_size = {VacancyIndex.mmap_size}')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS positions '
+                                '(id INTEGER PRIMARY KEY, offset INTEGER NOT NULL, length INTEGER NOT NULL)')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS positions_offset ON positions (offset)')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # при ошибке изменения индекса откатываются целиком
+        if exc_type is None:
+            self.connection.commit()
+        else:
+            self.connection.rollback()
+        self.connection.close()
+
+    def get(self, vacancy_id: int) -> tuple[int, int] | None:
+        """Возвращает (смещение, длина) записи вакансии или None, если ID нет в индексе."""
+        return self.connection.execute('SELECT offset, length FROM positions WHERE id = ?',
+                                       (vacancy_id,)).fetchone()
+
+    def positions(self) -> Iterator[tuple[int, int]]:
+        """Возвращает (смещение, длина) всех записей в порядке их расположения в файле."""
+        return self.connection.execute('SELECT offset, length FROM positions ORDER BY offset')
+
+    def set_many(self, positions: list[tuple[int, int, int]]) -> None:
+        """Записывает положения вакансий в виде списка (ID, смещение, длина)."""
+        self.connection.executemany('INSERT OR REPLACE INTO positions (id, offset, length) VALUES (?, ?, ?)',
+                                    positions)
+
+    def delete(self, vacancy_id: int) -> None:
+        self.connection.execute('DELETE FROM positions WHERE id = ?', (vacancy_id,))
+
+    def clear(self) -> None:
+        self.connection.execute('DELETE FROM positions')
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM positions').fetchone()[0]
+
+    @staticmethod
+    def exists(json_file) -> bool:
+        return os.path.exists(f'{json_file}.idx')
@@ -0,0 +1,88 @@
+import json
+import mmap
+import os
+from typing import Iterator
+
+from config.index import VacancyIndex
+from config.ranking import sort_vacancies, top_vacancies
+
+
+class MappedStore:
+    """
+    Чтение JSONL хранилища через отображение файла в память (mmap) и индекс смещений VacancyIndex.
+
+    Открытие не читает файл: страницы подгружаются операционной системой при обращении и общие
+    для всех процессов, читающих хранилище. Разбираются только записи, к которым обращаются,
+    а для топ N и сортировки из каждой записи разбирается только зарплата.
+    Только для чтения: записи, дописанные после открытия, не видны.
+    """
+    __slots__ = ('json_file', '__file', '__map', '__index')
+    # ключ зарплаты в записи, как его пишет json.dumps; внутри строковых значений кавычки экранированы
+    salary_key = b'"salary": '
+    # длина фрагмента записи, в котором ищется конец значения зарплаты
+    salary_window = 256
+
+    def __init__(self, json_file):
+        self.json_file = json_file
+        self.__file = open(json_file, 'rb')
+        # пустой файл отобразить нельзя
+        self.__map = (mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+                      if os.fstat(self.__file.fileno()).st_size else b'')
+        self.__index = VacancyIndex(json_file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.__index.connection.close()
+        if isinstance(self.__map, mmap.mmap):
+            self.__map.close()
+        self.__file.close()
+
+    def __len__(self):
+        return len(self.__index)
+
+    def get(self, vacancy_id: int) -> dict | None:
+        """Возвращает вакансию по ID, разбирая только ее запись."""
+        position = self.__index.get(vacancy_id)
+        return self.__decode(*position) if position else None
+
+    def get_many(self, vacancy_ids: list[int]) -> list:
+        return [self.__decode(*position) for vacancy_id in vacancy_ids
+                if (position := self.__index.get(vacancy_id))]
+
+    def iter_vacancies(self) -> Iterator[dict]:
+        """Возвращает вакансии в порядке записи в файле, разбирая их по мере чтения."""
+        for offset, length in self.__index.positions():
+            yield self.__decode(offset, length)
+
+    def top_vacancies(self, top_n: int, key: str = 'from') -> list:
+        ranked = top_vacancies(self.__iter_salaries(), top_n, key)
+        return [self.__decode(*vacancy["position"]) for vacancy in ranked]
+
+    def salary_vacancies(self, key: str = 'from') -> list:
+        ranked = sort_vacancies(self.__iter_salaries(), key)
+        return [self.__decode(*vacancy["position"]) for vacancy in ranked]
+
+    def __decode(self, offset: int, length: int) -> dict:
+        return json.loads(self.__map[offset:offset + length])
+
+    def __iter_salaries(self) -> Iterator[dict]:
+        """Зарплаты вакансий с положением их записей - для ранжирования без разбора остальных полей."""
+        decoder = json.JSONDecoder()
+        for offset, length in self.__index.positions():
+            end = offset + length
+            start = self.__map.find(self.salary_key, offset, end)
+            try:
+                if start == -1:
+                    raise ValueError
+                start += len(self.salary_key)
+                fragment = self.__map[start:min(end, start + self.salary_window)].decode(errors='ignore')
+                salary = decoder.raw_decode(fragment)[0]
+            except ValueError:
+                # запись другого вида (например, добавлена вручную) - разбираем целиком
+                salary = self.__decode(offset, length)["salary"]
+            yield {"salary": salary, "position": (offset, length)}
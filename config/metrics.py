@@ -0,0 +1,194 @@
+import atexit
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+from config.storage import atomic_write
+
+
+class _NullTimer:
+    """Таймер выключенного сбора метрик: ничего не измеряет."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class _Timer:
+    __slots__ = ('metrics', 'stage', 'start')
+
+    def __init__(self, metrics: 'Metrics', stage: str):
+        self.metrics = metrics
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    Счетчики и таймеры этапов сбора вакансий и запросов меню.
+
+    Включается переменной окружения metrics=1 (или metrics_file=<путь>) либо вызовом enable().
+    Выключенный сбор стоит одну проверку флага: timer() возвращает общий пустой таймер, count()
+    сразу возвращается. При завершении процесса включенный сбор печатает итоги и, если задан файл,
+    записывает его в JSON ('.json') или в текстовом формате Prometheus (остальные расширения).
+    """
+    __slots__ = ('enabled', 'metrics_file', 'stages', 'counters', '__exit_registered', '__lock')
+    prefix = 'vacancies'
+
+    def __init__(self):
+        self.enabled = False
+        self.metrics_file = None
+        # этап -> [кол-во вызовов, суммарное время, максимальное время]
+        self.stages = {}
+        self.counters = {}
+        self.__exit_registered = False
+        # этапы измеряются и в потоке событийного цикла API, и в потоках конвейера
+        self.__lock = threading.Lock()
+
+    def enable(self, metrics_file=None) -> None:
+        self.enabled = True
+        self.metrics_file = metrics_file or self.metrics_file
+        if not self.__exit_registered:
+            atexit.register(self.report)
+            self.__exit_registered = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.stages = {}
+        self.counters = {}
+
+    def timer(self, stage: str) -> _Timer | _NullTimer:
+        """Контекстный менеджер, измеряющий время этапа stage."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage)
+
+    def timed(self, stage: str):
+        """Декоратор, измеряющий время каждого вызова функции как этап stage."""
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Timer(self, stage):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self.__lock:
+            values = self.stages.get(stage)
+            if values is None:
+                self.stages[stage] = [1, seconds, seconds]
+            else:
+                values[0] += 1
+                values[1] += seconds
+                if seconds > values[2]:
+                    values[2] = seconds
+
+    def count(self, name: str, value: int = 1) -> None:
+        if self.enabled:
+            with self.__lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, measured: tuple | None) -> None:
+        """Добавляет этапы и счетчики, измеренные в процессе пула (см. call_measured)."""
+        if not measured or not self.enabled:
+            return
+        stages, counters = measured
+        with self.__lock:
+            for stage, (calls, total, longest) in stages.items():
+                values = self.stages.get(stage)
+                if values is None:
+                    self.stages[stage] = [calls, total, longest]
+                else:
+                    values[0] += calls
+                    values[1] += total
+                    if longest > values[2]:
+                        values[2] = longest
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict:
+        return {"stages": {stage: {"calls": calls, "seconds": total, "max_seconds": longest}
+                           for stage, (calls, total, longest) in sorted(self.stages.items())},
+                "counters": dict(sorted(self.counters.items()))}
+
+    def to_prometheus(self) -> str:
+        """Возвращает метрики в текстовом формате Prometheus."""
+        lines = []
+        for suffix, kind, column in (('stage_calls_total', 'counter', 0), ('stage_seconds_total', 'counter', 1),
+                                     ('stage_seconds_max', 'gauge', 2)):
+            lines.append(f'# TYPE {self.prefix}_{suffix} {kind}')
+            for stage, values in sorted(self.stages.items()):
+                lines.append(f'{self.prefix}_{suffix}{{stage="{stage}"}} {values[column]:g}')
+        lines.append(f'# TYPE {self.prefix}_events_total counter')
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{self.prefix}_events_total{{name="{name}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """Возвращает итоги в виде таблицы для печати."""
+        lines = ['---------- Метрики ----------',
+                 f'{"этап":<32}{"вызовов":>10}{"всего, с":>12}{"среднее, мс":>14}{"макс, мс":>12}']
+        for stage, (calls, total, longest) in sorted(self.stages.items(), key=lambda item: -item[1][1]):
+            lines.append(f'{stage:<32}{calls:>10}{total:>12.3f}{total / calls * 1000:>14.2f}{longest * 1000:>12.2f}')
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{name:<32}{value:>10}')
+        return '\n'.join(lines)
+
+    def dump(self, metrics_file) -> None:
+        """Записывает метрики в файл целиком (атомарно, чтобы сборщик мониторинга не прочитал половину)."""
+        with atomic_write(metrics_file) as f:
+            if str(metrics_file).endswith('.json'):
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+    def report(self) -> None:
+        """Печатает итоги и записывает файл метрик (вызывается при завершении процесса)."""
+        if not self.enabled or not (self.stages or self.counters):
+            return
+        print(self.summary())
+        if self.metrics_file:
+            self.dump(self.metrics_file)
+
+
+metrics = Metrics()
+
+
+def call_measured(parent_pid: int, enabled: bool, function, *args) -> tuple:
+    """
+    Вызывает function(*args) в пуле процессов и возвращает (результат, метрики вызова).
+
+    Таймеры и счетчики дочернего процесса остаются в его копии metrics, поэтому измеренное за вызов
+    возвращается вместе с результатом и добавляется в metrics родителя через Metrics.merge.
+    В самом процессе parent_pid (пул потоков) метрики записываются напрямую и возвращается None.
+    """
+    if os.getpid() == parent_pid:
+        return function(*args), None
+    # процесс пула выполняет по одному вызову: метрики собираются заново для каждого
+    metrics.reset()
+    metrics.enabled = enabled
+    result = function(*args)
+    return result, (metrics.stages, metrics.counters) if enabled else None
+if os.getenv('metrics', '0') != '0' or os.getenv('metrics_file'):
+    metrics.enable(os.getenv('metrics_file'))
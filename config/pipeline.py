@@ -0,0 +1,94 @@
+import os
+import queue
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, Iterator
+
+from config.metrics import call_measured, metrics
+
+# признак окончания загрузки страниц в очереди конвейера
+_DONE = object()
+
+
+class PagePipeline:
+    """
+    Конвейер сбора: загрузка страниц отделена от разбора JSON и приведения вакансий к формату хранилища.
+
+    Поток загрузки читает ответы API и отдает их на разбор в пул процессов, будущие результаты
+    передаются через ограниченную очередь: если разбор не успевает, загрузка ждет свободного места,
+    а не копит ответы в памяти. Пока пул разбирает страницы, следующие страницы уже загружаются.
+    Результаты возвращаются в порядке страниц. Таймеры разбора (parse.*, normalize.*), измеренные
+    в процессах пула, добавляются в метрики родительского процесса вместе с результатом страницы.
+    """
+    __slots__ = ('max_workers', 'queue_size', '__executor')
+
+    def __init__(self, max_workers: int | None = None, queue_size: int | None = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size or 2 * self.max_workers
+        self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def executor(self) -> Executor:
+        """Пул процессов разбора; создается при первой странице."""
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(self.max_workers)
+        return self.__executor
+
+    def close(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(cancel_futures=True)
+            self.__executor = None
+
+    def run(self, raw_pages: Iterator[str], parse: Callable[[str], list]) -> Iterator[list]:
+        """
+        Разбирает страницы из raw_pages функцией parse в пуле процессов.
+
+        :param raw_pages: тексты ответов API (загрузка выполняется в отдельном потоке)
+        :param parse: функция уровня модуля или класса (передается в процессы пула)
+        :return: вакансии каждой страницы в формате хранилища
+        """
+        pages = queue.Queue(self.queue_size)
+        stop = threading.Event()
+
+        def download() -> None:
+            try:
+                for text in raw_pages:
+                    if stop.is_set():
+                        break
+                    metrics.count('pipeline.pages_downloaded')
+                    pages.put(self.executor.submit(call_measured, os.getpid(), metrics.enabled, parse, text))
+            except BaseException as error:
+                failed = Future()
+                failed.set_exception(error)
+                pages.put(failed)
+            finally:
+                close = getattr(raw_pages, 'close', None)
+                if close is not None:
+                    close()
+                pages.put(_DONE)
+
+        downloader = threading.Thread(target=download, daemon=True)
+        downloader.start()
+        try:
+            while (future := pages.get()) is not _DONE:
+                with metrics.timer('pipeline.wait_parse'):
+                    result, measured = future.result()
+                metrics.merge(measured)
+                yield result
+        finally:
+            # досрочная остановка (инкрементальный режим): освобождаем очередь, чтобы поток загрузки завершился
+            stop.set()
+            while downloader.is_alive():
+                try:
+                    future = pages.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if future is not _DONE:
+                    future.cancel()
+            downloader.join()
@@ -0,0 +1,108 @@
+import heapq
+from typing import Iterable
+
+import numpy as np
+
+from config.columns import VacancyColumns
+from config.currency import parse_salary, salary_middle, to_base
+
+# ключи ранжирования вакансий по зарплате
+SALARY_KEYS = {
+    'from': 'Зарплата ОТ',
+    'to': 'Зарплата ДО',
+    'middle': 'Середина вилки',
+    'normalized': 'Зарплата в базовой валюте (середина вилки по курсу)',
+}
+
+
+def salary_value(vacancy: dict, key: str = 'from') -> float | None:
+    """
+    Возвращает числовое значение зарплаты вакансии по выбранному ключу.
+
+    :param vacancy: вакансия в dict формате
+    :param key: 'from', 'to', 'middle' или 'normalized'
+    :return: значение зарплаты или None, если зарплата (или нужная ее часть) не указана
+    """
+    salary_from, salary_to, currency = parse_salary(vacancy["salary"])
+    if key == 'from':
+        return salary_from
+    if key == 'to':
+        return salary_to
+
+    middle = salary_middle(salary_from, salary_to)
+    if key == 'middle':
+        return middle
+    if key == 'normalized':
+        return to_base(middle, currency)
+    raise ValueError(f"Неизвестный ключ сортировки зарплаты: {key}")
+
+
+def top_vacancies(vacancies: Iterable[dict], top_n: int, key: str = 'from',
+                  columns: VacancyColumns | None = None) -> list:
+    """
+    Возвращает top_n вакансий с наибольшей зарплатой по ключу key.
+
+    Список вакансий ранжируется векторно по колонкам VacancyColumns (columns - уже собранные колонки
+    этого списка), а поток (генератор) читается за один проход, и в памяти держится только куча
+    из top_n элементов: O(n log N). Вакансии без значения зарплаты по ключу пропускаются.
+    """
+    if isinstance(vacancies, list):
+        columns = columns if columns is not None else VacancyColumns.from_vacancies(vacancies)
+        return [vacancies[index] for index in columns.top_n(top_n, key)]
+    ranked = ((value, vacancy) for vacancy in vacancies
+              if (value := salary_value(vacancy, key)) is not None)
+    return [vacancy for value, vacancy in heapq.nlargest(top_n, ranked, key=lambda item: item[0])]
+
+
+def sort_vacancies(vacancies: Iterable[dict], key: str = 'from', columns: VacancyColumns | None = None) -> list:
+    """
+    Сортирует вакансии с указанной зарплатой по убыванию зарплаты по ключу key.
+    Вакансии без значения по ключу (например, без зарплаты ДО) идут в конце.
+    Список вакансий сортируется векторно по колонкам, как в top_vacancies.
+    """
+    if isinstance(vacancies, list):
+        columns = columns if columns is not None else VacancyColumns.from_vacancies(vacancies)
+        return [vacancies[index] for index in columns.sort(key)]
+    ranked = [(salary_value(vacancy, key), vacancy) for vacancy in vacancies if vacancy["salary"] != "Не указана"]
+    ranked.sort(key=lambda item: (item[0] is not None, item[0] or 0), reverse=True)
+    return [vacancy for value, vacancy in ranked]
+
+
+def filter_vacancies(vacancies: Iterable[dict], currency: str | None = None, salary_from: int | None = None,
+                     profession: str | None = None, columns: VacancyColumns | None = None) -> list:
+    """
+    Возвращает вакансии, подходящие под все переданные условия, в исходном порядке.
+    Список вакансий фильтруется масками по колонкам, как в top_vacancies.
+
+    :param currency: код валюты зарплаты, например RUB
+    :param salary_from: минимальная зарплата ОТ
+    :param profession: подстрока в наименовании вакансии (без учета регистра)
+    """
+    if isinstance(vacancies, list):
+        columns = columns if columns is not None else VacancyColumns.from_vacancies(vacancies)
+        return [vacancies[index] for index in columns.filter(columns_mask(columns, currency, salary_from, profession))]
+
+    filtered = []
+    for vacancy in vacancies:
+        salary = vacancy["salary"] if vacancy["salary"] != "Не указана" else {}
+        if currency and (salary.get("currency") or '').upper() != currency.upper():
+            continue
+        if salary_from is not None and not (salary.get("from") and int(salary["from"]) >= salary_from):
+            continue
+        if profession and profession.lower() not in vacancy["profession"].lower():
+            continue
+        filtered.append(vacancy)
+    return filtered
+
+
+def columns_mask(columns: VacancyColumns, currency: str | None = None, salary_from: int | None = None,
+                 profession: str | None = None) -> np.ndarray:
+    """Маска вакансий в колонках, подходящих под все условия filter_vacancies."""
+    mask = np.ones(len(columns), dtype=bool)
+    if currency:
+        mask &= columns.currency_mask(currency)
+    if salary_from is not None:
+        mask &= columns.salary_from_mask(salary_from)
+    if profession:
+        mask &= columns.profession_mask(profession)
+    return mask
@@ -0,0 +1,238 @@
+import os
+from typing import Iterator
+
+from config.classes import get_saver
+from config.columns import VacancyColumns
+from config.metrics import metrics
+from config.ranking import filter_vacancies, salary_value, sort_vacancies
+from config.retention import Tombstones
+from config.storage import file_lock
+
+
+class VacancyRepository:
+    """
+    Хранилище вакансий в памяти процесса для интерактивной работы.
+
+    Вакансии читаются из файла один раз, поиск по ID и сортировки по зарплате обслуживаются
+    индексами в памяти. Изменения применяются в памяти и записываются в файл пачками
+    (после batch_size изменений или при вызове flush). Файл перечитывается, только если его
+    изменил кто-то другой (изменились время изменения, размер или inode); еще не записанные
+    изменения при этом применяются к свежей версии файла. Пачка из одних удалений в хранилищах
+    с отметками об удалении (Saver.tombstones) записывается отметками, без перезаписи файла.
+    Хранилища, выполняющие запросы сами (Saver.query_pushdown, например SQLite), получают фильтрацию,
+    сортировку и топ N напрямую, пока в памяти нет незаписанных изменений, - файл для этого не загружается.
+    """
+    __slots__ = ('json_file', 'saver', 'batch_size', 'refresh_on_read', '__vacancies', '__by_id', '__sorted',
+                 '__pending', '__signature', '__checked', '__columns')
+
+    def __init__(self, json_file, batch_size: int = 20, refresh_on_read: bool = True):
+        """
+        :param refresh_on_read: перечитывать измененный файл при чтении; без этого файл перечитывают только
+            warm, add, remove и flush (например, когда чтения идут параллельно под блокировкой чтения)
+        """
+        self.json_file = json_file
+        self.saver = get_saver(json_file)
+        self.batch_size = batch_size
+        self.refresh_on_read = refresh_on_read
+        self.__vacancies = []
+        self.__by_id = None
+        self.__sorted = {}
+        self.__columns = None
+        # изменения, еще не записанные в файл: ('add', [вакансии]) или ('remove', ID)
+        self.__pending = []
+        self.__signature = None
+        # файл хранилища проверен (создан при отсутствии) перед первым запросом к нему
+        self.__checked = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def __len__(self):
+        self.__refresh_for_read()
+        return len(self.__vacancies)
+
+    def __iter__(self) -> Iterator[dict]:
+        self.__refresh_for_read()
+        return iter(list(self.__vacancies))
+
+    def page(self, offset: int, limit: int) -> list:
+        """Возвращает limit вакансий начиная с offset в порядке хранилища, не копируя остальные."""
+        self.__refresh_for_read()
+        return self.__vacancies[offset:offset + limit]
+
+    def get(self, vacancy_id: int) -> dict | None:
+        self.__refresh_for_read()
+        return self.__ids().get(vacancy_id)
+
+    def salary_vacancies(self, key: str = 'from') -> list:
+        """Вакансии с указанной зарплатой по убыванию по ключу key (сортировка кэшируется до изменения)."""
+        if self.__pushdown():
+            return self.saver.salary_vacancies(self.json_file, key)
+        self.__refresh_for_read()
+        if key not in self.__sorted:
+            self.__sorted[key] = sort_vacancies(self.__vacancies, key, self.__vacancy_columns())
+        return self.__sorted[key]
+
+    def top_vacancies(self, top_n: int, key: str = 'from') -> list:
+        if self.__pushdown():
+            return self.saver.top_vacancies(self.json_file, top_n, key)
+        top = []
+        for vacancy in self.salary_vacancies(key):
+            # вакансии без значения зарплаты по ключу стоят в конце отсортированного списка
+            if len(top) >= top_n or salary_value(vacancy, key) is None:
+                break
+            top.append(vacancy)
+        return top
+
+    def filter_vacancies(self, currency: str | None = None, salary_from: int | None = None,
+                         profession: str | None = None) -> list:
+        """Вакансии, подходящие под все переданные условия, в порядке хранилища (см. ranking.filter_vacancies)."""
+        if self.__pushdown():
+            return self.saver.filter_vacancies(self.json_file, currency, salary_from, profession)
+        self.__refresh_for_read()
+        return filter_vacancies(self.__vacancies, currency, salary_from, profession, self.__vacancy_columns())
+
+    def add(self, vacancies: list) -> None:
+        self.__refresh()
+        self.__apply_add(vacancies)
+        self.__record(('add', vacancies))
+
+    def remove(self, vacancy_id: int) -> bool:
+        """Удаляет вакансию по ID. Возвращает True, если вакансия была удалена."""
+        self.__refresh()
+        vacancy = self.get(vacancy_id)
+        if vacancy is None:
+            return False
+        self.__apply_remove(vacancy_id)
+        self.__record(('remove', vacancy_id))
+        return True
+
+    def changed(self) -> bool:
+        """Изменился ли файл с момента последнего чтения или записи (следующее обращение перечитает его)."""
+        return self.__read_signature() != self.__signature
+
+    def warm(self, keys: tuple = ('from',)) -> None:
+        """Строит индекс ID и сортировки по ключам keys заранее, чтобы их не строил первый запрос."""
+        self.__refresh()
+        self.__ids()
+        if self.saver.query_pushdown:
+            # сортировки выполнит само хранилище
+            return
+        for key in keys:
+            self.salary_vacancies(key)
+
+    @metrics.timed('store.repository_flush')
+    def flush(self) -> None:
+        """Записывает накопленные изменения в файл."""
+        if not self.__pending:
+            return
+        with file_lock(self.json_file):
+            if self.__read_signature() != self.__signature:
+                # файл изменили другие процессы - применяем наши изменения к его текущей версии
+                self.__load()
+                for change in self.__pending:
+                    self.__apply(change)
+            self.__write()
+            self.__pending = []
+            self.__signature = self.__read_signature()
+
+    def __pushdown(self) -> bool:
+        """Можно ли выполнить запрос в самом хранилище: файл уже содержит все изменения из памяти."""
+        if not self.saver.query_pushdown or self.__pending:
+            return False
+        if not self.__checked:
+            self.saver.check_file(self.json_file)
+            self.__checked = True
+        return True
+
+    def __write(self) -> None:
+        if not self.saver.incremental_writes:
+            if self.saver.tombstones and all(operation == 'remove' for operation, value in self.__pending):
+                self.saver.tombstone_vacancies(self.json_file, [value for operation, value in self.__pending])
+            else:
+                self.saver.save_vacancies(self.json_file, self.__vacancies)
+            return
+        for operation, value in self.__pending:
+            if operation == 'add':
+                self.saver.add_vacancies(self.json_file, value)
+            else:
+                self.saver.remove_vacancy(self.json_file, value)
+
+    def __record(self, change: tuple) -> None:
+        self.__pending.append(change)
+        if len(self.__pending) >= self.batch_size:
+            self.flush()
+
+    def __refresh_for_read(self) -> None:
+        if self.refresh_on_read or self.__signature is None:
+            self.__refresh()
+
+    def __refresh(self) -> None:
+        """Перечитывает файл, если он изменился с момента последнего чтения или записи."""
+        signature = self.__read_signature()
+        if signature == self.__signature:
+            return
+        self.__load()
+        for change in self.__pending:
+            self.__apply(change)
+        self.__signature = signature
+
+    @metrics.timed('store.repository_load')
+    def __load(self) -> None:
+        self.saver.check_file(self.json_file)
+        self.__checked = True
+        self.__vacancies = self.saver.load_vacancies(self.json_file)
+        self.__invalidate()
+
+    def __apply(self, change: tuple) -> None:
+        operation, value = change
+        if operation == 'add':
+            self.__apply_add(value)
+        else:
+            self.__apply_remove(value)
+
+    def __apply_add(self, vacancies: list) -> None:
+        # как и add_vacancies хранилищ, заменяет прежние копии добавляемых ID (побеждает последняя запись)
+        self.__vacancies = self.saver.replace_vacancies(self.__vacancies, vacancies)
+        self.__invalidate()
+
+    def __apply_remove(self, vacancy_id: int) -> None:
+        # как и отметка об удалении, удаляет все записи с этим ID
+        self.__vacancies = [vacancy for vacancy in self.__vacancies if vacancy["id"] != vacancy_id]
+        self.__invalidate()
+
+    def __ids(self) -> dict:
+        if self.__by_id is None:
+            # индекс собирается целиком и только потом становится виден другим потокам
+            by_id = {}
+            for vacancy in self.__vacancies:
+                # как и в Saver.find_vacancy и после compact, при повторах ID находится последняя вакансия
+                by_id[vacancy["id"]] = vacancy
+            self.__by_id = by_id
+        return self.__by_id
+
+    def __vacancy_columns(self) -> VacancyColumns:
+        """Колонки вакансий для векторных сортировок и фильтров (собираются один раз до изменения)."""
+        if self.__columns is None:
+            self.__columns = VacancyColumns.from_vacancies(self.__vacancies)
+        return self.__columns
+
+    def __invalidate(self) -> None:
+        self.__by_id = None
+        self.__sorted = {}
+        self.__columns = None
+
+    def __read_signature(self) -> tuple:
+        signature = ()
+        # удаление другим процессом может изменить только файл отметок об удалении
+        for path in (self.json_file, Tombstones.path(self.json_file)):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                signature += (None,)
+            else:
+                signature += ((stat.st_mtime_ns, stat.st_size, stat.st_ino),)
+        return signature
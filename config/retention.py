@@ -0,0 +1,115 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator
+from urllib.parse import urlparse
+
+# сайт вакансии по адресу ссылки на нее (поддомены, например spb.hh.ru, относятся к тому же сайту)
+PLATFORM_HOSTS = {'hh.ru': 'hh', 'superjob.ru': 'sj'}
+
+
+def vacancy_platform(vacancy: dict) -> str | None:
+    """Возвращает платформу вакансии ('hh', 'sj') по ссылке или None для пользовательских вакансий."""
+    host = urlparse(vacancy.get("vacancy_url") or '').hostname or ''
+    for platform_host, platform in PLATFORM_HOSTS.items():
+        if host == platform_host or host.endswith('.' + platform_host):
+            return platform
+    return None
+
+
+class RetentionPolicy:
+    """
+    Срок хранения вакансий по платформам: вакансия устаревает, когда с ее публикации (поле published_at)
+    прошло больше срока ее платформы. Срок '*' действует для платформ без своего срока.
+    Вакансии без даты публикации (добавленные пользователем или собранные до ее появления) не устаревают.
+    """
+    __slots__ = ('ttl',)
+
+    def __init__(self, ttl: dict[str, timedelta] | None = None):
+        self.ttl = ttl or {}
+
+    def __bool__(self):
+        return bool(self.ttl)
+
+    @classmethod
+    def parse(cls, values: Iterable[str]) -> 'RetentionPolicy':
+        """
+        Создает политику из значений вида 'ПЛАТФОРМА=ДНЕЙ' (например, hh=30, sj=14, *=60).
+
+        :raises ValueError: значение не в формате ПЛАТФОРМА=ДНЕЙ (ДНЕЙ - неотрицательное число)
+        """
+        ttl = {}
+        for value in values:
+            platform, separator, days = value.partition('=')
+            if not separator or not platform.strip():
+                raise ValueError(f'Срок хранения должен быть в формате ПЛАТФОРМА=ДНЕЙ: {value!r}')
+            try:
+                days = float(days)
+            except ValueError:
+                days = None
+            if days is None or not 0 <= days < float('inf'):
+                raise ValueError(f'Срок хранения в днях должен быть неотрицательным числом: {value!r}')
+            ttl[platform.strip()] = timedelta(days=days)
+        return cls(ttl)
+
+    @classmethod
+    def from_env(cls) -> 'RetentionPolicy':
+        """Политика из переменной окружения retention_days, например 'hh=30,sj=14' (по умолчанию - без срока)."""
+        return cls.parse(value for value in os.getenv('retention_days', '').split(',') if value.strip())
+
+    def is_expired(self, vacancy: dict, now: datetime | None = None) -> bool:
+        ttl = self.ttl.get(vacancy_platform(vacancy), self.ttl.get('*'))
+        published_at = vacancy.get("published_at")
+        if ttl is None or not published_at:
+            return False
+        published_at = datetime.fromisoformat(published_at)
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=timezone.utc)
+        return (now or datetime.now(timezone.utc)) - published_at > ttl
+
+
+class Tombstones:
+    """
+    Отметки об удалении (tombstones) для хранилищ, которые перезаписываются целиком (JSON, компактные форматы).
+
+    Удаление дописывает ID вакансии в файл "<хранилище>.tomb" и стоит O(1) вместо перезаписи хранилища.
+    При чтении отмеченные вакансии пропускаются, а сами записи убираются при следующей полной
+    перезаписи хранилища (добавление, сохранение, сжатие), после чего файл отметок удаляется.
+    Изменять отметки нужно под блокировкой хранилища (file_lock).
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def path(json_file) -> str:
+        return f'{json_file}.tomb'
+
+    @staticmethod
+    def add(json_file, vacancy_ids: list) -> None:
+        with open(Tombstones.path(json_file), 'a', encoding='utf-8') as f:
+            f.writelines(json.dumps(vacancy_id) + '\n' for vacancy_id in vacancy_ids)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def load(json_file) -> set:
+        """Возвращает ID удаленных вакансий (пустое множество, если отметок нет)."""
+        try:
+            with open(Tombstones.path(json_file), 'r', encoding='utf-8') as f:
+                return {json.loads(line) for line in f if line.strip()}
+        except FileNotFoundError:
+            return set()
+
+    @staticmethod
+    def clear(json_file) -> None:
+        try:
+            os.remove(Tombstones.path(json_file))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def filter(json_file, vacancies: Iterable[dict]) -> Iterator[dict]:
+        """Пропускает вакансии, отмеченные удаленными."""
+        deleted = Tombstones.load(json_file)
+        if not deleted:
+            return iter(vacancies)
+        return (vacancy for vacancy in vacancies if vacancy["id"] not in deleted)
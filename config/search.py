@@ -0,0 +1,217 @@
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+from collections import Counter
+from typing import Iterable
+
+TOKEN_PATTERN = re.compile(r'[a-zа-я0-9]+(?:[+#]+|\.net)?')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+STOP_WORDS = {
+    # русские
+    'и', 'в', 'во', 'на', 'с', 'со', 'по', 'к', 'ко', 'от', 'до', 'для', 'из', 'за', 'о', 'об', 'не', 'или',
+    'а', 'но', 'что', 'как', 'при', 'у', 'же', 'бы', 'то', 'это', 'мы', 'вы', 'наш', 'ваш', 'лет', 'год',
+    # английские
+    'a', 'an', 'the', 'and', 'or', 'of', 'to', 'in', 'on', 'for', 'with', 'at', 'by', 'is', 'are', 'be', 'as',
+}
+# окончания, отбрасываемые при приведении слова к основе (от длинных к коротким)
+RU_ENDINGS = sorted({
+    'ами', 'ями', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими', 'ой', 'ей', 'ий', 'ый', 'ая', 'яя', 'ое', 'ее',
+    'ые', 'ие', 'ых', 'их', 'ую', 'юю', 'ам', 'ям', 'ах', 'ях', 'ом', 'ем', 'ов', 'ев', 'ия', 'ии', 'ию',
+    'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь',
+}, key=len, reverse=True)
+EN_ENDINGS = ('ing', 'ers', 'ed', 'er', 'es', 's')
+MIN_STEM = 3
+
+# параметры ранжирования BM25
+K1 = 1.2
+B = 0.75
+
+
+def stem(word: str) -> str:
+    """Упрощенно приводит русское или английское слово к основе, отбрасывая типичные окончания."""
+    endings = EN_ENDINGS if word.isascii() else RU_ENDINGS
+    for ending in endings:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM:
+            return word[:-len(ending)]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Разбивает текст на основы слов: без HTML тегов, в нижнем регистре, без стоп-слов."""
+    text = TAG_PATTERN.sub(' ', text).lower().replace('ё', 'е')
+    return [stem(token) for token in TOKEN_PATTERN.findall(text) if token not in STOP_WORDS]
+
+
+def document_text(vacancy: dict) -> str:
+    """Индексируемый текст вакансии: наименование и описание."""
+    return f'{vacancy["profession"]} {vacancy["description"]}'
+
+
+def document_record(vacancy: dict) -> str:
+    """Вакансия в том виде, в каком она хранится в индексе и возвращается поиском."""
+    return json.dumps(vacancy, ensure_ascii=False)
+
+
+def document_digest(text: str) -> int:
+    """Отпечаток индексируемого текста (64-битное целое со знаком, как INTEGER в SQLite)."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'big', signed=True)
+
+
+class SearchIndex:
+    """
+    Постоянный инвертированный индекс по наименованию и описанию вакансий для поиска по ключевым словам.
+
+    Хранится рядом с хранилищем в файле "<хранилище>.fts" (SQLite): для каждой основы слова - ID вакансий
+    и кол-во ее вхождений. Индекс пополняется при каждой записи вакансий в хранилище, поэтому поиск
+    не читает файл с вакансиями. Результаты ранжируются по BM25.
+
+    Для каждой вакансии хранится отпечаток ее текста: после перезаписи хранилища целиком (sync)
+    заново разбираются только новые и изменившиеся вакансии.
+
+    Вместе с документом хранится сама вакансия (и отпечаток ее записи), поэтому найденные вакансии
+    возвращаются из индекса, без поиска по файлу хранилища.
+    """
+    __slots__ = ('index_file', 'connection')
+
+    def __init__(self, json_file):
+        self.index_file = f'{json_file}.fts'
+        self.connection = sqlite3.connect(self.index_file)
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_id ON postings (id);
+            CREATE TABLE IF NOT EXISTS documents (id INTEGER PRIMARY KEY, length INTEGER NOT NULL, digest INTEGER,
+                                                  vacancy TEXT, record_digest INTEGER);
+        ''')
+        # индексы, созданные до появления отпечатков и записей вакансий: их вакансии переиндексируются
+        # (или только дописываются записи) при следующем sync, а до этого поиск находит их в хранилище
+        columns = {row[1] for row in self.connection.execute('PRAGMA table_info(documents)')}
+        for column, column_type in (('digest', 'INTEGER'), ('vacancy', 'TEXT'), ('record_digest', 'INTEGER')):
+            if column not in columns:
+                self.connection.execute(f'ALTER TABLE documents ADD COLUMN {column} {column_type}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.connection.commit()
+        else:
+            self.connection.rollback()
+        self.connection.close()
+
+    def add(self, vacancies: Iterable[dict]) -> None:
+        """Индексирует вакансии; прежние записи вакансий с теми же ID заменяются (при повторах ID - последней)."""
+        self.__add({vacancy["id"]: vacancy for vacancy in vacancies}.values())
+
+    def sync(self, vacancies: Iterable[dict]) -> tuple[int, int]:
+        """
+        Приводит индекс в соответствие с полным списком вакансий хранилища: индексирует новые вакансии
+        и вакансии с изменившимся текстом, удаляет из индекса отсутствующие в списке.
+
+        Вакансии, у которых изменились только поля вне текста (например, зарплата), не разбираются
+        заново - в индексе обновляется только их запись.
+
+        :return: кол-во проиндексированных и удаленных вакансий
+        """
+        digests = {vacancy_id: (digest, record_digest) for vacancy_id, digest, record_digest
+                   in self.connection.execute('SELECT id, digest, record_digest FROM documents')}
+        current = {}
+        for vacancy in vacancies:
+            current[vacancy["id"]] = vacancy
+        changed = []
+        records = []
+        for vacancy_id, vacancy in current.items():
+            digest, record_digest = digests.pop(vacancy_id, (None, None))
+            if digest != document_digest(document_text(vacancy)):
+                changed.append(vacancy)
+            elif record_digest != document_digest(record := document_record(vacancy)):
+                records.append((record, document_digest(record), vacancy_id))
+        self.remove(digests)
+        self.__add(changed)
+        self.connection.executemany('UPDATE documents SET vacancy = ?, record_digest = ? WHERE id = ?', records)
+        return len(changed), len(digests)
+
+    def __add(self, vacancies) -> None:
+        vacancies = list(vacancies)
+        self.remove(vacancy["id"] for vacancy in vacancies)
+
+        postings = []
+        documents = []
+        for vacancy in vacancies:
+            text = document_text(vacancy)
+            terms = Counter(tokenize(text))
+            postings.extend((term, vacancy["id"], tf) for term, tf in terms.items())
+            record = document_record(vacancy)
+            documents.append((vacancy["id"], sum(terms.values()), document_digest(text), record,
+                              document_digest(record)))
+        self.connection.executemany('INSERT INTO postings (term, id, tf) VALUES (?, ?, ?)', postings)
+        self.connection.executemany('INSERT INTO documents (id, length, digest, vacancy, record_digest) '
+                                    'VALUES (?, ?, ?, ?, ?)', documents)
+
+    def remove(self, vacancy_ids: Iterable[int]) -> None:
+        ids = [(vacancy_id,) for vacancy_id in vacancy_ids]
+        self.connection.executemany('DELETE FROM postings WHERE id = ?', ids)
+        self.connection.executemany('DELETE FROM documents WHERE id = ?', ids)
+
+    def clear(self) -> None:
+        self.connection.execute('DELETE FROM postings')
+        self.connection.execute('DELETE FROM documents')
+
+    def search(self, query: str, limit: int = 20) -> list[tuple[int, float]]:
+        """
+        Ищет вакансии по ключевым словам.
+
+        По умолчанию вакансия должна содержать все слова запроса (AND); слово OR (или ИЛИ)
+        между словами переключает поиск на любое из слов. Слово AND (или И) можно указывать явно.
+
+        :return: список (ID вакансии, релевантность) по убыванию релевантности
+        """
+        words = query.split()
+        any_word = any(word.upper() in ('OR', 'ИЛИ') for word in words)
+        terms = set(tokenize(' '.join(word for word in words if word.upper() not in ('OR', 'ИЛИ', 'AND', 'И'))))
+        if not terms:
+            return []
+
+        documents, total_length = self.connection.execute('SELECT COUNT(*), SUM(length) FROM documents').fetchone()
+        if not documents:
+            return []
+        average_length = total_length / documents
+
+        scores = {}
+        matched_terms = Counter()
+        for term in terms:
+            postings = self.connection.execute('SELECT p.id, p.tf, d.length FROM postings p '
+                                               'JOIN documents d ON d.id = p.id WHERE p.term = ?',
+                                               (term,)).fetchall()
+            idf = math.log(1 + (documents - len(postings) + 0.5) / (len(postings) + 0.5))
+            for vacancy_id, tf, length in postings:
+                score = idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average_length))
+                scores[vacancy_id] = scores.get(vacancy_id, 0.0) + score
+                matched_terms[vacancy_id] += 1
+
+        if not any_word:
+            scores = {vacancy_id: score for vacancy_id, score in scores.items()
+                      if matched_terms[vacancy_id] == len(terms)}
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def vacancies(self, vacancy_ids: list[int]) -> dict[int, dict]:
+        """Возвращает сохраненные в индексе вакансии по ID (ID без записи вакансии в ответ не попадают)."""
+        placeholders = ', '.join('?' * len(vacancy_ids))
+        rows = self.connection.execute(f'SELECT id, vacancy FROM documents WHERE id IN ({placeholders}) '
+                                       'AND vacancy IS NOT NULL', vacancy_ids)
+        return {vacancy_id: json.loads(vacancy) for vacancy_id, vacancy in rows}
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    @staticmethod
+    def exists(json_file) -> bool:
+        return os.path.exists(f'{json_file}.fts')
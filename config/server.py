@@ -0,0 +1,332 @@
+import json
+import re
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+
+from config.classes import get_saver
+from config.currency import parse_salary
+from config.metrics import metrics
+from config.ranking import SALARY_KEYS, salary_value
+from config.repository import VacancyRepository
+
+# поля вакансии в формате хранилища, обязательные при добавлении
+VACANCY_FIELDS = ('id', 'profession', 'salary', 'vacancy_url', 'description')
+
+
+def check_vacancy(vacancy) -> None:
+    """
+    Проверяет, что вакансия передана в формате хранилища и ее зарплату можно разобрать
+    (иначе сохраненная запись ломала бы сортировку и фильтры по зарплате).
+
+    :raises ValueError: неверный формат
+    """
+    if not isinstance(vacancy, dict) or any(field not in vacancy for field in VACANCY_FIELDS):
+        raise ValueError(f'Вакансия должна содержать поля: {", ".join(VACANCY_FIELDS)}')
+    if not isinstance(vacancy["id"], int) or isinstance(vacancy["id"], bool):
+        raise ValueError("ID Вакансии должен состоять из цифр")
+    if not isinstance(vacancy["profession"], str):
+        raise ValueError("Наименование вакансии должно быть строкой")
+
+    salary = vacancy["salary"]
+    if salary == "Не указана":
+        return
+    if not isinstance(salary, dict) or any(key not in salary for key in ('from', 'to', 'currency')):
+        raise ValueError('Зарплата должна быть "Не указана" или словарем с полями from, to, currency')
+    if not isinstance(salary["currency"], str):
+        raise ValueError("Валюта зарплаты должна быть строкой")
+    try:
+        parse_salary(salary)
+    except (TypeError, ValueError):
+        raise ValueError("Зарплата ОТ и ДО должны быть числами") from None
+
+
+class ReadWriteLock:
+    """
+    Блокировка "много читателей или один писатель". Ожидающий писатель не пропускает новых
+    читателей вперед, поэтому поток запросов на чтение не откладывает запись бесконечно.
+    """
+    __slots__ = ('__condition', '__readers', '__writer', '__waiting_writers')
+
+    def __init__(self):
+        self.__condition = threading.Condition()
+        self.__readers = 0
+        self.__writer = False
+        self.__waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self.__condition:
+            self.__condition.wait_for(lambda: not self.__writer and not self.__waiting_writers)
+            self.__readers += 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__readers -= 1
+                if not self.__readers:
+                    self.__condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self.__condition:
+            self.__waiting_writers += 1
+            self.__condition.wait_for(lambda: not self.__writer and not self.__readers)
+            self.__waiting_writers -= 1
+            self.__writer = True
+        try:
+            yield
+        finally:
+            with self.__condition:
+                if self.__writer:
+                    self.__writer = False
+                else:
+                    # блокировка была понижена до чтения (downgrade)
+                    self.__readers -= 1
+                self.__condition.notify_all()
+
+    def downgrade(self) -> None:
+        """
+        Понижает удерживаемую блокировку записи до чтения без промежутка, в который успел бы войти писатель.
+        Вызывается внутри write(); при выходе из него освобождается уже блокировка чтения.
+        """
+        with self.__condition:
+            self.__writer = False
+            self.__readers += 1
+            self.__condition.notify_all()
+
+
+class VacancyService:
+    """
+    Операции меню user_interaction над хранилищем, загруженным в память один раз (VacancyRepository).
+
+    Чтения выполняются параллельно, изменения - по одному под блокировкой записи; после изменения
+    индекс ID и сортировка по зарплате строятся заново сразу, а не первым запросом. Если файл изменил
+    другой процесс, он перечитывается под блокировкой записи при следующем запросе. Сами читатели
+    хранилище не перечитывают (refresh_on_read выключен), поэтому данные в памяти меняются только под
+    блокировкой записи.
+    """
+    __slots__ = ('repository', 'lock')
+
+    def __init__(self, json_file, batch_size: int = 1):
+        self.repository = VacancyRepository(json_file, batch_size, refresh_on_read=False)
+        self.lock = ReadWriteLock()
+        with self.lock.write():
+            self.repository.warm()
+
+    @contextmanager
+    def reading(self) -> Iterator[VacancyRepository]:
+        """Доступ к хранилищу для чтения (с перечитыванием файла, если его изменили)."""
+        if not self.repository.changed():
+            with self.lock.read():
+                yield self.repository
+            return
+        with self.lock.write():
+            # файл мог перечитать другой поток, пока этот ждал блокировку записи
+            if self.repository.changed():
+                self.repository.warm()
+            self.lock.downgrade()
+            yield self.repository
+
+    @contextmanager
+    def writing(self) -> Iterator[VacancyRepository]:
+        with self.lock.write():
+            yield self.repository
+            self.repository.warm()
+
+    def list_vacancies(self, offset: int = 0, limit: int = 20) -> dict:
+        with self.reading() as repository:
+            return {"total": len(repository), "items": repository.page(offset, limit)}
+
+    def get_vacancy(self, vacancy_id: int) -> dict | None:
+        with self.reading() as repository:
+            return repository.get(vacancy_id)
+
+    def top_vacancies(self, top_n: int, key: str = 'from') -> list:
+        with self.reading() as repository:
+            return repository.top_vacancies(top_n, key)
+
+    def salary_vacancies(self, key: str = 'from', salary_min: float | None = None, currency: str | None = None,
+                         offset: int = 0, limit: int = 20) -> dict:
+        """
+        Вакансии с указанной зарплатой по убыванию по ключу key (как пункт меню "сортировка по зарплате").
+
+        :param salary_min: только вакансии со значением зарплаты по ключу не меньше salary_min
+        :param currency: только вакансии с зарплатой в этой валюте
+        """
+        with self.reading() as repository:
+            vacancies = repository.salary_vacancies(key)
+            if salary_min is not None or currency:
+                selected = []
+                for vacancy in vacancies:
+                    # вакансии отсортированы по убыванию, без значения по ключу - в конце
+                    if salary_min is not None and (salary_value(vacancy, key) or 0) < salary_min:
+                        break
+                    if not currency or vacancy["salary"]["currency"].upper() == currency.upper():
+                        selected.append(vacancy)
+                vacancies = selected
+            return {"total": len(vacancies), "items": vacancies[offset:offset + limit]}
+
+    def search_vacancies(self, query: str, limit: int = 20) -> list:
+        """Поиск по ключевым словам через поисковый индекс файла (изменения записываются перед поиском)."""
+        with self.writing() as repository:
+            repository.flush()
+            return get_saver(repository.json_file).search_vacancies(repository.json_file, query, limit)
+
+    def add_vacancies(self, vacancies: list) -> int:
+        """
+        Добавляет вакансии. Сначала проверяется вся пачка: если хотя бы одна вакансия неверна,
+        не записывается ни одна.
+
+        :raises ValueError: неверная вакансия (в тексте ошибки - ее номер в пачке)
+        """
+        for number, vacancy in enumerate(vacancies, 1):
+            try:
+                check_vacancy(vacancy)
+            except ValueError as error:
+                raise ValueError(f'Вакансия {number}: {error}') from None
+        with self.writing() as repository:
+            repository.add(vacancies)
+        return len(vacancies)
+
+    def remove_vacancy(self, vacancy_id: int) -> bool:
+        with self.writing() as repository:
+            return repository.remove(vacancy_id)
+
+    def close(self) -> None:
+        with self.lock.write():
+            self.repository.flush()
+
+
+class VacancyRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP/JSON интерфейс VacancyService:
+        GET    /vacancies?offset=0&limit=20                   - список вакансий по страницам
+        GET    /vacancies/<id>                                - вакансия по ID
+        GET    /vacancies/top?n=10&key=from                   - топ N по зарплате
+        GET    /vacancies/salary?key=from&min=&currency=&offset=&limit= - вакансии с зарплатой по убыванию
+        GET    /search?q=python&limit=20                      - поиск по ключевым словам
+        POST   /vacancies                                     - добавить вакансию или список вакансий
+        DELETE /vacancies/<id>                                - удалить вакансию
+    """
+    server: 'VacancyServer'
+    protocol_version = 'HTTP/1.1'
+    # заголовки и тело ответа отправляются отдельно - без этого keep-alive ответы ждали бы подтверждения (Nagle)
+    disable_nagle_algorithm = True
+    routes = (
+        ('GET', re.compile(r'/vacancies/?'), 'list_vacancies'),
+        ('GET', re.compile(r'/vacancies/top'), 'top_vacancies'),
+        ('GET', re.compile(r'/vacancies/salary'), 'salary_vacancies'),
+        ('GET', re.compile(r'/vacancies/(\d+)'), 'get_vacancy'),
+        ('GET', re.compile(r'/search'), 'search_vacancies'),
+        ('POST', re.compile(r'/vacancies/?'), 'add_vacancies'),
+        ('DELETE', re.compile(r'/vacancies/(\d+)'), 'remove_vacancy'),
+    )
+
+    def do_GET(self):
+        self.__dispatch('GET')
+
+    def do_POST(self):
+        self.__dispatch('POST')
+
+    def do_DELETE(self):
+        self.__dispatch('DELETE')
+
+    def __dispatch(self, method: str) -> None:
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        for route_method, pattern, name in self.routes:
+            match = pattern.fullmatch(url.path)
+            if match and route_method == method:
+                try:
+                    with metrics.timer(f'server.{name}'):
+                        status, body = getattr(self, name)(params, *match.groups())
+                except (ValueError, KeyError, TypeError) as error:
+                    status, body = 400, {"error": str(error)}
+                self.__send(status, body)
+                return
+        self.__send(404, {"error": f'Неизвестный запрос: {method} {url.path}'})
+
+    def list_vacancies(self, params: dict) -> tuple[int, dict]:
+        return 200, self.server.service.list_vacancies(*self.__page(params))
+
+    def get_vacancy(self, params: dict, vacancy_id: str) -> tuple[int, dict]:
+        vacancy = self.server.service.get_vacancy(int(vacancy_id))
+        if vacancy is None:
+            return 404, {"error": "Такого ID нет в вакансиях"}
+        return 200, vacancy
+
+    def top_vacancies(self, params: dict) -> tuple[int, list]:
+        return 200, self.server.service.top_vacancies(int(params.get('n', 10)), self.__salary_key(params))
+
+    def salary_vacancies(self, params: dict) -> tuple[int, dict]:
+        salary_min = float(params['min']) if params.get('min') else None
+        return 200, self.server.service.salary_vacancies(self.__salary_key(params), salary_min,
+                                                         params.get('currency'), *self.__page(params))
+
+    def search_vacancies(self, params: dict) -> tuple[int, list]:
+        return 200, self.server.service.search_vacancies(params['q'], int(params.get('limit', 20)))
+
+    def add_vacancies(self, params: dict) -> tuple[int, dict]:
+        length = int(self.headers.get('Content-Length', 0))
+        vacancies = json.loads(self.rfile.read(length) or b'null')
+        if isinstance(vacancies, dict):
+            vacancies = [vacancies]
+        if not isinstance(vacancies, list):
+            raise ValueError('Ожидается вакансия или список вакансий в формате JSON')
+        return 201, {"added": self.server.service.add_vacancies(vacancies)}
+
+    def remove_vacancy(self, params: dict, vacancy_id: str) -> tuple[int, dict]:
+        if not self.server.service.remove_vacancy(int(vacancy_id)):
+            return 404, {"error": "Такого ID нет в вакансиях"}
+        return 200, {"removed": int(vacancy_id)}
+
+    @staticmethod
+    def __page(params: dict) -> tuple[int, int]:
+        offset, limit = int(params.get('offset', 0)), int(params.get('limit', 20))
+        if offset < 0 or limit < 0:
+            raise ValueError('offset и limit не могут быть отрицательными')
+        return offset, limit
+
+    @staticmethod
+    def __salary_key(params: dict) -> str:
+        key = params.get('key', 'from')
+        if key not in SALARY_KEYS:
+            raise ValueError(f'Неизвестный ключ зарплаты: {key} (возможные: {", ".join(SALARY_KEYS)})')
+        return key
+
+    def __send(self, status: int, body) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class VacancyServer(ThreadingHTTPServer):
+    """Локальный HTTP сервер запросов к хранилищу: каждый запрос обрабатывается в своем потоке."""
+    daemon_threads = True
+
+    def __init__(self, json_file, host: str = '127.0.0.1', port: int = 8080, batch_size: int = 1):
+        self.service = VacancyService(json_file, batch_size)
+        super().__init__((host, port), VacancyRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.service.close()
+
+
+def serve(json_file, host: str = '127.0.0.1', port: int = 8080, batch_size: int = 1) -> None:
+    """Запускает сервер и обрабатывает запросы до Ctrl+C; накопленные изменения записываются при остановке."""
+    with VacancyServer(json_file, host, port, batch_size) as server:
+        print(f'Сервер вакансий: http://{server.server_address[0]}:{server.server_address[1]} ({json_file})')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,144 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: межпроцессной блокировки нет, остается блокировка между потоками процесса
+    fcntl = None
+
+# захваченные процессом блокировки: путь к lock-файлу -> [файл, глубина вложенности]
+_held_locks = {}
+_thread_locks = {}
+_guard = threading.Lock()
+
+# права новых файлов по umask процесса (mkstemp создает временные файлы с правами 0600)
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+@contextmanager
+def file_lock(json_file) -> Iterator[None]:
+    """
+    Эксклюзивная рекомендательная (advisory) блокировка хранилища на время записи.
+
+    Блокируется отдельный файл '<хранилище>.lock': само хранилище при атомарной записи
+    подменяется новым файлом, и блокировка на нем потерялась бы. Блокировка повторно входимая
+    в пределах потока, поэтому методы хранилища могут вызывать друг друга под одной блокировкой.
+    Читателям блокировка не нужна - файл заменяется целиком через os.replace.
+    """
+    lock_path = os.path.abspath(json_file) + '.lock'
+    with _guard:
+        thread_lock = _thread_locks.setdefault(lock_path, threading.RLock())
+
+    with thread_lock:
+        held = _held_locks.get(lock_path)
+        if held is not None:
+            held[1] += 1
+        else:
+            lock_file = open(lock_path, 'a')
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            held = _held_locks[lock_path] = [lock_file, 1]
+        try:
+            yield
+        finally:
+            held[1] -= 1
+            if not held[1]:
+                del _held_locks[lock_path]
+                if fcntl is not None:
+                    fcntl.flock(held[0], fcntl.LOCK_UN)
+                held[0].close()
+
+
+@contextmanager
+def atomic_write(json_file, mode: str = 'w') -> Iterator:
+    """
+    Открывает временный файл рядом с json_file и после успешной записи атомарно подменяет им json_file.
+
+    При сбое посреди записи исходный файл остается нетронутым, временный файл удаляется.
+    """
+    directory = os.path.dirname(os.path.abspath(json_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(json_file) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(json_file):
+            # сохраняем права исходного файла
+            shutil.copymode(json_file, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o666 & ~_umask)
+        os.replace(tmp_path, json_file)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Сбрасывает на диск запись каталога, чтобы переименование пережило сбой питания."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class GroupCommitWriter:
+    """
+    Групповая запись страниц вакансий в хранилище.
+
+    Страницы копятся в буфере и записываются одним add_vacancies под одной блокировкой, когда
+    в буфере набирается batch_size вакансий или с прошлой записи прошло flush_interval секунд.
+    Так параллельные сборщики не ждут блокировку на каждой странице. Остаток записывается
+    при выходе из контекста.
+    """
+    __slots__ = ('saver', 'json_file', 'batch_size', 'flush_interval', 'written', '__pending', '__flushed_at',
+                 '__lock')
+
+    def __init__(self, saver, json_file, batch_size: int = 500, flush_interval: float = 5.0):
+        self.saver = saver
+        self.json_file = json_file
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.__pending = []
+        self.__flushed_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def add(self, vacancies: list) -> None:
+        with self.__lock:
+            self.__pending.extend(vacancies)
+            if (len(self.__pending) >= self.batch_size
+                    or time.monotonic() - self.__flushed_at >= self.flush_interval):
+                self.__flush()
+
+    def flush(self) -> None:
+        with self.__lock:
+            self.__flush()
+
+    def __flush(self) -> None:
+        pending, self.__pending = self.__pending, []
+        self.__flushed_at = time.monotonic()
+        if pending:
+            with file_lock(self.json_file):
+                self.saver.add_vacancies(self.json_file, pending)
+            self.written += len(pending)
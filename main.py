@@ -1,5 +1,7 @@
 import pprint
+import sys
 
+from config.cli import run_cli
 from config.functions import *
 
 
@@ -45,4 +47,8 @@ def add_vacancy_without_terminal():
 
 
 if __name__ == '__main__':
-    add_vacancy_without_terminal()
+    # с аргументами - неинтерактивные команды (например, batch), без аргументов - пример работы с вакансиями
+    if len(sys.argv) > 1:
+        run_cli(sys.argv[1:])
+    else:
+        add_vacancy_without_terminal()
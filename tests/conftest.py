@@ -0,0 +1,39 @@
+import pytest
+
+from config.classes import Saver, get_saver
+
+
+def build_vacancy(vacancy_id: int, salary: dict | str | None = None, **fields) -> dict:
+    """Вакансия в формате хранилища; зарплата по умолчанию - 100000-150000 RUB."""
+    vacancy = {"id": vacancy_id,
+               "profession": f"Python разработчик {vacancy_id}",
+               "salary": salary if salary is not None else {"from": 100000, "to": 150000, "currency": "RUB"},
+               "vacancy_url": f"https://hh.ru/vacancy/{vacancy_id}",
+               "description": "Опыт разработки на Python от 3 лет",
+               }
+    vacancy.update(fields)
+    return vacancy
+
+
+@pytest.fixture
+def make_vacancy():
+    return build_vacancy
+
+
+@pytest.fixture
+def new_store(tmp_path):
+    """Создает пустое хранилище формата по расширению и возвращает путь к нему."""
+    def create(extension: str = '.json') -> str:
+        json_file = str(tmp_path / f'vacancies{extension}')
+        get_saver(json_file).save_vacancies(json_file, [])
+        return json_file
+    return create
+
+
+@pytest.fixture(autouse=True)
+def search_index():
+    """Поисковый индекс по умолчанию включен; тесты, которым он нужен, включают его сами."""
+    enabled = Saver.search_index
+    Saver.search_index = False
+    yield
+    Saver.search_index = enabled
@@ -0,0 +1,22 @@
+import numpy as np
+
+from config.analytics import stats_by_currency, stats_by_keyword
+from config.classes import get_saver
+from config.columns import VacancyColumns
+
+
+def test_columns_from_store(new_store, make_vacancy):
+    json_file = new_store('.jsonl')
+    get_saver(json_file).add_vacancies(json_file, [
+        make_vacancy(10000001, salary={"from": "100000", "to": "200000", "currency": "RUB"}),
+        make_vacancy(10000002, salary={"from": None, "to": 3000, "currency": "usd"}, profession='Java разработчик'),
+        make_vacancy(10000003, salary="Не указана"),
+    ])
+
+    columns = VacancyColumns.from_store(json_file)
+    assert len(columns) == 3
+    assert columns.has_salary().tolist() == [True, True, False]
+    assert columns.currencies == ['RUB', 'USD']
+    np.testing.assert_array_equal(columns.salary_values('middle'), [150000, 3000, np.nan])
+    assert stats_by_currency(columns)['USD']['count'] == 1
+    assert stats_by_keyword(columns, ['java'], 'middle')['java']['mean'] == 3000
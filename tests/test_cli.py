@@ -0,0 +1,32 @@
+import pytest
+
+from config.cli import run_cli
+
+
+@pytest.mark.parametrize('ttl', ['hh=abc', 'hh', '=30', 'hh=-1', 'hh=nan'])
+def test_malformed_ttl_is_an_argument_error(capsys, ttl):
+    with pytest.raises(SystemExit) as error:
+        run_cli(['compact', '--ttl', ttl])
+    assert error.value.code == 2
+    assert 'argument --ttl' in capsys.readouterr().err
+
+
+def test_compact_with_ttl(new_store, capsys):
+    json_file = new_store('.jsonl')
+    run_cli(['compact', '--file', json_file, '--ttl', 'hh=30', '--ttl', '*=60'])
+    assert 'Вакансий после сжатия: 0' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('rate', ['hh', 'hh=', 'hh=abc', 'hh=0', 'hh=-2', 'xx=5'])
+def test_malformed_rate_is_an_argument_error(capsys, rate):
+    with pytest.raises(SystemExit) as error:
+        run_cli(['batch', 'queries.txt', '--rate', rate])
+    assert error.value.code == 2
+    assert 'argument --rate' in capsys.readouterr().err
+
+
+def test_rate_limits_are_passed_to_batch(monkeypatch):
+    calls = []
+    monkeypatch.setattr('config.cli.run_batch', lambda *args: calls.append(args))
+    run_cli(['batch', 'queries.txt', '--rate', 'hh=2.5', '--rate', 'sj=1'])
+    assert calls[0][4] == {'hh': 2.5, 'sj': 1.0}
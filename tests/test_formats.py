@@ -0,0 +1,41 @@
+import pytest
+
+from config.classes import get_saver
+from config.formats import FORMATS, ColumnarFormat, StoreFormat, get_format
+
+
+def test_formats_are_registered_by_extension():
+    assert get_format('vacancies.vcol') is ColumnarFormat
+    assert get_format('vacancies.json') is None
+    assert set(FORMATS) >= {'.json.gz', '.msgpack', '.vcol'}
+
+
+def test_store_format_is_abstract():
+    with pytest.raises(TypeError):
+        StoreFormat()
+
+
+@pytest.mark.parametrize('extension', ['.json.gz', '.msgpack', '.vcol'])
+def test_empty_store_queries(new_store, extension):
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+    assert saver.load_vacancies(json_file) == []
+    assert saver.find_vacancy(json_file, 10000001) is None
+    assert saver.top_vacancies(json_file, 10) == []
+    assert saver.salary_vacancies(json_file) == []
+
+
+@pytest.mark.parametrize('extension', ['.json.gz', '.msgpack', '.vcol'])
+def test_records_keep_their_own_fields(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+    # пользовательская вакансия без даты публикации, вакансия API - с датой или с явным null
+    vacancies = [make_vacancy(10000001),
+                 make_vacancy(10000002, published_at='2026-10-01T10:00:00+0300'),
+                 make_vacancy(10000003, salary="Не указана", published_at=None)]
+    saver.save_vacancies(json_file, vacancies)
+
+    assert saver.load_vacancies(json_file) == vacancies
+    assert saver.find_vacancy(json_file, 10000001) == vacancies[0]
+    assert saver.find_vacancies(json_file, [10000003, 10000002]) == [vacancies[2], vacancies[1]]
+    assert saver.merge_vacancies(json_file, vacancies) == (0, 0, 3)
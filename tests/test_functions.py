@@ -0,0 +1,40 @@
+import pytest
+
+from config.functions import print_pages
+
+
+def test_print_pages_reads_next_page_on_request(make_vacancy, monkeypatch, capsys):
+    answers = iter(['', '0'])
+    monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+    read = []
+
+    def vacancies():
+        for vacancy_id in range(10000001, 10000011):
+            read.append(vacancy_id)
+            yield make_vacancy(vacancy_id)
+
+    print_pages(vacancies(), page_size=3)
+    assert capsys.readouterr().out.count('ID вакансии:') == 6
+    # после отказа от следующей страницы генератор дальше не читается (кроме проверки, есть ли она)
+    assert len(read) == 7
+
+
+def test_print_pages_does_not_ask_after_last_page(make_vacancy, monkeypatch, capsys):
+    def no_input(prompt):
+        pytest.fail('запрос следующей страницы после последней')
+
+    monkeypatch.setattr('builtins.input', no_input)
+    print_pages([make_vacancy(10000001), make_vacancy(10000002)], page_size=2)
+    assert capsys.readouterr().out.count('ID вакансии:') == 2
+
+
+def test_print_pages_through_long_listing(make_vacancy, monkeypatch, capsys):
+    monkeypatch.setattr('builtins.input', lambda prompt: '')
+    print_pages((make_vacancy(10000001 + number) for number in range(3000)), page_size=1)
+    assert capsys.readouterr().out.count('ID вакансии:') == 3000
+
+
+def test_print_pages_empty_listing(monkeypatch, capsys):
+    monkeypatch.setattr('builtins.input', lambda prompt: pytest.fail('запрос страницы пустого списка'))
+    print_pages(iter([]))
+    assert capsys.readouterr().out == ''
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from config.classes import get_saver
+from config.importer import import_vacancies
+
+BAD_SALARIES = [
+    {"from": "abc", "to": 200000, "currency": "RUB"},
+    {"from": 200000, "to": 100000, "currency": "RUB"},
+    {"from": 100000, "to": 200000, "currency": "TOOLONG"},
+    {"from": 1500.5, "to": 2000, "currency": "USD"},
+    {"from": True, "to": 2000, "currency": "USD"},
+    {"from": "²", "to": 2000, "currency": "USD"},
+    "abc 200000 RUB",
+    "200000 100000 RUB",
+]
+
+
+def write_rows(path, rows: list) -> str:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+    return str(path)
+
+
+@pytest.mark.parametrize('extension', ['.json', '.jsonl', '.sqlite', '.vcol'])
+def test_bad_salaries_are_row_errors(tmp_path, new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    # пользовательские ссылки должны заканчиваться на .ru
+    rows = [make_vacancy(10000001, salary={"from": 100000, "to": 200000, "currency": "rub"},
+                         vacancy_url='https://hh.ru')]
+    rows += [make_vacancy(10000002 + number, salary=salary, vacancy_url='https://hh.ru')
+             for number, salary in enumerate(BAD_SALARIES)]
+    source_file = write_rows(tmp_path / 'import.jsonl', rows)
+
+    report = import_vacancies(source_file, json_file)
+    assert report["imported"] == 1
+    assert report["rejected"] == len(BAD_SALARIES)
+    assert [number for number, error in report["errors"]] == list(range(2, len(BAD_SALARIES) + 2))
+
+    saver = get_saver(json_file)
+    assert [vacancy["id"] for vacancy in saver.iter_vacancies(json_file)] == [10000001]
+    assert saver.find_vacancy(json_file, 10000001)["salary"]["currency"] == 'RUB'
+    # сохраненные вакансии не ломают ранжирование
+    assert [vacancy["id"] for vacancy in saver.top_vacancies(json_file, 10, 'normalized')] == [10000001]
+    assert len(saver.salary_vacancies(json_file, 'middle')) == 1
+
+
+def test_csv_import(tmp_path, new_store):
+    json_file = new_store('.sqlite')
+    source_file = tmp_path / 'import.csv'
+    source_file.write_text('id,profession,salary,vacancy_url,description\n'
+                           '10000001,Python разработчик,100000 150000 rub,https://hh.ru,Опыт разработки на Python\n'
+                           '10000002,Python разработчик,150000 100000 RUB,https://hh.ru,Опыт разработки на Python\n'
+                           'abc,Python разработчик,100000 150000 RUB,https://hh.ru,Опыт разработки на Python\n',
+                           encoding='utf-8')
+
+    report = import_vacancies(source_file, json_file)
+    assert (report["imported"], report["rejected"]) == (1, 2)
+    assert [number for number, error in report["errors"]] == [3, 4]
+    assert get_saver(json_file).find_vacancy(json_file, 10000001)["salary"] == {"from": 100000, "to": 150000,
+                                                                                "currency": 'RUB'}
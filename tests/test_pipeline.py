@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from config.metrics import metrics
+from config.pipeline import PagePipeline
+
+
+def parse(text: str) -> list:
+    """Разбор страницы в процессе пула (функция уровня модуля, чтобы ее можно было передать в процесс)."""
+    with metrics.timer('parse.json_loads'):
+        page = json.loads(text)
+    metrics.count('parse.vacancies', len(page))
+    return page
+
+
+@pytest.fixture
+def enabled_metrics():
+    enabled, stages, counters = metrics.enabled, metrics.stages, metrics.counters
+    metrics.reset()
+    metrics.enabled = True
+    yield metrics
+    metrics.enabled, metrics.stages, metrics.counters = enabled, stages, counters
+
+
+def test_worker_timers_are_merged_into_parent(enabled_metrics):
+    texts = [json.dumps([{"id": page * 10 + number} for number in range(3)]) for page in range(5)]
+    with PagePipeline(2) as pipeline:
+        pages = list(pipeline.run(iter(texts), parse))
+
+    assert pages == [json.loads(text) for text in texts]
+    calls, total, longest = enabled_metrics.stages['parse.json_loads']
+    assert calls == 5 and total >= longest > 0
+    assert enabled_metrics.counters['parse.vacancies'] == 15
+    assert enabled_metrics.counters['pipeline.pages_downloaded'] == 5
+
+
+def test_disabled_metrics_stay_empty():
+    enabled = metrics.enabled
+    metrics.enabled = False
+    try:
+        with PagePipeline(1) as pipeline:
+            assert list(pipeline.run(iter(['[1]', '[2]']), parse)) == [[1], [2]]
+        assert 'parse.json_loads' not in metrics.stages
+    finally:
+        metrics.enabled = enabled
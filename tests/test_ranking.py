@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from config.columns import VacancyColumns
+from config.ranking import SALARY_KEYS, filter_vacancies, sort_vacancies, top_vacancies
+from tests.conftest import build_vacancy
+
+
+def random_vacancies(count: int = 500, seed: int = 7) -> list:
+    """Вакансии с повторами зарплат, пустыми границами, валютами без курса и без зарплаты."""
+    rng = random.Random(seed)
+    professions = ['Python разработчик', 'Java программист', 'Тестировщик ПО', 'Аналитик данных']
+    vacancies = []
+    for vacancy_id in range(10000001, 10000001 + count):
+        if rng.random() < 0.2:
+            salary = "Не указана"
+        else:
+            salary_from = rng.choice([None, 0, 50000, 100000, 150000, rng.randrange(1000, 300000, 1000)])
+            salary_to = rng.choice([None, 200000, 250000, rng.randrange(1000, 400000, 1000)])
+            if salary_from and rng.random() < 0.2:
+                # пользовательские вакансии хранят зарплату строками
+                salary_from = str(salary_from)
+            salary = {"from": salary_from, "to": salary_to, "currency": rng.choice(['RUB', 'USD', 'KZT', 'XXX'])}
+        vacancy = build_vacancy(vacancy_id, salary=salary, profession=rng.choice(professions))
+        if rng.random() < 0.5:
+            vacancy["published_at"] = '2026-10-01T10:00:00+03:00'
+        vacancies.append(vacancy)
+    return vacancies
+
+
+def ids(vacancies) -> list:
+    return [vacancy["id"] for vacancy in vacancies]
+
+
+@pytest.mark.parametrize('key', list(SALARY_KEYS))
+@pytest.mark.parametrize('top_n', [1, 10, 150, 1000])
+def test_vectorized_top_matches_heap(key, top_n):
+    vacancies = random_vacancies()
+    # список ранжируется по колонкам, генератор - кучей по словарям
+    assert ids(top_vacancies(vacancies, top_n, key)) == ids(top_vacancies(iter(vacancies), top_n, key))
+
+
+@pytest.mark.parametrize('key', list(SALARY_KEYS))
+def test_vectorized_sort_matches_dict_sort(key):
+    vacancies = random_vacancies()
+    assert ids(sort_vacancies(vacancies, key)) == ids(sort_vacancies(iter(vacancies), key))
+
+
+@pytest.mark.parametrize('conditions', [{}, {"currency": 'usd'}, {"salary_from": 100000},
+                                        {"profession": 'ПРОГРАММИСТ'}, {"currency": 'RUB', "salary_from": 0},
+                                        {"currency": 'EUR'}, {"currency": 'kzt', "profession": 'python'}])
+def test_vectorized_filter_matches_dict_filter(conditions):
+    vacancies = random_vacancies()
+    assert ids(filter_vacancies(vacancies, **conditions)) == ids(filter_vacancies(iter(vacancies), **conditions))
+
+
+def test_results_are_the_original_vacancies():
+    vacancies = random_vacancies(50)
+    assert all(any(vacancy is original for original in vacancies) for vacancy in sort_vacancies(vacancies))
+
+
+def test_iter_dicts_converts_back_only_selected():
+    vacancies = random_vacancies(50)
+    columns = VacancyColumns.from_vacancies(vacancies)
+    indices = columns.top_n(5, 'normalized')
+    top = list(columns.iter_dicts(indices))
+    assert ids(top) == ids(top_vacancies(iter(vacancies), 5, 'normalized'))
+    for vacancy in top:
+        original = next(original for original in vacancies if original["id"] == vacancy["id"])
+        assert vacancy.get("published_at") == original.get("published_at")
+        assert vacancy["profession"] == original["profession"]
+    assert ids(columns.take(indices).iter_dicts()) == ids(top)
+
+
+def test_to_dict_keeps_fields():
+    vacancy = build_vacancy(10000001, salary={"from": "100000", "to": None, "currency": "rub"},
+                            published_at='2026-10-01T10:00:00+03:00')
+    columns = VacancyColumns.from_vacancies([vacancy, build_vacancy(10000002, salary="Не указана")])
+    assert columns.to_dict(0) == {**vacancy, "salary": {"from": 100000, "to": None, "currency": "RUB"}}
+    assert columns.to_dict(1) == build_vacancy(10000002, salary="Не указана")
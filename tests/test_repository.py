@@ -0,0 +1,55 @@
+import pytest
+
+from config.classes import SQLiteSaver, get_saver
+from config.repository import VacancyRepository
+
+STORES = ['.json', '.jsonl', '.sqlite', '.json.gz', '.vcol']
+
+
+def fill(repository: VacancyRepository, make_vacancy) -> None:
+    repository.add([make_vacancy(10000001, profession='Программист Python'),
+                    make_vacancy(10000002, salary={"from": 3000, "to": None, "currency": "USD"}),
+                    make_vacancy(10000003, salary="Не указана", profession='Тестировщик ПО')])
+
+
+@pytest.mark.parametrize('extension', STORES)
+@pytest.mark.parametrize('flush', [False, True])
+def test_filter_vacancies(new_store, make_vacancy, extension, flush):
+    repository = VacancyRepository(new_store(extension))
+    fill(repository, make_vacancy)
+    if flush:
+        repository.flush()
+
+    assert [vacancy["id"] for vacancy in repository.filter_vacancies(profession='программист')] == [10000001]
+    assert [vacancy["id"] for vacancy in repository.filter_vacancies(currency='usd')] == [10000002]
+    assert [vacancy["id"] for vacancy in repository.filter_vacancies(salary_from=50000)] == [10000001]
+    assert len(repository.filter_vacancies()) == 3
+
+
+def test_sqlite_queries_are_pushed_down(new_store, make_vacancy, monkeypatch):
+    json_file = new_store('.sqlite')
+    with VacancyRepository(json_file) as repository:
+        fill(repository, make_vacancy)
+
+    def load_vacancies(json_file):
+        raise AssertionError('хранилище не должно загружаться целиком')
+
+    monkeypatch.setattr(SQLiteSaver, 'load_vacancies', staticmethod(load_vacancies))
+    repository = VacancyRepository(json_file)
+    assert [vacancy["id"] for vacancy in repository.top_vacancies(1, 'normalized')] == [10000002]
+    assert [vacancy["id"] for vacancy in repository.salary_vacancies()] == [10000001, 10000002]
+    assert [vacancy["id"] for vacancy in repository.filter_vacancies(profession='тестировщик')] == [10000003]
+
+
+@pytest.mark.parametrize('extension', STORES)
+def test_duplicate_ids_resolve_to_last_copy(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    with VacancyRepository(json_file) as repository:
+        repository.add([make_vacancy(10000001, profession='Первая копия вакансии'), make_vacancy(10000002)])
+        repository.add([make_vacancy(10000001, profession='Последняя копия вакансии')])
+        assert repository.get(10000001)["profession"] == 'Последняя копия вакансии'
+        assert len(repository.filter_vacancies()) == 2
+
+    repository = VacancyRepository(json_file)
+    assert repository.get(10000001)["profession"] == 'Последняя копия вакансии'
+    assert repository.get(10000001) == get_saver(json_file).find_vacancy(json_file, 10000001)
@@ -0,0 +1,153 @@
+import json
+import os
+
+import pytest
+
+from config.classes import JSONLSaver, get_saver
+from config.retention import Tombstones
+
+STORES = ['.json', '.jsonl', '.sqlite', '.json.gz', '.msgpack', '.vcol']
+TOMBSTONE_STORES = ['.json', '.json.gz', '.msgpack', '.vcol']
+
+
+def ids(vacancies) -> list:
+    return [vacancy["id"] for vacancy in vacancies]
+
+
+@pytest.mark.parametrize('extension', STORES)
+def test_round_trip(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+
+    saver.add_vacancies(json_file, [make_vacancy(10000001), make_vacancy(10000002)])
+    saver.add_vacancies(json_file, [make_vacancy(10000003, salary="Не указана")])
+    assert ids(saver.iter_vacancies(json_file)) == [10000001, 10000002, 10000003]
+    assert saver.find_vacancy(json_file, 10000002) == make_vacancy(10000002)
+    assert saver.find_vacancy(json_file, 10000004) is None
+    assert ids(saver.find_vacancies(json_file, [10000003, 10000001, 10000004])) == [10000003, 10000001]
+
+    assert saver.remove_vacancy(json_file, 10000002)
+    assert saver.find_vacancy(json_file, 10000002) is None
+    assert ids(saver.load_vacancies(json_file)) == [10000001, 10000003]
+
+    changed = make_vacancy(10000001, description='Новое описание вакансии на Python')
+    assert saver.merge_vacancies(json_file, [changed, make_vacancy(10000003, salary="Не указана"),
+                                             make_vacancy(10000005)]) == (1, 1, 1)
+    assert saver.find_vacancy(json_file, 10000001) == changed
+
+    assert saver.compact(json_file) == 3
+    assert sorted(ids(saver.iter_vacancies(json_file))) == [10000001, 10000003, 10000005]
+    assert not os.path.exists(Tombstones.path(json_file))
+
+
+@pytest.mark.parametrize('extension', TOMBSTONE_STORES)
+def test_remove_writes_tombstone_and_readers_skip_it(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+    saver.save_vacancies(json_file, [make_vacancy(10000001), make_vacancy(10000002, salary="Не указана")])
+    size = os.path.getsize(json_file)
+
+    saver.remove_vacancy(json_file, 10000001)
+    assert os.path.getsize(json_file) == size
+    assert Tombstones.load(json_file) == {10000001}
+    assert ids(saver.iter_vacancies(json_file)) == [10000002]
+    assert saver.find_vacancies(json_file, [10000001, 10000002]) == [saver.find_vacancy(json_file, 10000002)]
+    assert saver.top_vacancies(json_file, 10) == []
+    assert saver.salary_vacancies(json_file) == []
+
+    # отметка неизвестного ID ничего не портит и убирается вместе с остальными
+    saver.remove_vacancy(json_file, 10000009)
+    saver.add_vacancies(json_file, [make_vacancy(10000003)])
+    assert not os.path.exists(Tombstones.path(json_file))
+    assert ids(saver.iter_vacancies(json_file)) == [10000002, 10000003]
+
+
+@pytest.mark.parametrize('extension', TOMBSTONE_STORES)
+def test_compact_keeps_latest_copy(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+    saver.save_vacancies(json_file, [make_vacancy(10000001, profession='Первая копия вакансии'),
+                                     make_vacancy(10000002),
+                                     make_vacancy(10000001, profession='Последняя копия вакансии')])
+
+    assert saver.compact(json_file) == 2
+    assert saver.load_vacancies(json_file) == [make_vacancy(10000002),
+                                               make_vacancy(10000001, profession='Последняя копия вакансии')]
+
+
+def test_jsonl_repeated_ids_keep_last_record(new_store, make_vacancy):
+    json_file = new_store('.jsonl')
+    JSONLSaver.add_vacancies(json_file, [make_vacancy(10000001), make_vacancy(10000002),
+                                         make_vacancy(10000001, profession='Вторая копия в той же странице')])
+    JSONLSaver.add_vacancies(json_file, [make_vacancy(10000002, profession='Повторно добавленная вакансия')])
+
+    assert JSONLSaver.load_vacancies(json_file) == [
+        make_vacancy(10000001, profession='Вторая копия в той же странице'),
+        make_vacancy(10000002, profession='Повторно добавленная вакансия')]
+    # прежние записи затерты на месте, а не удалены из файла
+    with open(json_file, 'rb') as f:
+        assert sum(1 for line in f if not line.strip()) == 1
+
+
+def test_jsonl_rebuild_index(new_store, make_vacancy):
+    json_file = new_store('.jsonl')
+    JSONLSaver.add_vacancies(json_file, [make_vacancy(10000001), make_vacancy(10000002)])
+    # копия вакансии, дописанная мимо индекса (например, другим инструментом)
+    with open(json_file, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(make_vacancy(10000001, profession='Дописанная копия вакансии'), ensure_ascii=False) + '\n')
+    JSONLSaver.rebuild_index(json_file)
+
+    assert JSONLSaver.find_vacancy(json_file, 10000001) == make_vacancy(10000001,
+                                                                       profession='Дописанная копия вакансии')
+    assert ids(JSONLSaver.iter_vacancies(json_file)) == [10000002, 10000001]
+    assert JSONLSaver.remove_vacancy(json_file, 10000001)
+    assert not JSONLSaver.remove_vacancy(json_file, 10000001)
+    assert JSONLSaver.compact(json_file) == 1
+    assert JSONLSaver.find_vacancy(json_file, 10000002) == make_vacancy(10000002)
+
+
+@pytest.mark.parametrize('content', ['', '  \n', '[{"id": 10000001}', '[{"id": 10000001},', '{"id": 10000001}',
+                                     '[{"id": 10000001}, {"id": 1000'])
+def test_json_reader_rejects_broken_store(new_store, content):
+    json_file = new_store('.json')
+    with open(json_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    # потоковое чтение не должно молча принимать то, что отверг бы json.load
+    with pytest.raises(json.JSONDecodeError):
+        list(get_saver(json_file).iter_vacancies(json_file, chunk_size=4))
+
+
+def test_json_reader_reads_small_chunks(new_store, make_vacancy):
+    json_file = new_store('.json')
+    get_saver(json_file).save_vacancies(json_file, [make_vacancy(10000001), make_vacancy(10000002)])
+    assert ids(get_saver(json_file).iter_vacancies(json_file, chunk_size=3)) == [10000001, 10000002]
+    assert list(get_saver(json_file).iter_vacancies(new_store('.json'))) == []
+
+
+@pytest.mark.parametrize('extension', STORES)
+def test_readding_vacancy_replaces_previous_copy(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+    saver.add_vacancies(json_file, [make_vacancy(10000001), make_vacancy(10000002)])
+    saver.add_vacancies(json_file, [make_vacancy(10000001, profession='Повторно добавленная вакансия')])
+
+    latest = make_vacancy(10000001, profession='Повторно добавленная вакансия')
+    assert saver.find_vacancy(json_file, 10000001) == latest
+    assert sorted(ids(saver.load_vacancies(json_file))) == [10000001, 10000002]
+
+
+@pytest.mark.parametrize('extension', TOMBSTONE_STORES)
+def test_duplicate_ids_resolve_to_last_copy(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+    # повторы ID в хранилище, записанном до замены прежних копий при добавлении
+    saver.save_vacancies(json_file, [make_vacancy(10000001, profession='Первая копия вакансии'),
+                                     make_vacancy(10000002),
+                                     make_vacancy(10000001, profession='Последняя копия вакансии')])
+
+    latest = make_vacancy(10000001, profession='Последняя копия вакансии')
+    assert saver.find_vacancy(json_file, 10000001) == latest
+    assert saver.find_vacancies(json_file, [10000001]) == [latest]
+    assert saver.merge_vacancies(json_file, [latest]) == (0, 0, 1)
+    saver.compact(json_file)
+    assert saver.find_vacancy(json_file, 10000001) == latest
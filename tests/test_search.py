@@ -0,0 +1,85 @@
+import pytest
+
+from config.classes import JSONSaver, Saver, get_saver
+from config.search import SearchIndex, tokenize
+
+
+def index_contents(json_file) -> tuple[list, list]:
+    with SearchIndex(json_file) as index:
+        postings = index.connection.execute('SELECT term, id, tf FROM postings ORDER BY term, id').fetchall()
+        documents = index.connection.execute('SELECT id, length, vacancy FROM documents ORDER BY id').fetchall()
+    return postings, documents
+
+
+def test_tokenize_stems_and_drops_stop_words():
+    assert tokenize('<b>Разработчик</b> на Python и Django') == ['разработчик', 'python', 'django']
+
+
+def test_sync_reindexes_only_changed_vacancies(tmp_path, make_vacancy):
+    json_file = str(tmp_path / 'vacancies.json')
+    vacancies = [make_vacancy(10000000 + number) for number in range(5)]
+    with SearchIndex(json_file) as index:
+        assert index.sync(vacancies) == (5, 0)
+        assert index.sync(vacancies) == (0, 0)
+
+        vacancies[1] = dict(vacancies[1], description='Опыт работы с Go и Kubernetes')
+        # изменение зарплаты не меняет индексируемый текст
+        vacancies[2] = dict(vacancies[2], salary="Не указана")
+        assert index.sync(vacancies[:4]) == (1, 1)
+        assert len(index) == 4
+
+
+def test_sync_accepts_repeated_ids(tmp_path, make_vacancy):
+    with SearchIndex(str(tmp_path / 'vacancies.json')) as index:
+        index.sync([make_vacancy(10000001), make_vacancy(10000001, description='Повтор вакансии про Go')])
+        assert [vacancy_id for vacancy_id, score in index.search('go')] == [10000001]
+
+
+@pytest.mark.parametrize('extension', ['.json', '.jsonl', '.sqlite', '.json.gz', '.vcol'])
+def test_incremental_index_matches_full_reindex(new_store, make_vacancy, extension):
+    Saver.search_index = True
+    json_file = new_store(extension)
+    saver = get_saver(json_file)
+    saver.add_vacancies(json_file, [make_vacancy(10000000 + number) for number in range(10)])
+    saver.merge_vacancies(json_file, [make_vacancy(10000003, description='Требуется знание Rust и C++'),
+                                      make_vacancy(10000020, profession='Аналитик данных SQL')])
+    saver.remove_vacancy(json_file, 10000005)
+    vacancies = saver.load_vacancies(json_file)
+    saver.save_vacancies(json_file, vacancies[:-1] + [dict(vacancies[-1], profession='Go разработчик')])
+
+    incremental = index_contents(json_file)
+    saver.reindex(json_file)
+    assert incremental == index_contents(json_file)
+    assert [vacancy["id"] for vacancy in saver.search_vacancies(json_file, 'rust')] == [10000003]
+    assert saver.search_vacancies(json_file, 'go') and not saver.search_vacancies(json_file, 'аналитик')
+
+
+def test_search_returns_vacancies_from_index(new_store, make_vacancy, monkeypatch):
+    Saver.search_index = True
+    json_file = new_store('.json')
+    vacancies = [make_vacancy(10000000 + number) for number in range(5)]
+    JSONSaver.save_vacancies(json_file, vacancies + [make_vacancy(10000010, profession='Go разработчик')])
+    # зарплата не входит в текст: вакансия не переиндексируется, но ее запись в индексе обновляется
+    JSONSaver.save_vacancies(json_file, vacancies + [make_vacancy(10000010, profession='Go разработчик',
+                                                                  salary="Не указана")])
+
+    def iter_vacancies(json_file):
+        raise AssertionError('поиск не должен читать хранилище')
+
+    monkeypatch.setattr(JSONSaver, 'iter_vacancies', staticmethod(iter_vacancies))
+    assert JSONSaver.search_vacancies(json_file, 'go') == [make_vacancy(10000010, profession='Go разработчик',
+                                                                        salary="Не указана")]
+
+
+def test_search_falls_back_to_store_for_old_index_rows(new_store, make_vacancy):
+    Saver.search_index = True
+    json_file = new_store('.json')
+    JSONSaver.save_vacancies(json_file, [make_vacancy(10000001, profession='Go разработчик')])
+    # индекс, записанный до появления в нем вакансий
+    with SearchIndex(json_file) as index:
+        index.connection.execute('UPDATE documents SET vacancy = NULL, record_digest = NULL')
+
+    assert JSONSaver.search_vacancies(json_file, 'go') == [make_vacancy(10000001, profession='Go разработчик')]
+    with SearchIndex(json_file) as index:
+        assert index.sync(JSONSaver.iter_vacancies(json_file)) == (0, 0)
+        assert index.vacancies([10000001]) == {10000001: make_vacancy(10000001, profession='Go разработчик')}
@@ -0,0 +1,136 @@
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from config.classes import get_saver
+from config.server import ReadWriteLock, VacancyServer, VacancyService, check_vacancy
+
+BAD_SALARIES = [
+    {"from": "abc", "to": None, "currency": "RUB"},
+    5,
+    {"from": 100000, "to": None},
+    {"from": 100000, "to": None, "currency": None},
+]
+
+
+@pytest.mark.parametrize('salary', BAD_SALARIES)
+def test_check_vacancy_rejects_unparsable_salary(make_vacancy, salary):
+    with pytest.raises(ValueError):
+        check_vacancy(make_vacancy(10000001, salary=salary))
+
+
+@pytest.mark.parametrize('salary', ["Не указана", {"from": "100000", "to": "150000", "currency": "RUB"},
+                                    {"from": None, "to": 2000, "currency": "USD"}])
+def test_check_vacancy_accepts_store_salaries(make_vacancy, salary):
+    check_vacancy(make_vacancy(10000001, salary=salary))
+
+
+@pytest.mark.parametrize('extension', ['.json', '.jsonl', '.sqlite'])
+def test_invalid_batch_is_not_written(new_store, make_vacancy, extension):
+    json_file = new_store(extension)
+    service = VacancyService(json_file)
+    service.add_vacancies([make_vacancy(10000001)])
+
+    batch = [make_vacancy(10000002), make_vacancy(10000003, salary={"from": "abc", "to": None, "currency": "RUB"})]
+    with pytest.raises(ValueError, match='Вакансия 2'):
+        service.add_vacancies(batch)
+
+    assert service.list_vacancies()["total"] == 1
+    assert [vacancy["id"] for vacancy in service.top_vacancies(10)] == [10000001]
+    assert [vacancy["id"] for vacancy in get_saver(json_file).load_vacancies(json_file)] == [10000001]
+    # после отклоненной пачки сервис продолжает принимать верные вакансии
+    assert service.add_vacancies([make_vacancy(10000004)]) == 1
+    service.close()
+
+
+def acquired(context, timeout: float = 0.2) -> bool:
+    """Удается ли другому потоку войти в context за timeout секунд."""
+    entered = threading.Event()
+    release = threading.Event()
+
+    def run():
+        with context():
+            entered.set()
+            release.wait()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    result = entered.wait(timeout)
+    # не вошедший поток войдет и сразу выйдет, когда блокировку освободят
+    release.set()
+    if result:
+        thread.join()
+    return result
+
+
+def test_downgraded_lock_admits_readers_but_not_writers():
+    lock = ReadWriteLock()
+    with lock.write():
+        assert not acquired(lock.read, timeout=0.05)
+        lock.downgrade()
+        assert acquired(lock.read)
+        assert not acquired(lock.write, timeout=0.05)
+    assert acquired(lock.write)
+
+
+@pytest.mark.parametrize('extension', ['.json', '.jsonl'])
+def test_changed_file_is_reloaded_only_under_write_lock(new_store, make_vacancy, monkeypatch, extension):
+    json_file = new_store(extension)
+    service = VacancyService(json_file)
+    service.add_vacancies([make_vacancy(10000001)])
+    # файл меняет другой процесс
+    get_saver(json_file).add_vacancies(json_file, [make_vacancy(10000002)])
+
+    saver = service.repository.saver
+    load_vacancies = saver.load_vacancies
+    readers_blocked = []
+
+    def checked_load(json_file):
+        readers_blocked.append(not acquired(service.lock.read, timeout=0.05))
+        return load_vacancies(json_file)
+
+    monkeypatch.setattr(saver, 'load_vacancies', staticmethod(checked_load))
+    # сам репозиторий сервиса при чтении файл не перечитывает
+    assert len(service.repository.page(0, 10)) == 1
+    assert readers_blocked == []
+
+    assert service.list_vacancies()["total"] == 2
+    assert readers_blocked == [True]
+    assert service.get_vacancy(10000002) == make_vacancy(10000002)
+    assert readers_blocked == [True]
+    service.close()
+
+
+@pytest.fixture
+def server(new_store):
+    server = VacancyServer(new_store('.jsonl'), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def request(url: str, method: str = 'GET', body=None) -> tuple[int, object]:
+    data = json.dumps(body).encode() if body is not None else None
+    try:
+        with urlopen(Request(url, data=data, method=method)) as response:
+            return response.status, json.load(response)
+    except HTTPError as error:
+        return error.code, json.load(error)
+
+
+def test_post_with_bad_salary_returns_400_and_keeps_service_working(server, make_vacancy):
+    assert request(f'{server}/vacancies', 'POST', make_vacancy(10000001)) == (201, {"added": 1})
+
+    status, body = request(f'{server}/vacancies', 'POST', make_vacancy(10000002, salary={"from": "abc", "to": None,
+                                                                                         "currency": "RUB"}))
+    assert status == 400 and 'error' in body
+
+    assert request(f'{server}/vacancies')[1]["total"] == 1
+    assert request(f'{server}/vacancies/top?n=5')[0] == 200
+    assert request(f'{server}/vacancies/salary?min=1')[0] == 200
+    assert request(f'{server}/vacancies', 'POST', make_vacancy(10000003)) == (201, {"added": 1})